@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    Micro- and macro-benchmarks of the propagation hot paths. Each case    ##
+##    reports its best time per call, its throughput, and its peak memory    ##
+##    (via tracemalloc). Sized cases are run over a range of sample counts,  ##
+##    giving scaling curves. Results are written to a JSON file, and can be  ##
+##    compared against a stored baseline, in which case any case slower      ##
+##    than the baseline by more than the tolerance fails the run. A missing  ##
+##    baseline also fails the run, unless a new one is being stored.        ##
+##                                                                           ##
+##    Usage (from the QLUSTER main directory):                               ##
+##                                                                           ##
+##    >> python benchmarks/hotpaths.py --save      (store a new baseline)    ##
+##    >> python benchmarks/hotpaths.py             (compare to baseline)     ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 19:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 19:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import numpy as np
+from os.path import dirname, abspath, join, exists
+
+# Make the local libraries importable when run as a script.
+sys.path.insert( 0, dirname(dirname(abspath(__file__))) )
+from source import anomaly
+from source import chunked
+from source import config
+from source import dcmrotx
+from source import dcmrotz
+from source import deputy
+from source import formation
+from source import posvel
+
+# Default path of the stored baseline.
+baseline_path = join( dirname(abspath(__file__)), 'baseline.json' )
+
+# Default configuration file used for the parsing benchmark.
+config_path = join( dirname(dirname(abspath(__file__))), 'config',
+                    'config.txt' )
+
+# Nominal scenario of the benchmarks (km and deg).
+chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+geometry = ( 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )
+
+###############################################################################
+###############################################################################
+
+def measure(function, repeat = 5):
+    '''Returns the best time per call (s) and the peak traced memory (bytes)
+    of a function that takes no arguments.'''
+
+    timer = timeit.Timer( function )
+    number, _ = timer.autorange()
+    best = min( timer.repeat( repeat = repeat, number = number ) ) / number
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+###############################################################################
+###############################################################################
+
+def parse_config(path):
+    '''Loads config.txt through config.load(), as RunGUI does, bypassing the
+    parse cache, so that the file is read and parsed every call.'''
+    return config.load( path, cache = False )
+
+###############################################################################
+###############################################################################
+
+def cases(sizes, loop_sizes):
+    '''Builds the benchmark cases, as a list of (name, n, units, function),
+    where n is the problem size and units the work items per call.'''
+
+    D = deputy.deputy( 86400, 1, *chief, *geometry )
+    elements = ( *chief, *D )
+    out = []
+
+    # Kepler solver across eccentricities (one solve per call).
+    for e in [ 0.0, 0.1, 0.5, 0.9 ]:
+        out.append( ( 'anomaly.M2E[e=' + str(e) + ']', 1, 1,
+                      lambda e = e : anomaly.M2E( 1.0, e ) ) )
+
+    # Inertial state and direction cosine matrices (one call each).
+    out.append( ( 'posvel.posvel', 1, 1,
+                  lambda : posvel.posvel( 6978.14, 0.01, 1.0, 1.5, 1.5, 1.0 ) ))
+    out.append( ( 'dcmrotx.dcmX', 1, 1, lambda : dcmrotx.dcmX( 0.5 ) ) )
+    out.append( ( 'dcmrotz.dcmZ', 1, 1, lambda : dcmrotz.dcmZ( 0.5 ) ) )
+    out.append( ( 'deputy.deputy', 1, 1,
+                  lambda : deputy.deputy( 86400, 1, *chief, *geometry ) ) )
+
+    # Relative orbit propagation, looped and vectorised (per sample).
+    for n in loop_sizes:
+        out.append( ( 'formation.propagate', n, n,
+                      lambda n = n : formation.propagate( n, 1, *elements ) ))
+    for n in sizes:
+        t = np.arange( n, dtype = float )
+        out.append( ( 'formation.states', n, n,
+                      lambda t = t : formation.states( t, 1, *elements ) ) )
+
+    # CSV export of the relative ephemeris by RunGUI.log() (per sample).
+    tmp = join( tempfile.gettempdir(), 'qluster_benchmark.csv' )
+    for n in loop_sizes:
+        rel = formation.states( np.arange( n, dtype = float ), 1, *elements )
+        out.append( ( 'RunGUI.log', n, n,
+                      lambda rel = rel : chunked.write_csv( tmp, 1, *rel ) ))
+
+    # Parsing of the configuration file, uncached and as loaded by RunGUI
+    # through the parse cache (one file per call).
+    out.append( ( 'config.parse', 1, 1,
+                  lambda : parse_config( config_path ) ) )
+    out.append( ( 'config.load', 1, 1,
+                  lambda : config.load( config_path ) ) )
+    
+    # Vectorised validation of many scenarios (per scenario).
+    for n in [ 10**2, 10**4 ]:
+        scenarios = { str(k) : parse_config( config_path )['default']
+                      for k in range( n ) }
+        out.append( ( 'config.validate', n, n,
+                      lambda s = scenarios : config.validate( s ) ) )
+
+    return out
+
+###############################################################################
+###############################################################################
+
+def run(sizes, loop_sizes, repeat = 5):
+    '''Runs all benchmark cases, and returns the results dictionary.'''
+
+    records = []
+    for name, n, units, function in cases( sizes, loop_sizes ):
+        best, peak = measure( function, repeat )
+        records.append( { 'name' : name, 'n' : n,
+                          'time_s' : best,
+                          'throughput_per_s' : units / best,
+                          'peak_bytes' : peak } )
+        print('{:28s} {:>10d} {:12.3e} s {:12.3e} /s {:10.1f} kB'.format(
+              name, n, best, units / best, peak / 1024 ))
+
+    return { 'benchmark' : 'hotpaths',
+             'date'      : time.strftime( '%Y-%m-%dT%H:%M:%S' ),
+             'python'    : platform.python_version(),
+             'numpy'     : np.__version__,
+             'machine'   : platform.machine(),
+             'results'   : records }
+
+###############################################################################
+###############################################################################
+
+def compare(results, baseline, tolerance):
+    '''Compares results against a baseline, returning a list of messages for
+    every case whose time per call regressed by more than the tolerance.'''
+
+    reference = { ( r['name'], r['n'] ) : r for r in baseline['results'] }
+    failures = []
+    for r in results['results']:
+        key = ( r['name'], r['n'] )
+        if key not in reference:
+            continue
+        ratio = r['time_s'] / reference[key]['time_s']
+        if ratio > 1.0 + tolerance:
+            failures.append( 'REGRESSION: {} (n={}) is {:.2f}x slower than '
+                             'the baseline!'.format( r['name'], r['n'], ratio ))
+    return failures
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser( description = 'QLUSTER hot path '
+                                      'micro- and macro-benchmarks.' )
+    parser.add_argument( '--output', default = 'hotpaths.json',
+                         help = 'Path of the JSON results file.' )
+    parser.add_argument( '--baseline', default = baseline_path,
+                         help = 'Path of the stored baseline JSON file.' )
+    parser.add_argument( '--save', action = 'store_true',
+                         help = 'Store the results as the new baseline.' )
+    parser.add_argument( '--tolerance', type = float, default = 0.25,
+                         help = 'Allowed slow-down before failing (0.25).' )
+    parser.add_argument( '--sizes', type = int, nargs = '+',
+                         default = [ 10**3, 10**4, 10**5, 10**6, 10**7 ],
+                         help = 'Sample counts of the vectorised cases.' )
+    parser.add_argument( '--loop-sizes', type = int, nargs = '+',
+                         default = [ 10**3, 10**4, 10**5 ],
+                         help = 'Sample counts of the looped cases.' )
+    parser.add_argument( '--repeat', type = int, default = 5,
+                         help = 'Number of timing repeats per case.' )
+    args = parser.parse_args()
+
+    results = run( args.sizes, args.loop_sizes, args.repeat )
+    with open( args.output, 'w' ) as fileout:
+        json.dump( results, fileout, indent = 2 )
+
+    if args.save:
+        with open( args.baseline, 'w' ) as fileout:
+            json.dump( results, fileout, indent = 2 )
+        print('Baseline saved to ' + args.baseline)
+
+    elif exists( args.baseline ):
+        with open( args.baseline, 'r' ) as filein:
+            failures = compare( results, json.load( filein ), args.tolerance )
+        for message in failures:
+            print( message )
+        if len( failures ) > 0:
+            sys.exit( 1 )
+        print('No regressions against ' + args.baseline)
+
+    else:
+        print('No baseline found at ' + args.baseline + ', use --save.')
+        sys.exit( 1 )
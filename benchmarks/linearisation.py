@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    Linearisation error budget of the relative orbit propagation. This     ##
+##    script sweeps the chief eccentricity, the formation amplitudes and     ##
+##    the scenario duration, and compares the linear relative states of      ##
+##    formation.py against the exact two-body reference of truth.py. The     ##
+##    errors and runtimes of every scenario are written to a JSON file, so   ##
+##    that accuracy and speed can be tracked together across releases.       ##
+##                                                                           ##
+##    Every scenario is also validated against an error budget, which grows  ##
+##    with the eccentricity and the separation (the terms neglected by the   ##
+##    linearisation). The script exits with status 1 if any scenario is      ##
+##    outside of its budget.                                                 ##
+##                                                                           ##
+##    Usage (from the QLUSTER main directory):                               ##
+##                                                                           ##
+##    >> python benchmarks/linearisation.py --output linearisation.json      ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 18:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 18:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import sys
+import json
+import time
+import argparse
+import itertools
+import platform
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from os.path import dirname, abspath
+
+# Make the local libraries importable when run as a script.
+sys.path.insert( 0, dirname(dirname(abspath(__file__))) )
+from source import deputy
+from source import formation
+from source import truth
+
+# Chief orbit of every scenario, except for the eccentricity (km and deg).
+chief = { 'a' : 6978.14, 'i' : 60.0, 'w' : 90.0, 'R' : 90.0, 'M' : 45.0 }
+
+# Default scenario grid: eccentricities, radial amplitudes (km), and number
+# of chief orbital periods. In-track and cross-track amplitudes are 2x radial.
+grid = { 'eC'      : [ 0.0, 0.001, 0.01, 0.05, 0.1, 0.2 ],
+         'fR'      : [ 0.1, 1.0, 10.0, 100.0 ],
+         'periods' : [ 1, 15, 105 ] }
+
+# Number of samples per scenario.
+samples = 2000
+
+# Error budget: maximum position error relative to the maximum separation,
+# as ( constant, per unit chief eccentricity, per km of radial amplitude ).
+budget = ( 1.0E-5, 0.75, 3.0E-4 )
+
+###############################################################################
+###############################################################################
+
+def tolerance(eC, fR):
+    '''Maximum relative position error of a scenario (see budget).'''
+    return budget[0] + ( budget[1] * eC ) + ( budget[2] * fR )
+
+def scenario(eC, fR, periods):
+    '''Runs one scenario, and returns its error and runtime record.'''
+
+    period = 2 * np.pi * np.sqrt( chief['a']**3 / 398600.44 )
+    td = int( periods * period )
+    ts = max( 1, td // samples )
+    C = ( chief['a'], eC, chief['i'], chief['w'], chief['R'], chief['M'] )
+    D = deputy.deputy( td, ts, *C, fR, 2 * fR, 0.0, 2 * fR, 90.0, 90.0 )
+    t = np.arange( 0, td, ts, dtype = float )
+
+    t0 = time.perf_counter()
+    L = np.array( formation.states( t, ts, *C, *D ) )
+    t1 = time.perf_counter()
+    T = np.array( truth.states( t, ts, *C, *D ) )
+    t2 = time.perf_counter()
+
+    perr = np.linalg.norm( L[:3] - T[:3], axis = 0 )
+    verr = np.linalg.norm( L[3:] - T[3:], axis = 0 )
+    rng  = np.linalg.norm( T[:3], axis = 0 )
+
+    return { 'eC' : eC, 'fR' : fR, 'periods' : periods,
+             'td' : td, 'ts' : ts, 'samples' : len(t),
+             'pos_err_max_km'  : float( np.max( perr ) ),
+             'pos_err_rms_km'  : float( np.sqrt( np.mean( perr**2 ) ) ),
+             'pos_err_rel'     : float( np.max( perr ) / np.max( rng ) ),
+             'pos_err_budget'  : tolerance( eC, fR ),
+             'passed'          : bool( np.max( perr ) / np.max( rng )
+                                       <= tolerance( eC, fR ) ),
+             'vel_err_max_kms' : float( np.max( verr ) ),
+             'linear_time_s'   : t1 - t0,
+             'truth_time_s'    : t2 - t1 }
+
+###############################################################################
+###############################################################################
+
+def run(workers = None):
+    '''Runs the whole scenario grid on a process pool.'''
+
+    cases = list( itertools.product( grid['eC'], grid['fR'],
+                                     grid['periods'] ) )
+    with ProcessPoolExecutor( max_workers = workers ) as pool:
+        records = list( pool.map( scenario, *zip( *cases ) ) )
+
+    return { 'benchmark' : 'linearisation',
+             'date'      : time.strftime( '%Y-%m-%dT%H:%M:%S' ),
+             'python'    : platform.python_version(),
+             'numpy'     : np.__version__,
+             'machine'   : platform.machine(),
+             'chief'     : chief,
+             'scenarios' : records }
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser( description = 'QLUSTER linearisation '
+                                      'error budget benchmark.' )
+    parser.add_argument( '--output', default = 'linearisation.json',
+                         help = 'Path of the JSON results file.' )
+    parser.add_argument( '--workers', type = int, default = None,
+                         help = 'Number of worker processes.' )
+    args = parser.parse_args()
+
+    results = run( args.workers )
+    with open( args.output, 'w' ) as fileout:
+        json.dump( results, fileout, indent = 2 )
+
+    # Print a short summary table of the worst relative position errors.
+    print('    eC        fR  periods  max pos err (km)  relative    budget')
+    for r in results['scenarios']:
+        print('{:6.3f} {:9.1f} {:8d} {:17.6f} {:9.2e} {:9.2e} {}'.format(
+              r['eC'], r['fR'], r['periods'], r['pos_err_max_km'],
+              r['pos_err_rel'], r['pos_err_budget'],
+              'ok' if r['passed'] else 'FAIL' ))
+    print('Results saved to ' + args.output)
+
+    # Fail the run if any scenario is outside of its error budget.
+    failures = [ r for r in results['scenarios'] if not r['passed'] ]
+    if len( failures ) > 0:
+        print( str( len( failures ) ) + ' scenarios outside of the error '
+               'budget!' )
+        sys.exit( 1 )
+    print('All scenarios within the error budget.')
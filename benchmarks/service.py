@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    Latency benchmark of the local propagation service. A service is       ##
+##    started in the background, and a number of concurrent clients (each    ##
+##    on its own thread and connection) send propagation requests of the     ##
+##    scenario in config.txt, with a different formation phase each. The    ##
+##    median and 95th percentile latencies per request, and the throughput,  ##
+##    are written to a JSON file for every level of concurrency.             ##
+##                                                                           ##
+##    Usage (from the QLUSTER main directory):                               ##
+##                                                                           ##
+##    >> python benchmarks/service.py --output service.json                  ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 20-Oct-2026 02:30 AM (+8 GMT)                            ##
+##    Last modified 20-Oct-2026 02:30 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import threading
+import numpy as np
+from os.path import dirname, abspath, join
+
+# Main directory of QLUSTER, for the source imports.
+root = dirname(dirname(abspath(__file__)))
+sys.path.insert( 0, root )
+
+from source import config
+from source import service
+
+###############################################################################
+###############################################################################
+
+def level(address, inputs, clients, requests):
+    '''Runs `clients` concurrent clients, each sending `requests` requests
+    one after the other, and returns the latencies (s) and the wall time.'''
+    latencies = []
+    def client(n):
+        with service.Client( address ) as c:
+            for k in range( requests ):
+                inps = dict( inputs )
+                inps['form_phi'] = float( ( n * requests + k ) % 360 - 180 )
+                t0 = time.perf_counter()
+                c.propagate( inps )
+                latencies.append( time.perf_counter() - t0 )
+    threads = [ threading.Thread( target = client, args = (n,) )
+                for n in range( clients ) ]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - t0
+
+def run(inputs, levels = (1, 4, 16, 64), requests = 20, workers = None):
+    '''Starts a service, and measures the latencies at every concurrency.'''
+    address = join( tempfile.mkdtemp(), 'qluster.sock' )
+    server = service.Server( address, workers = workers )
+    threading.Thread( target = server.run, daemon = True ).start()
+    while not os.path.exists( address ):
+        time.sleep( 0.01 )
+    level( address, inputs, 1, 5 ) # Warm up the worker processes.
+
+    records = []
+    for clients in levels:
+        latencies, wall = level( address, inputs, clients, requests )
+        records.append( { 'clients'     : clients,
+                          'requests'    : len( latencies ),
+                          'median_ms'   : 1e3 * np.median( latencies ),
+                          'p95_ms'      : 1e3 * np.percentile( latencies, 95 ),
+                          'per_second'  : len( latencies ) / wall } )
+    return { 'benchmark' : 'service',
+             'date'      : time.strftime( '%Y-%m-%dT%H:%M:%S' ),
+             'python'    : platform.python_version(),
+             'machine'   : platform.machine(),
+             'cpus'      : os.cpu_count(),
+             'samples'   : len( np.arange( 0, inputs['duration'],
+                                           inputs['timestep'] ) ),
+             'records'   : records }
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser( description = 'QLUSTER propagation '
+                                      'service benchmark.' )
+    parser.add_argument( '--output', default = 'service.json',
+                         help = 'Path of the JSON results file.' )
+    parser.add_argument( '--requests', type = int, default = 20,
+                         help = 'Number of requests per client.' )
+    parser.add_argument( '--workers', type = int, default = None,
+                         help = 'Number of service worker processes.' )
+    args = parser.parse_args()
+
+    inputs = config.load( join( root, 'config', 'config.txt' ) )
+    inputs = next( iter( inputs.values() ), {} )
+    valid, errors = config.validate( { 'config.txt' : inputs } )
+    if not valid[0]:
+        parser.error( ' '.join( errors['config.txt'] ) )
+    results = run( inputs, requests = args.requests, workers = args.workers )
+    with open( args.output, 'w' ) as fileout:
+        json.dump( results, fileout, indent = 2 )
+
+    for r in results['records']:
+        print('{:4d} clients  median {:8.3f} ms  p95 {:8.3f} ms  {:8.1f} /s'
+              .format( r['clients'], r['median_ms'], r['p95_ms'],
+                       r['per_second'] ))
+    print('Results saved to ' + args.output)
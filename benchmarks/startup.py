@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    Startup benchmark of the QLUSTER GUI. Every repeat measures, in a      ##
+##    fresh interpreter, the time to import the GUI module and the time to   ##
+##    import the plotting libraries (deferred to the background by the       ##
+##    GUI). When a display is available, another fresh interpreter measures  ##
+##    the time until the window is shown and the time until the figures      ##
+##    have been built, including the background import. The best of all      ##
+##    repeats is written to a JSON file.                                     ##
+##                                                                           ##
+##    Usage (from the QLUSTER main directory):                               ##
+##                                                                           ##
+##    >> python benchmarks/startup.py --output startup.json                  ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 23:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 23:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from os.path import dirname, abspath
+
+# Main directory of QLUSTER, from which the child interpreters import.
+root = dirname(dirname(abspath(__file__)))
+
+# Script of the import measurements, run in a fresh interpreter, printing JSON.
+imports = '''
+import sys, json, time
+t0 = time.perf_counter()
+sys.path.insert( 0, {root!r} )
+from source import rungui
+out = {{ 'import_s' : time.perf_counter() - t0 }}
+
+t1 = time.perf_counter()
+rungui._import_plotting()
+out['plotting_s'] = time.perf_counter() - t1
+print( json.dumps( out ) )
+'''
+
+# Script of the window measurements, run in another fresh interpreter so that
+# the plotting libraries are imported in the background, as in normal use.
+window = '''
+import sys, json, time
+sys.path.insert( 0, {root!r} )
+from source import rungui
+out = {{}}
+
+import tkinter
+try:
+    master = tkinter.Tk()
+except tkinter.TclError:
+    master = None
+if master is not None:
+    t2 = time.perf_counter()
+    gui = rungui.RunGUI( master )
+    master.update()
+    out['window_s'] = time.perf_counter() - t2
+    while gui.orbAxis is None:
+        master.update()
+        time.sleep( 0.001 )
+    master.update()
+    out['figures_s'] = time.perf_counter() - t2
+    master.destroy()
+print( json.dumps( out ) )
+'''
+
+###############################################################################
+###############################################################################
+
+def measure():
+    '''Runs one startup measurement, in two fresh interpreters.'''
+    out = {}
+    for child in ( imports, window ):
+        result = subprocess.run( [ sys.executable, '-c',
+                                   child.format( root = root ) ],
+                                 capture_output = True, text = True,
+                                 check = True )
+        out.update( json.loads( result.stdout.strip().splitlines()[-1] ) )
+    return out
+
+def run(repeat = 5):
+    '''Runs the startup measurements, and returns the best of each.'''
+    records = [ measure() for n in range( repeat ) ]
+    best = { key : min( r[key] for r in records ) for key in records[0] }
+    return { 'benchmark' : 'startup',
+             'date'      : time.strftime( '%Y-%m-%dT%H:%M:%S' ),
+             'python'    : platform.python_version(),
+             'machine'   : platform.machine(),
+             'repeat'    : repeat,
+             'best'      : best,
+             'records'   : records }
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser( description = 'QLUSTER GUI startup '
+                                      'benchmark.' )
+    parser.add_argument( '--output', default = 'startup.json',
+                         help = 'Path of the JSON results file.' )
+    parser.add_argument( '--repeat', type = int, default = 5,
+                         help = 'Number of fresh interpreters to time.' )
+    args = parser.parse_args()
+
+    results = run( args.repeat )
+    with open( args.output, 'w' ) as fileout:
+        json.dump( results, fileout, indent = 2 )
+
+    for key, value in results['best'].items():
+        print('{:12s} {:8.3f} s'.format( key, value ))
+    if 'window_s' not in results['best']:
+        print('No display available, only the imports were timed.')
+    print('Results saved to ' + args.output)
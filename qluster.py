@@ -22,12 +22,49 @@
 ###############################################################################
 
 # Import our GUI libraries.
+import argparse
 import tkinter
+from os.path import dirname, abspath, join
 
-# Import local libraries.
-from source import rungui
+# Parse the command line options.
+parser = argparse.ArgumentParser( description = 'QLUSTER formation design.' )
+parser.add_argument( '--watch', action = 'store_true',
+                     help = 'Re-run whenever config/config.txt changes.' )
+parser.add_argument( '--headless', action = 'store_true',
+                     help = 'With --watch, run without the GUI.' )
+parser.add_argument( '--serve', action = 'store_true',
+                     help = 'Run the local propagation service.' )
+parser.add_argument( '--address', default = None,
+                     help = 'With --serve, a Unix socket path or host:port.' )
+args = parser.parse_args()
+if args.headless and not args.watch:
+    parser.error( '--headless is only supported with --watch.' )
+if args.address is not None and not args.serve:
+    parser.error( '--address is only supported with --serve.' )
 
-# Initialise the GUI.
-root = tkinter.Tk()
-root_gui = rungui.RunGUI( root )
-root.mainloop()
\ No newline at end of file
+# Local propagation service, serving until interrupted.
+if args.serve:
+    from source import service
+    try:
+        service.Server( args.address or service.address ).run()
+    except ( ValueError, FileExistsError ) as excpt:
+        parser.error( str( excpt ) )
+
+# Headless watch mode, printing a summary after every change of config.txt.
+elif args.watch and args.headless:
+    from source import watch
+    config = join( dirname(abspath(__file__)), 'config', 'config.txt' )
+    try:
+        watch.run( config )
+    except KeyboardInterrupt:
+        pass
+
+# Otherwise, initialise the GUI.
+else:
+    from source import rungui
+    root = tkinter.Tk()
+    root_gui = rungui.RunGUI( root )
+    if args.watch:
+        root_gui.var_watch.set( True )
+        root_gui.watch_toggle()
+    root.mainloop()
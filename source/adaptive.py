@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the adaptive time sampling of the relative orbit.   ##
+##    Instead of the uniform time step of formation.propagate(), samples are ##
+##    placed where the relative motion curves: every interval is split in   ##
+##    half for as long as the midpoint deviates from the chord between its  ##
+##    end points by more than a tolerance. All intervals of one refinement   ##
+##    level are evaluated in a single vectorised call. The result is a set   ##
+##    of non-uniform time stamps, such that linear interpolation between     ##
+##    them reproduces the trajectory to within the tolerance.                ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 16:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 16:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from source import formation
+
+###############################################################################
+###############################################################################
+
+def sample(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+           tol = 0.01, max_step = None, min_step = None):
+    '''Adaptive sampling of the relative trajectory to a chord tolerance.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s). The samples span the same interval as the
+        uniform samples of formation.propagate(), i.e. [0, (N-1) * ts].
+    aC, eC, iC, wC, RC, MC : float
+        Chief Orbit Keplerian elements (km and deg)
+    aD, eD, iD, wD, RD, MD : float
+        Deputy Orbit Keplerian elements (km and deg)
+    tol : float, optional
+        Chord error tolerance on the relative position (km). Default 10 m.
+    max_step : float, optional
+        Initial (and largest) step (s). Default is 1/16 of the chief period.
+    min_step : float, optional
+        Smallest step (s), below which intervals are not split further. The
+        default is ts, so the result is never denser than the uniform grid.
+
+    Returns
+    -------
+    t : numpy.ndarray
+        Array of the non-uniform sample times (s)
+    rpx, rpy, rpz : numpy.ndarray
+        Arrays of sampled X, Y, Z Hill-Frame positions (km)
+    rvx, rvy, rvz : numpy.ndarray
+        Arrays of sampled X, Y, Z Hill-Frame velocities (km/s)
+
+    '''
+
+    elements = ( aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD )
+    tend = ( len( range( 0, td, ts ) ) - 1 ) * ts
+
+    if max_step is None:
+        max_step = np.pi * np.sqrt( aC**3 / 398600.44 ) / 8
+    if min_step is None:
+        min_step = ts
+
+    # Start with a coarse uniform grid of the largest step.
+    nodes = np.linspace( 0.0, tend, int( np.ceil( tend / max_step ) ) + 1 )
+    states = np.array( formation.states( nodes, ts, *elements ) )
+
+    # Intervals still to be tested, as (left, right) node times and states.
+    a, b = nodes[:-1], nodes[1:]
+    sa, sb = states[:, :-1], states[:, 1:]
+    times, found = [ nodes ], [ states ]
+
+    while len(a) > 0:
+
+        # Evaluate all midpoints of this level at once.
+        c = 0.5 * ( a + b )
+        sc = np.array( formation.states( c, ts, *elements ) )
+
+        # Chord error of the midpoint against the linear interpolant.
+        err = np.linalg.norm( sc[:3] - 0.5 * ( sa[:3] + sb[:3] ), axis = 0 )
+        split = ( err > tol ) & ( ( b - a ) > 2 * min_step )
+
+        # Keep the midpoints of split intervals, and recurse into both halves.
+        times.append( c[split] )
+        found.append( sc[:, split] )
+        a, b = np.concatenate( ( a[split], c[split] ) ), \
+               np.concatenate( ( c[split], b[split] ) )
+        sa = np.concatenate( ( sa[:, split], sc[:, split] ), axis = 1 )
+        sb = np.concatenate( ( sc[:, split], sb[:, split] ), axis = 1 )
+
+    # Sort all accepted samples in time.
+    t = np.concatenate( times )
+    states = np.concatenate( found, axis = 1 )
+    order = np.argsort( t )
+    rpx, rpy, rpz, rvx, rvy, rvz = states[:, order]
+
+    return t[order], rpx, rpy, rpz, rvx, rvy, rvz
@@ -16,50 +16,273 @@
 ##                                                                           ##
 ##    Written by Samuel Y. W. Low.                                           ##
 ##    First created 20-May-2021 10:17 PM (+8 GMT)                            ##
-##    Last modified 20-May-2021 10:17 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 10:00 AM (+8 GMT)                            ##
 ##                                                                           ##
 ###############################################################################
 ###############################################################################
 
+import warnings
+import functools
+import contextlib
 import numpy as np
+from source import instrument
 
 ###############################################################################
 ###############################################################################
 
-def M2E(M,e):
+def M2E(M,e,maxiter=100,E0=None):
     '''Mean anomaly to eccentric anomaly conversion via Keplers Equation (rad).
     
     Parameters
     ----------
-    M : float
+    M : float or numpy.ndarray
         Mean Anomaly (rad)
-    e : float
+    e : float or numpy.ndarray
         Eccentricity (unit-less)
+    maxiter : int, optional
+        Maximum number of Newton iterations (at least 1), guarding against
+        solves that do not converge. The default is 100.
+    E0 : float or numpy.ndarray, optional
+        Initial guess of the eccentric anomaly (rad), e.g. from extrapolate().
+        The default is None, which starts from the mean anomaly.
     
     Returns
     -------
-    E2 : float
-        Eccentric anomaly (rad)
+    E2 : float or numpy.ndarray
+        Eccentric anomaly (rad), broadcast to the shape of M and e.
     
     '''
     
-    E1 = M         # Initialise eccentric anomaly
+    if maxiter < 1:
+        raise ValueError('Kepler solver needs at least one iteration!')
+    
+    E1 = M if E0 is None else E0 # Initialise eccentric anomaly
     ei = e         # Initialise the float eccentricity
     residual = 1.0 # Initialise convergence residual
+    iters = 0      # Initialise the Newton iteration count
+    tol = 0.000001 # Convergence tolerance (rad)
     
-    while residual >= 0.000001:
+    # Per-solve iteration counts are only tracked inside diagnostics(), or
+    # when instrumented, so that each solve counts its own iterations.
+    track = len(_diagnostics) > 0 or instrument.enabled
+    if track:
+        pending = np.ones( np.broadcast(M, e).shape, dtype=bool )
+        counts  = np.zeros( np.broadcast(M, e).shape, dtype=int )
+    
+    while residual >= tol and iters < maxiter:
         
         fn = E1 - (ei*np.sin(E1)) - M
         fd = 1 - (ei*np.cos(E1))
         E2 = E1 - (fn/fd)
-        residual = abs(E2-E1) # Compute residual
+        step = np.abs(E2-E1)
+        residual = np.max(step, initial=0.0) # Worst-case residual
         E1 = E2 # Update the eccentric anomaly
+        iters += 1
         
+        if track:
+            counts  = counts + pending
+            pending = pending & ( step >= tol )
+    
+    # Record the number of solves and Newton iterations (if instrumented).
+    if instrument.enabled:
+        instrument.count('kepler.solves', np.size(E2))
+        instrument.count('kepler.iterations', int(np.sum(counts)))
+    
+    # Record the convergence diagnostics, or warn about non-convergence.
+    if len(_diagnostics) > 0:
+        for stats in _diagnostics:
+            stats.update( M, ei, E2, counts, pending )
+    elif residual >= tol:
+        warnings.warn('Kepler solver did not converge within ' +
+                      str(maxiter) + ' iterations!', RuntimeWarning)
+    
     return E2
 
 ###############################################################################
 ###############################################################################
 
+def extrapolate(E,e,dM):
+    '''Second-order Taylor extrapolation of the eccentric anomaly E (rad)
+    after the mean anomaly advances by dM (rad), e.g. dM = n * ts. Used as a
+    warm-start guess for M2E() in sequential propagations.
+    
+    Parameters
+    ----------
+    E : float or numpy.ndarray
+        Current eccentric anomaly (rad)
+    e : float or numpy.ndarray
+        Eccentricity (unit-less)
+    dM : float or numpy.ndarray
+        Advance in mean anomaly (rad)
+    
+    Returns
+    -------
+    E0 : float or numpy.ndarray
+        Extrapolated eccentric anomaly, wrapped to [-pi, pi) (rad)
+    
+    '''
+    
+    # From Keplers equation, dE/dM = 1/D and d2E/dM2 = -e*sin(E)/D**3.
+    D  = 1 - ( e * np.cos(E) )
+    E0 = E + ( dM / D ) - ( 0.5 * dM**2 * e * np.sin(E) / D**3 )
+    
+    return ( ( E0 + np.pi ) % ( 2 * np.pi ) ) - np.pi
+
+###############################################################################
+###############################################################################
+
+class KeplerTable():
+    
+    '''Precomputed inverse of Keplers equation for a fixed eccentricity. The
+    table is sampled uniformly in the eccentric anomaly, so it is densest in
+    mean anomaly where E(M) is steepest (near perigee). Queries are answered
+    by linear interpolation plus a fixed number of Newton corrections, with
+    no iterative solve. Use table() to share tables between runs.
+    
+    Attributes
+    ----------
+    e : float
+        Eccentricity of the table (unit-less)
+    corrections : int
+        Number of Newton corrections applied after each lookup
+    error : float
+        Maximum error of a query (rad), measured at construction at the table
+        mid-points, where the interpolation error is largest. It is below the
+        tolerance (1E-12 rad by default) unless 3 corrections do not suffice.
+    '''
+    
+    def __init__(self, e, size=4096, tol=1.0E-12):
+        
+        self.e = float(e)
+        self._E = np.linspace( -np.pi, np.pi, size )
+        self._M = E2M( self._E, self.e )
+        
+        # Measure the error at the mid-points of the table, and add Newton
+        # corrections until it satisfies the tolerance. This is far tighter
+        # than the tolerance of M2E(), since converged Newton solves are
+        # accurate to machine precision, and the relative orbit depends on
+        # small differences between the chief and deputy anomalies.
+        Emid = 0.5 * ( self._E[1:] + self._E[:-1] )
+        Mmid = E2M( Emid, self.e )
+        self.corrections = 0
+        while True:
+            self.error = float( np.max( np.abs( self.M2E(Mmid) - Emid ) ) )
+            if self.error < tol or self.corrections >= 3:
+                break
+            self.corrections += 1
+    
+    def M2E(self, M):
+        '''Mean anomaly to eccentric anomaly by table lookup (rad).'''
+        
+        # Wrap into the table range, keeping the number of revolutions.
+        Mw = ( ( M + np.pi ) % ( 2 * np.pi ) ) - np.pi
+        E  = np.interp( Mw, self._M, self._E )
+        
+        for k in range( self.corrections ):
+            E = E - ( E - ( self.e * np.sin(E) ) - Mw ) / \
+                    ( 1 - ( self.e * np.cos(E) ) )
+        
+        return E + ( M - Mw )
+
+@functools.lru_cache(maxsize=64)
+def _table(e, size):
+    return KeplerTable(e, size)
+
+def table(e, size=4096):
+    '''Returns a cached KeplerTable for the eccentricity e, so that runs and
+    swarm members sharing the same eccentricity build it only once.'''
+    return _table( float(e), int(size) )
+
+###############################################################################
+###############################################################################
+
+class KeplerStats():
+    
+    '''Convergence diagnostics of all Kepler solves made by M2E() inside a
+    diagnostics() context, such as one relative orbit propagation.
+    
+    Attributes
+    ----------
+    histogram : numpy.ndarray
+        Number of solves (value) that took each number of Newton iterations
+        (index) to converge
+    solves : int
+        Total number of Kepler solves
+    residual : float
+        Largest final residual |E - e*sin(E) - M| of all solves (rad)
+    failures : int
+        Number of solves that did not converge within maxiter iterations
+    samples : list
+        Up to 100 (M, e) inputs of the solves that did not converge
+    '''
+    
+    def __init__(self):
+        self.histogram = np.zeros( 1, dtype=int )
+        self.solves    = 0
+        self.residual  = 0.0
+        self.failures  = 0
+        self.samples   = []
+    
+    def update(self, M, e, E, counts, pending):
+        '''Ingests the results of one (possibly vectorised) call to M2E().'''
+        M, e = np.broadcast_arrays( M, e )
+        fn = np.abs( E - (e*np.sin(E)) - M )
+        hist = np.bincount( np.ravel(counts) )
+        if len(hist) > len(self.histogram):
+            hist[ :len(self.histogram) ] += self.histogram
+            self.histogram = hist
+        else:
+            self.histogram[ :len(hist) ] += hist
+        self.solves  += np.size(counts)
+        self.residual = max( self.residual, float(np.max(fn, initial=0.0)) )
+        self.failures += int( np.sum(pending) )
+        for Mf, ef in zip( M[pending], e[pending] ):
+            if len(self.samples) >= 100:
+                break
+            self.samples.append( ( float(Mf), float(ef) ) )
+    
+    def mean(self):
+        '''Mean number of Newton iterations per solve.'''
+        if self.solves == 0:
+            return 0.0
+        return np.dot( np.arange(len(self.histogram)), self.histogram ) / \
+               self.solves
+    
+    def summary(self):
+        '''Returns the iteration histogram and diagnostics as a string.'''
+        lines = [ 'Kepler solves: ' + str(self.solves) +
+                  ', mean iterations: ' + '{:.2f}'.format(self.mean()) +
+                  ', max residual: ' + '{:.3e}'.format(self.residual) +
+                  ', non-converged: ' + str(self.failures) ]
+        peak = max( 1, np.max(self.histogram) )
+        for n, c in enumerate(self.histogram):
+            if c > 0:
+                bar = '#' * int( np.ceil( 40 * c / peak ) )
+                lines.append( '{:4d} iters {:10d} {}'.format(n, c, bar) )
+        return '\n'.join(lines)
+
+# Stack of the active diagnostics contexts.
+_diagnostics = []
+
+@contextlib.contextmanager
+def diagnostics():
+    '''Context manager that collects the convergence diagnostics of every
+    Kepler solve made inside it. Example:
+    
+    >> with anomaly.diagnostics() as stats:
+    >>     formation.propagate( ... )
+    >> print( stats.summary() )
+    '''
+    stats = KeplerStats()
+    _diagnostics.append( stats )
+    try:
+        yield stats
+    finally:
+        _diagnostics.remove( stats )
+
+###############################################################################
+###############################################################################
+
 def M2V(M,e):
     '''Mean anomaly to true anomaly conversion via Keplers Equation (rad).
     
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the atomic file writer shared by the output and     ##
+##    config files. The contents are written to a temporary file in the      ##
+##    same directory, which replaces the target file in a single step only   ##
+##    once it is complete, and is deleted instead if the writing fails. The  ##
+##    replaced file keeps the permissions of the file it replaces (or the    ##
+##    umask default for a new file), and not the owner-only permissions of   ##
+##    the temporary file.                                                    ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 20-Oct-2026 03:00 AM (+8 GMT)                            ##
+##    Last modified 20-Oct-2026 03:00 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import os
+import stat
+import tempfile
+import contextlib
+
+###############################################################################
+###############################################################################
+
+def permissions(path):
+    '''Permission bits for a file written to path: those of the existing
+    file, or the default of a new file under the current umask.'''
+    try:
+        return stat.S_IMODE( os.stat( path ).st_mode )
+    except FileNotFoundError:
+        umask = os.umask( 0 )
+        os.umask( umask )
+        return 0o666 & ~umask
+
+@contextlib.contextmanager
+def writer(path, mode = 'w', prefix = '.tmp.', suffix = ''):
+    '''Context manager yielding a file object opened with `mode` on a
+    temporary file next to path, which replaces path on a clean exit, or is
+    deleted if the block raises.
+
+    Parameters
+    ----------
+    path : str
+        Path of the output file (over-written if it exists)
+    mode : str, optional
+        File mode, 'w' for text or 'wb' for binary. The default is 'w'.
+    prefix, suffix : str, optional
+        Prefix and suffix of the temporary file name.
+
+    Yields
+    ------
+    fileout : file object
+        Open temporary file, to be written by the caller.
+
+    '''
+
+    folder = os.path.dirname( os.path.abspath( path ) )
+    handle, temp = tempfile.mkstemp( dir = folder, prefix = prefix,
+                                     suffix = suffix )
+    try:
+        with os.fdopen( handle, mode ) as fileout:
+            yield fileout
+            fileout.flush()
+            os.fsync( fileout.fileno() )
+        os.chmod( temp, permissions( path ) )
+        os.replace( temp, path )
+    except BaseException:
+        os.unlink( temp )
+        raise
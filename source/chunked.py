@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the out-of-core relative orbit propagation. The     ##
+##    scenario is propagated in fixed windows of samples, and each window    ##
+##    is appended straight into a binary NumPy (.npy) file on disk by a      ##
+##    writer thread, so that I/O overlaps with the computation of the next   ##
+##    window and memory stays flat regardless of the scenario duration.      ##
+##    The output file can be re-opened as a memory-map with load(). An       ##
+##    ephemeris held in memory is exported as CSV text with write_csv(),     ##
+##    which is also used by RunGUI.log().                                    ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 10:00 AM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 10:00 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import queue
+import threading
+import numpy as np
+from source import atomic
+from source import formation
+from source import instrument
+
+# Column layout of each record written to disk.
+columns = ['Time', 'Radial_(km)', 'InTrack_(km)', 'CrossTrack_(km)',
+           'Radial_Rate_(km/s)', 'InTrack_Rate_(km/s)',
+           'CrossTrack_Rate_(km/s)']
+
+###############################################################################
+###############################################################################
+
+def windows(td, ts, chunk):
+    '''Generator of sample time windows covering the scenario, where each
+    window holds at most `chunk` samples, and sample k is at time k * ts.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    chunk : int
+        Maximum number of samples per window
+
+    Yields
+    ------
+    t : numpy.ndarray
+        Array of sample times in the current window (s)
+
+    '''
+
+    nsamples = len( range( 0, td, ts ) )
+    for k0 in range( 0, nsamples, chunk ):
+        k1 = min( k0 + chunk, nsamples )
+        yield np.arange( k0, k1, dtype = float ) * ts
+
+###############################################################################
+###############################################################################
+
+def propagate(filename, td, ts, aC, eC, iC, wC, RC, MC,
+              aD, eD, iD, wD, RD, MD, chunk = 100000, reducers = None):
+    '''Propagates the relative orbit window by window, and appends every
+    window to a binary .npy file of shape Nx7, with columns given by the
+    module-level list `columns`. The samples are identical to those returned
+    by formation.propagate(), but are never held in memory all at once.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output .npy file (over-written if it exists)
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    aC, eC, iC, wC, RC, MC : float
+        Chief Orbit Keplerian elements (km and deg)
+    aD, eD, iD, wD, RD, MD : float
+        Deputy Orbit Keplerian elements (km and deg)
+    chunk : int, optional
+        Number of samples per window. The default is 100000 (~5.6 MB).
+    reducers : list, optional
+        Streaming reducers (see reducers.py) that are fed every window as it
+        is computed, so that statistics come for free with the ephemeris.
+
+    Returns
+    -------
+    nsamples : int
+        Total number of samples written to disk.
+
+    '''
+
+    nsamples = len( range( 0, td, ts ) )
+
+    # Bounded queue: the propagation may run at most two windows ahead of
+    # the writer, which keeps the memory footprint flat.
+    buffer = queue.Queue( maxsize = 2 )
+    errors = []
+
+    # The writer thread consumes windows until it receives a None sentinel.
+    def writer(fileout):
+        try:
+            while True:
+                block = buffer.get()
+                if block is None:
+                    break
+                with instrument.span('chunked.write'):
+                    fileout.write( block.tobytes() )
+        except Exception as excpt:
+            errors.append( excpt )
+            while buffer.get() is not None:
+                pass # Drain the queue so that the producer never blocks.
+
+    # Write to a temporary file next to the output, which replaces the output
+    # only once every sample has been written, so that a failed propagation
+    # never leaves a truncated file behind its full-length .npy header.
+    with atomic.writer( filename, 'wb', prefix = '.chunked.',
+                        suffix = '.npy' ) as fileout:
+
+        # Write the .npy header first, so that the file can be memory-mapped.
+        header = { 'descr' : np.lib.format.dtype_to_descr( np.dtype(float) ),
+                   'fortran_order' : False,
+                   'shape' : ( nsamples, len(columns) ) }
+        np.lib.format.write_array_header_1_0( fileout, header )
+
+        thread = threading.Thread( target = writer, args = (fileout,) )
+        thread.start()
+
+        try:
+            for t in windows( td, ts, chunk ):
+                if len(errors) > 0:
+                    break
+                with instrument.span('chunked.compute'):
+                    relative = formation.states( t, ts, aC, eC, iC, wC, RC,
+                                                 MC, aD, eD, iD, wD, RD, MD )
+                for reducer in ( reducers or [] ):
+                    reducer.update( *relative )
+                block = np.empty( ( len(t), len(columns) ) )
+                block[:,0] = t
+                block[:,1:] = np.column_stack( relative )
+                buffer.put( block )
+        finally:
+            buffer.put( None )
+            thread.join()
+
+        # Re-raise any exception that was encountered by the writer thread.
+        if len(errors) > 0:
+            raise errors[0]
+
+    return nsamples
+
+###############################################################################
+###############################################################################
+
+def load(filename):
+    '''Opens a relative ephemeris file written by propagate() as a read-only
+    memory-map, without reading it into memory.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .npy file
+
+    Returns
+    -------
+    ephemeris : numpy.memmap
+        Nx7 read-only memory-mapped array of time and relative states
+
+    '''
+
+    return np.load( filename, mmap_mode = 'r' )
+
+###############################################################################
+###############################################################################
+
+def write_csv(filename, ts, rpx, rpy, rpz, rvx, rvy, rvz):
+    '''Writes a relative ephemeris held in memory to a CSV file, with the
+    same columns as `columns` and six decimal places, as RunGUI.log().
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output .csv file (over-written if it exists)
+    ts : int
+        Propagation Timestep (s), where sample k is at time k * ts
+    rpx, rpy, rpz, rvx, rvy, rvz : numpy.ndarray
+        Arrays of the Hill-frame relative positions (km) and velocities (km/s)
+
+    '''
+
+    with open( filename, 'w' ) as fileout:
+        fileout.write( ', '.join( columns ) + ' \n' )
+        with instrument.span('chunked.csv'):
+            for k in range( 0, len(rpx) ):
+                fileout.write( str( k * ts ) + ', ' )
+                fileout.write( '{:.6f}'.format(rpx[k]) + ', ' )
+                fileout.write( '{:.6f}'.format(rpy[k]) + ', ' )
+                fileout.write( '{:.6f}'.format(rpz[k]) + ', ' )
+                fileout.write( '{:.6f}'.format(rvx[k]) + ', ' )
+                fileout.write( '{:.6f}'.format(rvy[k]) + ', ' )
+                fileout.write( '{:.6f}'.format(rvz[k]) + '\n' )
+    return None
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the configuration layer. A config file holds one    ##
+##    or more named scenarios: lines starting with 'S:' open a scenario of   ##
+##    the given name, lines starting with 'I:' hold an input key and value,  ##
+##    and all other lines are comments. Inputs before the first 'S:' line    ##
+##    belong to the scenario 'default', so the original single-scenario      ##
+##    config.txt is a valid config file. A directory of config files can     ##
+##    also be loaded at once.                                                ##
+##                                                                           ##
+##    Parsed files are cached, keyed on their modification time and size,    ##
+##    so repeated loads of unchanged files cost one os.stat() each. All      ##
+##    scenarios are validated together: their inputs are stacked into one    ##
+##    array per key, and every rule (also used by the GUI, via check()) is   ##
+##    evaluated once over all scenarios. Files are written atomically,       ##
+##    through a temporary file that replaces the original in a single step.  ##
+##                                                                           ##
+##    Example:                                                               ##
+##                                                                           ##
+##    S: low_drift                                                           ##
+##    I: duration 86400                                                      ##
+##    I: timestep 10                                                         ##
+##    ...                                                                    ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 20-Oct-2026 00:30 AM (+8 GMT)                            ##
+##    Last modified 20-Oct-2026 00:30 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import os
+import threading
+import numpy as np
+from source import atomic
+
+# Keys of the inputs of a scenario, in the order of the deputy.deputy() inputs.
+keys = ['duration', 'timestep',
+        'orb_a',  'orb_e',  'orb_i',  'orb_w',  'orb_R',  'orb_M',
+        'form_R', 'form_I', 'form_O', 'form_C', 'form_phi', 'form_tht']
+
+# Inputs that are parsed as integers (all others are floats).
+integers = ['duration', 'timestep']
+
+# Name of the scenario holding the inputs before the first 'S:' line.
+default = 'default'
+
+# Parsed files, keyed on path: ( mtime_ns, size, scenarios ).
+_cache = {}
+_lock = threading.Lock()
+
+###############################################################################
+###############################################################################
+
+def parse(text):
+    '''Parses the text of a config file into a dictionary of scenarios (in
+    file order), each a dictionary of inputs. Values that are not numbers
+    (or not integers, for the keys in `integers`) are parsed as NaN, so that
+    they are reported by validate() along with all other errors.'''
+
+    scenarios = {}
+    current = None
+    for line in text.splitlines():
+        if line[:2] == 'S:':
+            current = scenarios.setdefault( line[2:].strip(), {} )
+        elif line[:1] == 'I':
+            words = line[3:].split()
+            if len( words ) < 2:
+                continue
+            if current is None:
+                current = scenarios.setdefault( default, {} )
+            try:
+                if words[0] in integers:
+                    current[ words[0] ] = int( words[1] )
+                elif words[0] in keys:
+                    current[ words[0] ] = float( words[1] )
+                else:
+                    current[ words[0] ] = words[1]
+            except ValueError:
+                current[ words[0] ] = np.nan
+    return scenarios
+
+def load(path, cache = True):
+    '''Loads the scenarios of a config file, or of all *.txt files in a
+    directory, whose scenarios are then named 'file/scenario' (or 'file' for
+    the default scenario). Unchanged files are served from the parse cache,
+    so the returned dictionaries are shared: copy them before editing. With
+    cache False, the files are always read and parsed, and the cache is
+    neither used nor updated.'''
+
+    if os.path.isdir( path ):
+        scenarios = {}
+        for name in sorted( os.listdir( path ) ):
+            if not name.endswith('.txt'):
+                continue
+            stem = name[:-4]
+            for key, inps in load( os.path.join( path, name ),
+                                   cache ).items():
+                label = stem if key == default else stem + '/' + key
+                scenarios[ label ] = inps
+        return scenarios
+
+    if not cache:
+        with open( path, 'r' ) as filein:
+            return parse( filein.read() )
+    stat = os.stat( path )
+    with _lock:
+        cached = _cache.get( path )
+    signature = ( stat.st_mtime_ns, stat.st_size )
+    if cached is not None and cached[:2] == signature:
+        return cached[2]
+    with open( path, 'r' ) as filein:
+        scenarios = parse( filein.read() )
+    with _lock:
+        _cache[ path ] = signature + ( scenarios, )
+    return scenarios
+
+###############################################################################
+###############################################################################
+
+def table(scenarios):
+    '''Stacks the inputs of many scenarios into one float array per key (in
+    the order of the scenarios). Missing inputs are NaN.'''
+    return { key : np.array( [ float( s.get( key, np.nan ) )
+                               for s in scenarios.values() ], dtype = float )
+             for key in keys }
+
+def _rules(x):
+    '''All validation rules, evaluated over the inputs x stacked by table().
+    Returns a list of ( keys, failures, message ), where keys are the inputs
+    the rule concerns, and failures a boolean array over the scenarios.'''
+
+    angle = lambda k : ( x[k] < -180.0 ) | ( x[k] > 180.0 )
+    rules = [
+        ( ['duration'], x['duration'] <= 0,
+          'Scenario duration cannot be zero or negative!' ),
+        ( ['duration'], x['duration'] > 31536000,
+          'Scenario duration cannot be longer than a year!' ),
+        ( ['timestep'], x['timestep'] <= 0,
+          'Scenario step size cannot be zero or negative!' ),
+        ( ['timestep'], x['timestep'] > x['duration'],
+          'Scenario step cannot be larger than the duration!' ),
+        ( ['orb_a'], x['orb_a'] < 6378.14,
+          'Semi-major axis below Earth surface!' ),
+        ( ['orb_a'], x['orb_a'] > 385000.0,
+          'Semi-major axis beyond Earth orbit!' ),
+        ( ['orb_e'], x['orb_e'] < 0,
+          'Eccentricity cannot be < 0!' ),
+        ( ['orb_e'], x['orb_e'] >= 1.0,
+          'Eccentricity cannot be >= 1!' ),
+        ( ['orb_e'], ( 1 - x['orb_e'] ) * x['orb_a'] < 6378.14,
+          'Perigee altitude below Earth surface!' ),
+        ( ['orb_i'], angle('orb_i'),
+          'Inclination angle must be between +/- 180!' ),
+        ( ['orb_w'], angle('orb_w'),
+          'Argument of Perigee must be between +/- 180!' ),
+        ( ['orb_R'], angle('orb_R'),
+          'Right ascension must be between +/- 180!' ),
+        ( ['orb_M'], angle('orb_M'),
+          'Mean anomaly must be between +/- 180!' ),
+        ( ['form_R'], x['form_R'] < 0,
+          'Radial separation cannot be negative!' ),
+        ( ['form_R'], x['form_R'] > 1000.0,
+          'Radial separation cannot exceed 1000 km!' ),
+        ( ['form_R', 'form_I'], np.abs( x['form_R'] * 2 - x['form_I'] ) > 0,
+          'Radial separation must be half of in-track!' ),
+        ( ['form_I'], x['form_I'] < 0,
+          'In-track separation cannot be negative!' ),
+        ( ['form_I'], x['form_I'] > 2000.0,
+          'In-track separation cannot exceed 2000 km!' ),
+        ( ['form_O'], x['form_O'] < -1000.0,
+          'In-track offset cannot be < -1000 km!' ),
+        ( ['form_O'], x['form_O'] > 1000.0,
+          'In-track offset cannot be > 1000 km!' ),
+        ( ['form_C'], x['form_C'] < 0,
+          'Cross-track separation cannot be negative!' ),
+        ( ['form_C'], x['form_C'] > 2000.0,
+          'Cross-track separation cannot exceed 2000 km!' ),
+        ( ['form_phi'], angle('form_phi'),
+          'Relative Pericenter must be between +/- 180!' ),
+        ( ['form_tht'], angle('form_tht'),
+          'Latitude Crossing must be between +/- 180!' ) ]
+
+    # Comparisons with NaN are False, so the NaN rules below catch those.
+    for key in keys:
+        rules.append( ( [key], np.isnan( x[key] ),
+                        'Missing or invalid ' + key + '!' ) )
+    return rules
+
+def validate(scenarios):
+    '''Validates all scenarios together. The inputs are stacked per key by
+    table(), and each rule is then one array operation over all scenarios.
+    Returns a boolean array of valid scenarios, and a dictionary of the error
+    messages of every invalid scenario.'''
+
+    names = list( scenarios.keys() )
+    rules = _rules( table( scenarios ) )
+    fails = np.array( [ rule for k, rule, message in rules ] ).reshape(
+                      len(rules), len(names) )
+    valid = ~np.any( fails, axis = 0 )
+    errors = {}
+    for n in np.flatnonzero( ~valid ):
+        errors[ names[n] ] = [ rules[r][2]
+                               for r in np.flatnonzero( fails[:,n] ) ]
+    return valid, errors
+
+def check(inputs):
+    '''Validates the inputs of one scenario, e.g. those entered in the GUI,
+    with the same rules as validate(). Returns the broken rules as a list of
+    ( keys, message ), where keys are the inputs the rule concerns.'''
+    rules = _rules( table( { default : inputs } ) )
+    return [ ( k, message ) for k, rule, message in rules if rule[0] ]
+
+###############################################################################
+###############################################################################
+
+def _atomic(path, text):
+    '''Writes text to path atomically, via a temporary file in the same
+    directory which then replaces the original file.'''
+    with atomic.writer( path, 'w', prefix = '.config.' ) as fileout:
+        fileout.write( text )
+    return None
+
+def write(path, scenarios):
+    '''Writes many scenarios to a new config file, atomically.'''
+    lines = ['~: QLUSTER scenarios, written by config.write()']
+    for name, inps in scenarios.items():
+        lines.append('~:')
+        lines.append('S: ' + name)
+        for key in keys:
+            if key in inps:
+                lines.append('I: ' + key + ' ' + str( inps[key] ))
+    _atomic( path, '\n'.join( lines ) + '\n' )
+    return None
+
+def update(path, inputs, scenario = default):
+    '''Updates the input values of one scenario in an existing config file,
+    keeping all comments and other scenarios as they are, atomically. Keys
+    which are not in the file yet are appended to the scenario.'''
+
+    with open( path, 'r' ) as filein:
+        text = filein.readlines()
+
+    current = default
+    pending = dict( inputs )
+    record = []
+    for n, line in enumerate( text ):
+        if line[:2] == 'S:':
+            if current == scenario:
+                record += [ 'I: ' + k + ' ' + str(v) + '\n'
+                            for k, v in pending.items() ]
+                pending = {}
+            current = line[2:].strip()
+        elif line[:1] == 'I' and current == scenario:
+            words = line[3:].split()
+            if len( words ) >= 2 and words[0] in pending:
+                value = str( pending.pop( words[0] ) )
+                line = 'I: ' + words[0] + ' ' + value + '\n'
+        record.append( line )
+    if len( pending ) > 0:
+        if current != scenario:
+            record.append('S: ' + scenario + '\n')
+        record += [ 'I: ' + k + ' ' + str(v) + '\n'
+                    for k, v in pending.items() ]
+
+    _atomic( path, ''.join( record ) )
+    return None
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the pairwise close-approach screening across the    ##
+##    members of a swarm, using the Hill-frame relative positions of every   ##
+##    deputy with respect to the same chief. The screening is done in time   ##
+##    windows, in two stages:                                                ##
+##                                                                           ##
+##    1. Coarse filter: the bounding box of every deputy over the window is  ##
+##       inflated by the threshold, and only deputies whose boxes overlap    ##
+##       with another deputy's box are kept, along with the pairs of boxes   ##
+##       that overlap.                                                       ##
+##    2. Fine filter: the kept deputies are binned into a spatial hash with  ##
+##       cells no smaller than the threshold, keyed on (time, cell), so all  ##
+##       time steps of the window are hashed with a single sort. Only pairs  ##
+##       in the same or adjacent cells have their distances computed.        ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 14:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 14:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import itertools
+import numpy as np
+from source import formation
+
+# The 13 neighbouring cell offsets in one half of the 3x3x3 neighbourhood,
+# so that each pair of adjacent cells is visited exactly once.
+_offsets = [ o for o in itertools.product( (-1, 0, 1), repeat = 3 )
+             if o > (0, 0, 0) ]
+
+###############################################################################
+###############################################################################
+
+def screen(t, rpx, rpy, rpz, threshold, window = 256):
+    '''Screens every pair of deputies for close approaches.
+
+    Parameters
+    ----------
+    t : numpy.ndarray
+        Array of T sample times (s)
+    rpx, rpy, rpz : numpy.ndarray
+        NxT arrays of the Hill-frame positions of N deputies (km)
+    threshold : float
+        Screening distance (km), which must be positive; separations
+        strictly below are reported
+    window : int, optional
+        Number of time steps per screening window. The default is 256.
+
+    Returns
+    -------
+    events : dict
+        Arrays 'i' and 'j' (deputy indices with i < j), 't' (time, s) and
+        'd' (separation, km) of every sample below the threshold, sorted by
+        time and then by pair. Hits are reported per sample, not per
+        conjunction event: a close approach lasting several samples gives
+        one entry for each of them.
+
+    '''
+
+    if threshold <= 0:
+        raise ValueError('Screening threshold must be positive!')
+
+    pos = np.stack( [ rpx, rpy, rpz ], axis = -1 ) # NxTx3
+    N, T = pos.shape[0], pos.shape[1]
+    found = { 'i' : [], 'j' : [], 'k' : [], 'd' : [] }
+
+    for k0 in range( 0, T, window ):
+        k1 = min( k0 + window, T )
+        win = pos[:, k0:k1, :]
+
+        # Coarse filter on the bounding envelopes of the deputies.
+        lo = np.min( win, axis = 1 ) - ( 0.5 * threshold )
+        hi = np.max( win, axis = 1 ) + ( 0.5 * threshold )
+        overlap = np.all( ( lo[:, None, :] <= hi[None, :, :] ) &
+                          ( lo[None, :, :] <= hi[:, None, :] ), axis = -1 )
+        np.fill_diagonal( overlap, False )
+        active = np.flatnonzero( np.any( overlap, axis = 1 ) )
+        if len(active) < 2:
+            continue
+
+        # Fine filter with the spatial hash over the active deputies.
+        i, j, k = _hash_pairs( win[active], threshold )
+        i, j = active[i], active[j]
+        keep = overlap[i, j]
+        i, j, k = i[keep], j[keep], k[keep]
+
+        # Exact distances of the remaining candidate pairs.
+        d = np.linalg.norm( win[i, k] - win[j, k], axis = -1 )
+        keep = d < threshold
+        found['i'].append( np.minimum( i, j )[keep] )
+        found['j'].append( np.maximum( i, j )[keep] )
+        found['k'].append( k[keep] + k0 )
+        found['d'].append( d[keep] )
+
+    if len( found['i'] ) == 0:
+        empty = np.array( [], dtype = int )
+        return { 'i' : empty, 'j' : empty.copy(),
+                 't' : np.array( [] ), 'd' : np.array( [] ) }
+
+    i, j, k, d = [ np.concatenate( found[key] ) for key in 'ijkd' ]
+    order = np.lexsort( ( j, i, k ) )
+    return { 'i' : i[order], 'j' : j[order],
+             't' : np.asarray( t )[ k[order] ], 'd' : d[order] }
+
+###############################################################################
+###############################################################################
+
+def _hash_pairs(win, threshold):
+    '''Finds all pairs of deputies in the same or adjacent cells of a spatial
+    hash, at every time step of a window of positions (NxWx3). Returns the
+    deputy indices i and j and the time step k of every candidate pair.'''
+
+    N, W = win.shape[0], win.shape[1]
+
+    # The cell size is at least the threshold. It is enlarged if needed so
+    # that the (time, cell) keys of the window fit into 64-bit integers.
+    lo = np.min( win, axis = (0, 1) )
+    span = np.max( win, axis = (0, 1) ) - lo
+    cell = max( threshold, np.max( span ) / 2**15, np.finfo(float).tiny )
+    cells = np.floor( ( win - lo ) / cell ).astype( np.int64 ) + 1
+    dims = np.max( cells, axis = (0, 1) ) + 2
+
+    def encode(c, k):
+        return ( ( k * dims[0] + c[..., 0] ) * dims[1] + c[..., 1] ) \
+               * dims[2] + c[..., 2]
+
+    # Flatten all (deputy, time step) points and sort them by key.
+    kk = np.broadcast_to( np.arange( W ), (N, W) ).ravel()
+    nn = np.broadcast_to( np.arange( N )[:, None], (N, W) ).ravel()
+    cc = cells.reshape( -1, 3 )
+    keys = encode( cc, kk )
+    order = np.argsort( keys, kind = 'stable' )
+    keys, nn, kk, cc = keys[order], nn[order], kk[order], cc[order]
+
+    pi, pj = [], []
+
+    # Pairs within the same cell: each point pairs with the points after it.
+    end = np.searchsorted( keys, keys, side = 'right' )
+    src, dst = _expand( np.arange( len(keys) ) + 1, end )
+    pi.append( src )
+    pj.append( dst )
+
+    # Pairs in the 13 neighbouring cells of the half neighbourhood.
+    for off in _offsets:
+        query = encode( cc + np.array( off ), kk )
+        start = np.searchsorted( keys, query, side = 'left' )
+        stop  = np.searchsorted( keys, query, side = 'right' )
+        src, dst = _expand( start, stop )
+        pi.append( src )
+        pj.append( dst )
+
+    src = np.concatenate( pi )
+    dst = np.concatenate( pj )
+    return nn[src], nn[dst], kk[src]
+
+###############################################################################
+###############################################################################
+
+def _expand(start, stop):
+    '''Expands per-point index ranges [start, stop) into flat index pairs of
+    (point, partner) without a Python loop.'''
+    count = np.maximum( stop - start, 0 )
+    src = np.repeat( np.arange( len(start) ), count )
+    base = np.repeat( start - np.cumsum( count ) + count, count )
+    dst = base + np.arange( np.sum( count ) )
+    return src, dst
+
+###############################################################################
+###############################################################################
+
+def swarm(td, ts, chief, deputies, threshold, window = 256):
+    '''Propagates a swarm of deputies around a single chief, and screens all
+    pairs of deputies for close approaches.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    chief : tuple
+        Chief elements (a, e, i, w, R, M) in km and deg
+    deputies : list
+        List of N deputy element tuples (a, e, i, w, R, M) in km and deg
+    threshold : float
+        Screening distance (km)
+    window : int, optional
+        Number of time steps per screening window. The default is 256.
+
+    Returns
+    -------
+    events : dict
+        See screen().
+
+    '''
+
+    t = np.arange( 0, td, ts, dtype = float )
+    D = [ np.array( x, dtype = float )[:, None] for x in zip( *deputies ) ]
+    rpx, rpy, rpz, rvx, rvy, rvz = formation.states( t, ts, *chief, *D )
+    return screen( t, rpx, rpy, rpz, threshold, window )
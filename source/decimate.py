@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the level-of-detail (LOD) decimation used to plot   ##
+##    long relative trajectories. The samples are split into equal buckets,  ##
+##    and only the first, last, and the minimum and maximum samples of each  ##
+##    axis within each bucket are kept, so that the extrema of the shape     ##
+##    survive. Only indices are returned: the full-resolution arrays are     ##
+##    never modified, and remain available for export.                      ##
+##                                                                           ##
+##    view() refines the decimation for a zoomed-in view box, spending the   ##
+##    point budget on the samples inside the box, with a coarse version of   ##
+##    the remaining trajectory around it.                                    ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 21:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 21:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+
+###############################################################################
+###############################################################################
+
+def minmax(x, y, z, buckets = 2000, index = None):
+    '''Min/max decimation of a 3-D trajectory, keeping shape extrema.
+
+    Parameters
+    ----------
+    x, y, z : numpy.ndarray
+        Full-resolution coordinates of the trajectory
+    buckets : int
+        Number of buckets, so at most 8 * buckets indices are returned
+    index : numpy.ndarray, optional
+        Sorted subset of sample indices to decimate (default: all samples)
+
+    Returns
+    -------
+    keep : numpy.ndarray
+        Sorted sample indices of the decimated trajectory
+    '''
+
+    if index is None:
+        index = np.arange( len(x) )
+    N = len( index )
+    if N <= 8 * buckets:
+        return index
+
+    # Pad the subset with its last index to a whole number of buckets.
+    b = -1 * ( -1 * N // buckets )
+    pad = np.concatenate( [ index, np.full( buckets * b - N, index[-1] ) ] )
+    pad = pad.reshape( buckets, b )
+
+    # First and last samples, and the extrema of each axis, per bucket.
+    keep = [ pad[:,0], pad[:,-1] ]
+    rows = np.arange( buckets )
+    for c in ( x, y, z ):
+        v = c[pad]
+        keep.append( pad[ rows, np.argmin( v, axis = 1 ) ] )
+        keep.append( pad[ rows, np.argmax( v, axis = 1 ) ] )
+
+    return np.unique( np.concatenate( keep ) )
+
+###############################################################################
+###############################################################################
+
+def view(x, y, z, xlim, ylim, zlim, buckets = 2000):
+    '''Decimation refined for a view box, given as (min, max) limits of each
+    axis. Samples inside the box (and their immediate neighbours, so that
+    lines leaving the box are kept) are decimated with the full budget, and
+    merged with a coarse decimation of the whole trajectory.'''
+
+    inside = ( ( x >= xlim[0] ) & ( x <= xlim[1] ) &
+               ( y >= ylim[0] ) & ( y <= ylim[1] ) &
+               ( z >= zlim[0] ) & ( z <= zlim[1] ) )
+    inside[1:]  |= inside[:-1]
+    inside[:-1] |= inside[1:]
+
+    coarse = minmax( x, y, z, max( 1, buckets // 8 ) )
+    fine = minmax( x, y, z, buckets, np.flatnonzero( inside ) )
+
+    return np.union1d( coarse, fine )
@@ -35,7 +35,7 @@
 ##                                                                           ##
 ##    Written by Samuel Y. W. Low.                                           ##
 ##    First created 20-May-2021 18:00 PM (+8 GMT)                            ##
-##    Last modified 20-May-2021 20:09 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 13:00 PM (+8 GMT)                            ##
 ##                                                                           ##
 ###############################################################################
 ###############################################################################
@@ -44,7 +44,9 @@ import numpy as np
 from source import anomaly
 
 def deputy(td, ts, aC, eC, iC, wC, RC, MC, fR, fI, fO, fC, fPhi, fTht):
-    '''
+    '''Solves for the deputy Keplerian elements that satisfy the formation
+    RIC geometry requirements. All inputs may be floats, or NumPy arrays that
+    broadcast against each other, in which case all outputs are arrays.
 
     Parameters
     ----------
@@ -107,20 +109,20 @@ def deputy(td, ts, aC, eC, iC, wC, RC, MC, fR, fI, fO, fC, fPhi, fTht):
     aD = aC
     
     # Second, from the radial or in-track separation, we can derive the deputy
-    # satellite's eccentricity and argument of perigee.
+    # satellite's eccentricity and argument of perigee. The vectors are kept
+    # as separate X and Y components, so that all of the inputs may also be
+    # NumPy arrays (e.g. for a grid of fPhi and fTht values).
     de      = fR / aC
-    de_vect = np.array([ de * np.cos(fPhi), de * np.sin(fPhi) ])
-    eC_vect = np.array([ eC * np.cos( wC ), eC * np.sin( wC ) ])
-    eD_vect = eC_vect + de_vect
-    eD      = np.linalg.norm( eD_vect )
-    wD      = np.arctan2( eD_vect[1], eD_vect[0] )
+    eD_X    = ( eC * np.cos( wC ) ) + ( de * np.cos(fPhi) )
+    eD_Y    = ( eC * np.sin( wC ) ) + ( de * np.sin(fPhi) )
+    eD      = np.hypot( eD_X, eD_Y )
+    wD      = np.arctan2( eD_Y, eD_X )
     
     # Third, the relative inclination vector components allow us to derive the
     # deputy inclination and right ascension of the ascending node.
     di      = np.sin( fC / aC )
-    di_vect = np.array([ di * np.cos(fTht), di * np.sin(fTht) ])
-    iD      = iC + di_vect[0]
-    RD      = RC + ( di_vect[1] / np.sin(iC) )
+    iD      = iC + ( di * np.cos(fTht) )
+    RD      = RC + ( di * np.sin(fTht) / np.sin(iC) )
     
     # Fourth, we need to determine the argument of latitudes of the chief
     # (where argument of latitude = true anomaly + argument of perigee)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the event detection of the relative trajectory,     ##
+##    such as the epochs of closest approach and of the radial and cross-    ##
+##    track zero crossings. Each event is an (oriented) sign change of an    ##
+##    event function, which is bracketed on a coarse time grid and refined   ##
+##    by bisection, using the closed-form relative states of formation.py.   ##
+##    All brackets are refined together in vectorised form, so the cost of   ##
+##    an accurate event time does not depend on the propagation time step.   ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 15:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 15:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from source import formation
+
+# Time step (s) of the central difference used for the range rate.
+_h = 1.0E-3
+
+# Event definitions: the name maps to (event function key, direction), where
+# direction +1 only keeps rising sign changes, -1 falling, and 0 both.
+kinds = { 'range_min'  : ( 'range_rate', +1 ),
+          'range_max'  : ( 'range_rate', -1 ),
+          'radial'     : ( 'rpx', 0 ),
+          'crosstrack' : ( 'rpz', 0 ) }
+
+###############################################################################
+###############################################################################
+
+def _function(key, t, ts, elements):
+    '''Evaluates the event function `key` at the times t.'''
+
+    if key == 'range_rate':
+
+        # The rate of change of the squared range, from a central difference
+        # of the closed-form positions, so that its roots are the exact
+        # extrema of the modelled range.
+        rp = formation.states( t + _h, ts, *elements )[:3]
+        rm = formation.states( t - _h, ts, *elements )[:3]
+        sq = lambda r : r[0]**2 + r[1]**2 + r[2]**2
+        return ( sq(rp) - sq(rm) ) / ( 2 * _h )
+
+    index = ['rpx', 'rpy', 'rpz', 'rvx', 'rvy', 'rvz'].index( key )
+    return formation.states( t, ts, *elements )[index]
+
+###############################################################################
+###############################################################################
+
+def detect(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+           names = None, step = None, tol = 1.0E-3):
+    '''Detects relative motion events over the scenario.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s), which fixes the time origin of the samples
+        (sample k of formation.propagate() is at t = k * ts).
+    aC, eC, iC, wC, RC, MC : float
+        Chief Orbit Keplerian elements (km and deg)
+    aD, eD, iD, wD, RD, MD : float
+        Deputy Orbit Keplerian elements (km and deg)
+    names : list, optional
+        Event names from the module-level dictionary `kinds`. The default is
+        all events.
+    step : float, optional
+        Coarse bracketing grid step (s). It must be shorter than the shortest
+        interval between two events of the same kind (a fraction of an
+        orbit). The default is ts.
+    tol : float, optional
+        Accuracy of the event times (s). The default is 1 ms.
+
+    Returns
+    -------
+    events : dict
+        For each event name, a dictionary with the event times 't' (s) and
+        the relative states 'rpx', 'rpy', 'rpz' (km) and 'rvx', 'rvy', 'rvz'
+        (km/s) at those times.
+
+    '''
+
+    if names is None:
+        names = list( kinds.keys() )
+    if step is None:
+        step = ts
+
+    elements = ( aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD )
+    grid = np.arange( 0, td, step, dtype = float )
+    cache = {} # Event function values on the grid, shared between events.
+    events = {}
+
+    for name in names:
+        key, direction = kinds[name]
+        if key not in cache:
+            cache[key] = _function( key, grid, ts, elements )
+        g = cache[key]
+
+        # Bracket the oriented sign changes on the coarse grid. A grid point
+        # with a zero value is the left end of a (degenerate) bracket.
+        ga, gb = g[:-1], g[1:]
+        rising  = ( ga <= 0 ) & ( gb > 0 )
+        falling = ( ga >= 0 ) & ( gb < 0 )
+        if direction > 0:
+            bracket = rising
+        elif direction < 0:
+            bracket = falling
+        else:
+            bracket = rising | falling
+        k = np.flatnonzero( bracket )
+        a, b = grid[k], grid[k+1]
+        fa, fb = ga[k], gb[k]
+
+        # Refine all brackets together by bisection.
+        while len(a) > 0 and np.max( b - a ) > tol:
+            c = 0.5 * ( a + b )
+            fc = _function( key, c, ts, elements )
+            left = ( np.sign(fc) == np.sign(fa) ) & ( fa != 0 )
+            a, fa = np.where( left, c, a ), np.where( left, fc, fa )
+            b, fb = np.where( left, b, c ), np.where( left, fb, fc )
+
+        # Discard brackets that converged onto a discontinuity (due to the
+        # angle wrapping of the argument of latitude) rather than a root. At
+        # a jump, the slope across the final bracket is far steeper than the
+        # slope across the coarse bracket, whereas at a root it is similar.
+        slope_f = np.abs( fb - fa ) / np.maximum( b - a, tol * 1.0E-6 )
+        slope_c = np.abs( gb[k] - ga[k] ) / step
+        t = ( 0.5 * ( a + b ) )[ slope_f <= 100 * slope_c ]
+
+        rpx, rpy, rpz, rvx, rvy, rvz = formation.states( t, ts, *elements )
+        events[name] = { 't'   : t,
+                         'rpx' : rpx, 'rpy' : rpy, 'rpz' : rpz,
+                         'rvx' : rvx, 'rvy' : rvy, 'rvz' : rvz }
+
+    return events
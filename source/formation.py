@@ -18,15 +18,18 @@
 ##                                                                           ##
 ##    Written by Samuel Y. W. Low.                                           ##
 ##    First created 16-May-2021 15:56 AM (+8 GMT)                            ##
-##    Last modified 20-May-2021 18:00 PM (+8 GMT)                            ##
+##    Last modified 20-Oct-2026 01:30 AM (+8 GMT)                            ##
 ##                                                                           ##
 ###############################################################################
 ###############################################################################
 
 import numpy as np
+from source import anomaly
+from source import instrument
 from source import posvel
 
-def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
+def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+              warm=False):
     '''Core function used for relative trajectory generation.
     
     Parameters
@@ -59,6 +62,11 @@ def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
         Deputy Orbit Right Ascension (deg)
     MD : float
         Deputy Orbit Mean Anomaly (deg)
+    warm : bool, optional
+        If True, each Kepler solve is warm-started from a Taylor extrapolation
+        of the previous sample's eccentric anomaly, instead of starting from
+        the mean anomaly, which typically needs a single Newton iteration per
+        sample. The default is False.
     
     Returns
     -------
@@ -139,6 +147,9 @@ def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
     # Initialise pi in terms of astropy units
     pi = np.pi
     
+    # Initialise the warm-start guesses of the eccentric anomalies.
+    EC, ED = None, None
+    
     # For each sample...
     for t in range( 0, td, ts ):
         
@@ -148,11 +159,21 @@ def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
         # Update the mean anomaly of the deputy (loop over pi).
         MD = ( ( MD + pi + ( nD * ts ) ) % ( 2 * pi ) ) - pi
         
+        # Extrapolate the previous eccentric anomalies (if warm-started).
+        if warm and t > 0:
+            EC = anomaly.extrapolate( EC, eC, nC * ts )
+            ED = anomaly.extrapolate( ED, eD, nD * ts )
+        
         # Compute the chief position, velocity and true anomaly.
-        pC, vC, nuC = posvel.posvel( aC, eC, iC, wC, RC, MC )
+        pC, vC, nuC = posvel.posvel( aC, eC, iC, wC, RC, MC, E0=EC )
         
         # Compute the deputy position, velocity and true anomaly.
-        pD, vD, nuD = posvel.posvel( aD, eD, iD, wD, RD, MD )
+        pD, vD, nuD = posvel.posvel( aD, eD, iD, wD, RD, MD, E0=ED )
+        
+        # Recover the solved eccentric anomalies for the next sample.
+        if warm:
+            EC = anomaly.V2E( nuC, eC )
+            ED = anomaly.V2E( nuD, eD )
         
         # Get the argument of latitude of the chief.
         uC = nuC + wC
@@ -197,6 +218,9 @@ def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
         rvy.append( (relVel[1] * vCMag) )
         rvz.append( (relVel[2] * vCMag) )
     
+    # Record the number of samples (if instrumented).
+    instrument.count('samples', len(rpx))
+    
     # Save the entire relative ephemeris matrix.
     rpx = np.array( rpx ) * ( 1 )
     rpy = np.array( rpy ) * ( 1 )
@@ -206,3 +230,180 @@ def propagate(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
     rvz = np.array( rvz ) * (-1 )
     
     return rpx, rpy, rpz, rvx, rvy, rvz
+
+
+###############################################################################
+###############################################################################
+
+def history(t, ts, a, e, w, M, table=False):
+    '''Per-sample anomalies of one satellite, at the sample times t, with
+    the same time convention as states(). This is the part of states() that
+    depends on a single satellite, so that it may be cached and re-used, or
+    extended to later sample times (see pipeline.py).
+    
+    Parameters
+    ----------
+    t : numpy.ndarray
+        Array of sample times since the start of the scenario (s)
+    ts : int
+        Propagation Timestep (s)
+    a, e, w, M : float or numpy.ndarray
+        Semi-major axis (km), eccentricity, argument of perigee (deg) and
+        mean anomaly (deg) of the satellite
+    table : bool, optional
+        If True, Keplers equation is solved by table lookup for a scalar
+        eccentricity (see states). The default is False.
+    
+    Returns
+    -------
+    E : numpy.ndarray
+        Eccentric anomalies at every sample (rad)
+    u : numpy.ndarray
+        Arguments of latitude at every sample, wrapped to +/- pi (rad)
+    
+    '''
+    
+    # Gravitational constant = G * Earth Mass (km**3/s**2)
+    mu = 398600.44
+    
+    # Initialise pi and the wrapping function (loop over pi).
+    pi = np.pi
+    wrap = lambda x : ( ( x + pi ) % ( 2 * pi ) ) - pi
+    
+    # Mean anomalies at every sample time, then solve Kepler's equation.
+    t  = np.asarray( t, dtype = float ) + ts
+    Mt = wrap( np.deg2rad(M) + ( np.sqrt( mu / ( a**3 ) ) * t ) )
+    E  = _solve( Mt, e, table )
+    
+    # True anomalies from the perifocal coordinates, and argument of latitude.
+    nu = np.arctan2( np.sqrt( 1 - e**2 ) * np.sin(E), np.cos(E) - e )
+    u  = wrap( nu + np.deg2rad(w) )
+    
+    return E, u
+
+###############################################################################
+###############################################################################
+
+def relative(ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+             EC, uC, uD, table=False):
+    '''Hill-frame relative states from the per-sample histories of the
+    chief (EC, uC) and the deputy (uD), as returned by history(). Element
+    arguments are as in states().
+    
+    Returns
+    -------
+    rpx, rpy, rpz : numpy.ndarray
+        Arrays of sampled X, Y, Z Hill-Frame positions (km)
+    rvx, rvy, rvz : numpy.ndarray
+        Arrays of sampled X, Y, Z Hill-Frame velocities (km/s)
+    
+    '''
+    
+    # Convert all angular arguments to radians.
+    iC, iD = np.deg2rad(iC), np.deg2rad(iD)
+    wC, wD = np.deg2rad(wC), np.deg2rad(wD)
+    RC, RD = np.deg2rad(RC), np.deg2rad(RD)
+    MC = np.deg2rad(MC)
+    
+    # Relative eccentricity and inclination vector components, identical to
+    # the state transition matrix parameters in propagate().
+    ix =   iD - iC
+    iy = ( np.sin(iC) * (RD - RC) )
+    ex = ( eD * np.cos(wD) ) - ( eC * np.cos(wC) )
+    ey = ( eD * np.sin(wD) ) - ( eC * np.sin(wC) )
+    da = ( aD - aC ) / aC
+    dR = ( RD - RC ) * np.cos(iC)
+    
+    # Gravitational constant = G * Earth Mass (km**3/s**2)
+    mu = 398600.44
+    
+    # Mean motion of the chief.
+    nC = np.sqrt( mu / ( aC**3 ) )
+    
+    # Initialise pi and the wrapping function (loop over pi).
+    pi = np.pi
+    wrap = lambda x : ( ( x + pi ) % ( 2 * pi ) ) - pi
+    
+    # Relative argument of latitude.
+    du = wrap( uD - uC )
+    
+    # The chief initial argument of latitude is taken at the first sample.
+    EC0 = _solve( wrap( MC + ( nC * ts ) ), eC, table )
+    nu0 = np.arctan2( np.sqrt( 1 - eC**2 ) * np.sin(EC0), np.cos(EC0) - eC )
+    uC0 = wrap( nu0 + wC )
+    
+    # Compute the deputy elapsed argument of latitude.
+    uD_elapsed = wrap( uD - uC0 )
+    
+    # The chief velocity magnitude is invariant under the frame rotation, so
+    # it can be computed directly from the perifocal velocity components.
+    vCMag = np.sqrt( mu * aC ) / ( aC * ( 1 - eC * np.cos(EC) ) )
+    vCMag = vCMag * np.sqrt( np.sin(EC)**2 + (1 - eC**2) * np.cos(EC)**2 )
+    
+    # Record the number of samples (if instrumented).
+    instrument.count('samples', np.size(uC))
+    
+    # Expand the state transition matrix product row by row.
+    cu, su = np.cos(uC), np.sin(uC)
+    rpx =   ( da - ( ex * cu ) - ( ey * su ) ) * aC
+    rpy =   ( du + dR - ( 1.5 * da * uD_elapsed ) ) * aC
+    rpz = ( ( -1 * iy * cu ) + ( ix * su ) ) * aC * (-1)
+    rvx = ( ( -1 * ey * cu ) + ( ex * su ) ) * vCMag
+    rvy = ( -1.5 * da ) * vCMag
+    rvz = ( ( ix * cu ) + ( iy * su ) ) * vCMag * (-1)
+    
+    return rpx, rpy, rpz, rvx, rvy, rvz
+
+###############################################################################
+###############################################################################
+
+def states(t, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+           table=False):
+    '''Vectorised counterpart of propagate(), which evaluates the Hill-frame
+    relative states directly at the sample times t, without any loop. Sample
+    k of propagate() corresponds to t = k * ts, so that any window of samples
+    (or any non-uniform set of times) can be computed independently. Orbit
+    element arguments may also be NumPy arrays, broadcast against t, so that
+    many deputies (or chiefs) may be evaluated in a single call.
+    
+    Parameters
+    ----------
+    t : numpy.ndarray
+        Array of sample times since the start of the scenario (s)
+    ts : int
+        Propagation Timestep (s), as propagate() steps the mean anomalies
+        forward by one time step before the first sample is taken.
+    aC, eC, iC, wC, RC, MC : float or numpy.ndarray
+        Chief Orbit Keplerian elements (km and deg)
+    aD, eD, iD, wD, RD, MD : float or numpy.ndarray
+        Deputy Orbit Keplerian elements (km and deg)
+    table : bool, optional
+        If True, Keplers equation is solved by lookup in a cached table (see
+        anomaly.KeplerTable) for every satellite with a scalar eccentricity,
+        instead of by Newton iterations. The default is False.
+    
+    Returns
+    -------
+    rpx, rpy, rpz : numpy.ndarray
+        Arrays of sampled X, Y, Z Hill-Frame positions (km)
+    rvx, rvy, rvz : numpy.ndarray
+        Arrays of sampled X, Y, Z Hill-Frame velocities (km/s)
+    
+    '''
+    
+    # Per-sample anomalies of the chief and of the deputy.
+    EC, uC = history( t, ts, aC, eC, wC, MC, table )
+    ED, uD = history( t, ts, aD, eD, wD, MD, table )
+    
+    return relative( ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+                     EC, uC, uD, table )
+
+###############################################################################
+###############################################################################
+
+def _solve(M, e, table):
+    '''Solves Keplers equation, by table lookup for a scalar eccentricity
+    if table is True, or by Newton iterations otherwise.'''
+    if table and np.ndim(e) == 0:
+        return anomaly.table(e).M2E(M)
+    return anomaly.M2E(M, e)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the lightweight instrumentation layer. Timed spans  ##
+##    (using perf_counter) and counters are recorded by name, and cProfile   ##
+##    and tracemalloc captures can optionally be switched on as well. When   ##
+##    disabled (the default), span() returns a shared no-op context and      ##
+##    count() returns immediately, so instrumented code costs next to        ##
+##    nothing. Set the environment variable QLUSTER_INSTRUMENT=1 to enable   ##
+##    it at import time, or call enable() and disable().                     ##
+##                                                                           ##
+##    Example:                                                               ##
+##                                                                           ##
+##    >> instrument.enable()                                                 ##
+##    >> with instrument.span('formation.propagate'):                        ##
+##    >>     ...                                                             ##
+##    >> instrument.count('samples', 1000)                                   ##
+##    >> print( instrument.summary() )                                       ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 20:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 20:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import io
+import os
+import time
+import pstats
+import cProfile
+import threading
+import contextlib
+import tracemalloc
+
+# Global switch, checked by every span and counter.
+enabled = os.environ.get( 'QLUSTER_INSTRUMENT', '0' ) == '1'
+
+# Recorded data: spans map to [calls, total (s), max (s)], counters to ints.
+_spans = {}
+_counters = {}
+_lock = threading.Lock()
+
+# Optional cProfile and tracemalloc captures.
+_profiler = None
+_profile_text = ''
+_memory_peak = None
+_memory_started = False
+
+# Shared no-op context returned by span() when disabled.
+_null = contextlib.nullcontext()
+
+###############################################################################
+###############################################################################
+
+class _Span():
+
+    '''Context manager that records the wall time of a block under a name.'''
+
+    __slots__ = ( 'name', 't0' )
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        dt = time.perf_counter() - self.t0
+        with _lock:
+            record = _spans.setdefault( self.name, [0, 0.0, 0.0] )
+            record[0] += 1
+            record[1] += dt
+            record[2] = max( record[2], dt )
+        return False
+
+###############################################################################
+###############################################################################
+
+def span(name):
+    '''Returns a context manager timing the enclosed block under `name`.'''
+    if not enabled:
+        return _null
+    return _Span( name )
+
+def count(name, n = 1):
+    '''Increments the counter `name` by n.'''
+    if not enabled:
+        return None
+    with _lock:
+        _counters[name] = _counters.get( name, 0 ) + n
+    return None
+
+###############################################################################
+###############################################################################
+
+def enable(profile = False, memory = False):
+    '''Enables the instrumentation, and optionally starts a cProfile and a
+    tracemalloc capture, which are stopped by disable(). A tracemalloc
+    capture that was already running is used, but left running.'''
+    global enabled, _profiler, _memory_started
+    enabled = True
+    if profile and _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _memory_started = True
+    return None
+
+def disable():
+    '''Disables the instrumentation, stopping any profiling captures. The
+    recorded data is kept until reset() is called.'''
+    global enabled, _profiler, _profile_text, _memory_peak, _memory_started
+    enabled = False
+    if _profiler is not None:
+        _profiler.disable()
+        stream = io.StringIO()
+        stats = pstats.Stats( _profiler, stream = stream )
+        stats.sort_stats( 'cumulative' ).print_stats( 25 )
+        _profile_text = stream.getvalue()
+        _profiler = None
+    if tracemalloc.is_tracing():
+        _memory_peak = tracemalloc.get_traced_memory()[1]
+        if _memory_started:
+            tracemalloc.stop()
+    _memory_started = False
+    return None
+
+def reset():
+    '''Clears all recorded spans, counters and profiling captures.'''
+    global _profile_text, _memory_peak
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+    _profile_text = ''
+    _memory_peak = None
+    return None
+
+###############################################################################
+###############################################################################
+
+def report():
+    '''Returns all recorded data as a dictionary, with keys 'spans' (name to
+    a dictionary of calls, total and max time in seconds), 'counters' (name
+    to count), 'memory_peak' (bytes, or None) and 'profile' (cProfile text
+    of the 25 most expensive functions by cumulative time, or '').'''
+    with _lock:
+        spans = { k : { 'calls' : v[0], 'total' : v[1], 'max' : v[2] }
+                  for k, v in _spans.items() }
+        counters = dict( _counters )
+    memory = _memory_peak
+    if tracemalloc.is_tracing():
+        memory = tracemalloc.get_traced_memory()[1]
+    return { 'spans' : spans, 'counters' : counters,
+             'memory_peak' : memory, 'profile' : _profile_text }
+
+def summary():
+    '''Returns the recorded spans and counters as a human-readable table.'''
+    data = report()
+    lines = [ '{:28s} {:>7s} {:>11s} {:>11s}'.format(
+              'Span', 'Calls', 'Total (s)', 'Max (s)' ) ]
+    for name, s in sorted( data['spans'].items(),
+                           key = lambda x : -x[1]['total'] ):
+        lines.append( '{:28s} {:7d} {:11.4f} {:11.4f}'.format(
+                      name, s['calls'], s['total'], s['max'] ) )
+    lines.append( '' )
+    for name, n in sorted( data['counters'].items() ):
+        lines.append( '{:28s} {:>7d}'.format( name, n ) )
+    if data['memory_peak'] is not None:
+        lines.append( '{:28s} {:7.1f} MB'.format(
+                      'memory peak', data['memory_peak'] / 1.0E6 ) )
+    return '\n'.join( lines )
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the Monte Carlo insertion-error analysis. The       ##
+##    nominal deputy (and optionally the chief) orbit elements are perturbed ##
+##    by random injection errors, and each batch of perturbed samples is     ##
+##    propagated as one vectorised call on a worker of a process pool. The   ##
+##    per-sample separation statistics are then reduced online into the      ##
+##    statistics of the whole campaign, so no trajectory is ever stored.     ##
+##                                                                           ##
+##    Every batch draws from its own seed, spawned from one master seed, so  ##
+##    results are reproducible regardless of the number of workers.          ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 12:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 12:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from source import reducers
+
+# Keys of the six Keplerian elements, in the order used by the package.
+elements = ['a', 'e', 'i', 'w', 'R', 'M']
+
+# Per-sample separation metrics that are reduced over the whole campaign.
+metrics = ['range_min', 'range_max', 'rc_min']
+
+###############################################################################
+###############################################################################
+
+def perturb(rng, nominal, sigma, size, dist = 'normal'):
+    '''Draws `size` perturbed copies of a set of six orbit elements.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        Random number generator of the current batch
+    nominal : tuple
+        Nominal elements (a, e, i, w, R, M) in km and deg
+    sigma : dict
+        Dispersion per element key in `elements` (km or deg). For 'normal'
+        this is the standard deviation, and for 'uniform' the half-width.
+        Elements without a key are not perturbed.
+    size : int
+        Number of samples to draw
+    dist : str, optional
+        Either 'normal' or 'uniform'. The default is 'normal'.
+
+    Returns
+    -------
+    samples : list
+        Six arrays of shape (size, 1), ready to broadcast against time. The
+        eccentricity is folded back to be non-negative; samples with an
+        eccentricity >= 1 are dropped by batch().
+
+    '''
+
+    if dist not in ['normal', 'uniform']:
+        raise ValueError('Unknown distribution ' + str(dist) + '!')
+
+    samples = []
+    for key, value in zip( elements, nominal ):
+        s = sigma.get( key, 0.0 )
+        if dist == 'normal':
+            draw = rng.normal( 0.0, 1.0, size ) * s
+        else:
+            draw = rng.uniform( -1.0, 1.0, size ) * s
+        samples.append( ( value + draw )[:, None] )
+
+    samples[1] = np.abs( samples[1] )
+    return samples
+
+###############################################################################
+###############################################################################
+
+def batch(td, ts, chief, deputy, size, seed, sigmaD, sigmaC = None,
+          dist = 'normal', chunk = 20000, keepout = 0.0):
+    '''Runs a single batch of perturbed samples, and returns the partial
+    campaign statistics. This is the unit of work sent to the process pool.
+
+    Parameters
+    ----------
+    td, ts : int
+        Propagation Duration and Timestep (s)
+    chief, deputy : tuple
+        Nominal chief and deputy elements (a, e, i, w, R, M) in km and deg
+    size : int
+        Number of samples in the batch
+    seed : numpy.random.SeedSequence
+        Seed of this batch
+    sigmaD, sigmaC : dict
+        Dispersions of the deputy and chief elements (see perturb())
+    dist : str
+        Distribution of the dispersions, 'normal' or 'uniform'
+    chunk : int
+        Number of time samples per propagation window
+    keepout : float
+        Keep-out radius (km), counting the samples whose range falls below
+
+    Returns
+    -------
+    stats : dict
+        Per-metric reducers.Welford and reducers.MinMax partial results, the
+        number of keep-out violations under the key 'violations', and the
+        number of samples dropped for an eccentricity >= 1 under 'dropped'.
+
+    '''
+
+    rng = np.random.default_rng( seed )
+    D = perturb( rng, deputy, sigmaD, size, dist )
+    if sigmaC:
+        C = perturb( rng, chief, sigmaC, size, dist )
+    else:
+        C = list( chief )
+
+    # Drop the samples whose perturbed orbits are no longer elliptical.
+    valid = np.ravel( ( D[1] < 1.0 ) & ( C[1] < 1.0 ) )
+    if not np.all( valid ):
+        D = [ x[valid] for x in D ]
+        if sigmaC:
+            C = [ x[valid] for x in C ]
+
+    stats = { 'violations' : 0,
+              'dropped' : int( np.sum( ~valid ) ) }
+    for key in metrics:
+        stats[key] = ( reducers.Welford(), reducers.MinMax() )
+    if not np.any( valid ):
+        return stats
+
+    sep, = reducers.reduce( td, ts, *C, *D, chunk = chunk )
+    sep = sep.result()
+
+    stats['violations'] = int( np.sum( sep['range_min'] < keepout ) )
+    for key in metrics:
+        for reducer in stats[key]:
+            reducer.update( np.ravel( sep[key] ) )
+    return stats
+
+###############################################################################
+###############################################################################
+
+def run(td, ts, chief, deputy, samples, sigmaD, sigmaC = None,
+        dist = 'normal', seed = 0, size = 256, workers = None,
+        chunk = 20000, keepout = 0.0):
+    '''Monte Carlo insertion-error analysis of the formation safety.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    chief : tuple
+        Nominal chief elements (a, e, i, w, R, M) in km and deg
+    deputy : tuple
+        Nominal deputy elements (a, e, i, w, R, M) in km and deg, such as the
+        output of deputy.deputy()
+    samples : int
+        Total number of Monte Carlo samples
+    sigmaD : dict
+        Dispersion of the deputy elements, e.g. {'a': 0.01, 'M': 0.001}
+    sigmaC : dict, optional
+        Dispersion of the chief elements. The default is None (no errors).
+    dist : str, optional
+        Either 'normal' or 'uniform'. The default is 'normal'.
+    seed : int, optional
+        Master seed, from which one seed per batch is spawned.
+    size : int, optional
+        Number of samples per batch. The default is 256.
+    workers : int, optional
+        Number of worker processes. None uses all CPUs, and 1 runs the whole
+        campaign serially in the current process.
+    chunk : int, optional
+        Number of time samples per propagation window. The default is 20000.
+    keepout : float, optional
+        Keep-out radius (km) for the violation probability. Default is 0.
+
+    Returns
+    -------
+    result : dict
+        For each metric in `metrics`, a dictionary with the mean, standard
+        deviation, minimum and maximum over all kept samples (km). Also
+        includes the sample count, the number of samples dropped for an
+        eccentricity >= 1, and the keep-out violation probability over the
+        kept samples.
+
+    '''
+
+    if samples <= 0:
+        raise ValueError('Number of Monte Carlo samples must be positive!')
+    if size < 1:
+        raise ValueError('Monte Carlo batch size must be at least one!')
+
+    # One independent seed per batch, so that the results are reproducible.
+    sizes = [ size ] * ( samples // size )
+    if samples % size > 0:
+        sizes.append( samples % size )
+    seeds = np.random.SeedSequence( seed ).spawn( len(sizes) )
+
+    args = [ ( td, ts, chief, deputy, n, s, sigmaD, sigmaC,
+               dist, chunk, keepout ) for n, s in zip( sizes, seeds ) ]
+
+    # Accumulate the partial results in batch order, for reproducibility.
+    total = None
+    if workers == 1:
+        partials = ( batch( *a ) for a in args )
+        total = _accumulate( partials )
+    else:
+        with ProcessPoolExecutor( max_workers = workers ) as pool:
+            partials = pool.map( batch, *zip( *args ) )
+            total = _accumulate( partials )
+
+    kept = samples - total['dropped']
+    result = { 'samples' : samples, 'dropped' : total['dropped'],
+               'violation_probability' : total['violations'] / kept
+                                         if kept > 0 else np.nan }
+    for key in metrics:
+        welford, minmax = total[key]
+        result[key] = { 'mean' : welford.mean, 'std' : welford.std,
+                        'min'  : minmax.min,   'max' : minmax.max }
+    return result
+
+###############################################################################
+###############################################################################
+
+def _accumulate(partials):
+    '''Merges partial batch statistics into a single set of statistics.'''
+    total = None
+    for part in partials:
+        if total is None:
+            total = part
+            continue
+        total['violations'] += part['violations']
+        total['dropped'] += part['dropped']
+        for key in metrics:
+            total[key][0].merge( part[key][0] )
+            total[key][1].merge( part[key][1] )
+    return total
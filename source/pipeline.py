@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the incremental computation pipeline, which splits  ##
+##    a QLUSTER run into dependent stages, and only recomputes the stages    ##
+##    whose inputs changed since the previous update:                        ##
+##                                                                           ##
+##    deputy   : deputy elements, from the chief elements and geometry       ##
+##    chief    : chief anomaly history (a, e, w, M of the chief and ts)      ##
+##    history  : deputy anomaly history (a, e, w, M of the deputy and ts)    ##
+##    relative : Hill-frame relative states, from all of the above           ##
+##    plot     : consumers of the relative states (e.g. the GUI plot)        ##
+##                                                                           ##
+##    Stages that depend on time keep their samples when only the duration   ##
+##    changes: a longer duration appends the new samples only, and a        ##
+##    shorter one truncates. For example, changing only the cross-track      ##
+##    amplitude changes the deputy inclination and node alone, so only the   ##
+##    deputy design and the relative states are recomputed.                 ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 20-Oct-2026 01:30 AM (+8 GMT)                            ##
+##    Last modified 20-Oct-2026 01:30 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from source import config
+from source import deputy
+from source import formation
+from source import instrument
+
+# Stages of the pipeline, in dependency order.
+stages = ['deputy', 'chief', 'history', 'relative', 'plot']
+
+###############################################################################
+###############################################################################
+
+class Pipeline():
+
+    '''Dependency-aware incremental computation of a QLUSTER run.
+
+    Attributes
+    ----------
+    deputy : tuple or None
+        Deputy elements (a, e, i, w, R, M) in km and deg
+    chief : tuple or None
+        Chief anomaly history (E, u), see formation.history()
+    history : tuple or None
+        Deputy anomaly history (E, u), see formation.history()
+    eph : numpy.ndarray
+        Relative ephemeris, 6xN (rows rpx, rpy, rpz, rvx, rvy, rvz)
+    version : int
+        Incremented every time the ephemeris changes, so that consumers
+        (the 'plot' stage) can tell whether they are up to date.
+    table : bool
+        Solve Keplers equation by table lookup (see formation.states).
+    '''
+
+    def __init__(self, table = False):
+        self.table = table
+        self.deputy = None
+        self.chief = None
+        self.history = None
+        self.eph = np.zeros((6,0))
+        self.version = 0
+        self._keys = { stage : None for stage in stages }
+
+    def invalidate(self, stage = None):
+        '''Forces a stage (and all later stages), or all stages if None, to
+        be recomputed on the next update.'''
+        start = 0 if stage is None else stages.index( stage )
+        for name in stages[start:]:
+            self._keys[name] = None
+        return None
+
+    def update(self, inputs):
+        '''Brings all stages up to date with a dictionary of inputs (keys as
+        in config.keys), and returns the set of stages which were recomputed
+        or extended. The 'plot' stage is in the set whenever the ephemeris
+        changed, or after the 'plot' stage was invalidated.'''
+
+        values = [ inputs[k] for k in config.keys ]
+        td, ts = values[0], values[1]
+        chief = tuple( values[2:8] )
+        N = len( np.arange( 0, td, ts ) )
+        done = set()
+
+        # Deputy design, which does not depend on the time parameters.
+        key = chief + tuple( values[8:] )
+        if key != self._keys['deputy']:
+            with instrument.span('pipeline.deputy'):
+                self.deputy = tuple( float(x) for x in
+                                     deputy.deputy( *values ) )
+            self._keys['deputy'] = key
+            done.add('deputy')
+
+        # Anomaly histories of the chief and of the deputy.
+        aC, eC, iC, wC, RC, MC = chief
+        aD, eD, iD, wD, RD, MD = self.deputy
+        self.chief = self._history( 'chief', self.chief, N, ts,
+                                    aC, eC, wC, MC, done )
+        self.history = self._history( 'history', self.history, N, ts,
+                                      aD, eD, wD, MD, done )
+
+        # Relative states, re-using or extending the previous samples.
+        key = ( ts, ) + chief + self.deputy
+        old = self.eph.shape[1] if key == self._keys['relative'] else 0
+        if key != self._keys['relative'] or old != N:
+            with instrument.span('pipeline.relative'):
+                if N <= old:
+                    self.eph = self.eph[:,:N]
+                else:
+                    EC, uC = [ x[old:N] for x in self.chief ]
+                    ED, uD = [ x[old:N] for x in self.history ]
+                    new = np.array( formation.relative( ts, *chief,
+                                    *self.deputy, EC, uC, uD, self.table ) )
+                    if old > 0:
+                        new = np.concatenate( [ self.eph, new ], axis = 1 )
+                    self.eph = new
+            self._keys['relative'] = key
+            self.version += 1
+            done.add('relative')
+
+        # Consumers of the relative states.
+        if self._keys['plot'] != self.version:
+            self._keys['plot'] = self.version
+            done.add('plot')
+
+        return done
+
+    def _history(self, stage, current, N, ts, a, e, w, M, done):
+        '''Brings an anomaly history stage up to N samples, computing only
+        the samples which are missing (or all, if its inputs changed).'''
+        key = ( ts, a, e, w, M )
+        old = len( current[0] ) if key == self._keys[stage] else 0
+        if key == self._keys[stage] and old == N:
+            return current
+        with instrument.span('pipeline.' + stage):
+            if N <= old:
+                current = tuple( x[:N] for x in current )
+            else:
+                t = np.arange( old, N, dtype = float ) * ts
+                new = formation.history( t, ts, a, e, w, M, self.table )
+                if old > 0:
+                    new = tuple( np.concatenate( [ x, y ] )
+                                 for x, y in zip( current, new ) )
+                current = new
+        self._keys[stage] = key
+        done.add( stage )
+        return current
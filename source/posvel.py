@@ -15,7 +15,7 @@
 ##                                                                           ##
 ##    Written by Samuel Y. W. Low.                                           ##
 ##    First created 02-May-2021 00:53 AM (+8 GMT)                            ##
-##    Last modified 20-May-2021 10:14 AM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 17:00 PM (+8 GMT)                            ##
 ##                                                                           ##
 ###############################################################################
 ###############################################################################
@@ -25,7 +25,7 @@ from source import anomaly
 from source import dcmrotx
 from source import dcmrotz
 
-def posvel(a, e, i, w, R, M):
+def posvel(a, e, i, w, R, M, E0=None):
     '''Returns three objects: an inertial position vector (1x3 NumPy array),
     an inertial velocity vector (1x3), and a true anomaly value (float), when
     ingesting six osculating Keplerian orbit elements.
@@ -44,6 +44,8 @@ def posvel(a, e, i, w, R, M):
         Right Angle of Asc Node (rad)
     M : float
         Mean Anomaly (rad)
+    E0 : float, optional
+        Initial guess of the eccentric anomaly for Keplers equation (rad)
 
     Returns Inertial position vector, velocity vector, and true anomaly
     -------
@@ -65,7 +67,7 @@ def posvel(a, e, i, w, R, M):
     # by performing a 3-1-3 Euler Angle rotation using an appropriate DCM.
     
     # First, let us solve for the eccentric anomaly.
-    eccAnom = anomaly.M2E(M,e)
+    eccAnom = anomaly.M2E(M,e,E0=E0)
     
     # With the eccentric anomaly, we can solve for position and velocity
     # in the local orbital frame, using the polar equation for an ellipse.
@@ -105,3 +107,67 @@ def posvel(a, e, i, w, R, M):
     
     # Position vector 1x3 (km), velocity vetor 1x3 (km/s), true anomaly (rad)
     return pos, vel, nu
+
+
+###############################################################################
+###############################################################################
+
+def posvel_vec(a, e, i, w, R, M):
+    '''Vectorised counterpart of posvel(), where all six osculating Keplerian
+    orbit elements may be NumPy arrays that broadcast against each other. The
+    3-1-3 Euler angle rotation is expanded in closed form instead of building
+    a DCM for every sample.
+    
+    Parameters
+    ----------
+    a : float or numpy.ndarray
+        Semi-major axis (km)
+    e : float or numpy.ndarray
+        Eccentricity (unit-less)
+    i : float or numpy.ndarray
+        Inclination (rad)
+    w : float or numpy.ndarray
+        Argument of Perigee (rad)
+    R : float or numpy.ndarray
+        Right Angle of Asc Node (rad)
+    M : float or numpy.ndarray
+        Mean Anomaly (rad)
+
+    Returns
+    -------
+    pos : numpy.ndarray
+        Inertial position vectors (...x3 array, km)
+    vel : numpy.ndarray
+        Inertial velocity vectors (...x3 array, km/s)
+    nu  : numpy.ndarray
+        True anomalies (rad)
+    
+    '''
+    
+    # Ensure the conversion of the attractor's gravitational constant.
+    mu = 398600.44 # G * Earth Mass (km**3/s**2)
+    
+    # Position and velocity in the local orbital frame, as in posvel().
+    eccAnom = anomaly.M2E(M,e)
+    pos_X = a * ( np.cos(eccAnom) - e)
+    pos_Y = a * np.sqrt( 1 - e**2 ) * np.sin(eccAnom)
+    pos_norm = np.sqrt( pos_X**2 + pos_Y**2 )
+    vel_const = np.sqrt( mu * a ) / pos_norm
+    vel_X = vel_const * ( -1 * np.sin(eccAnom) )
+    vel_Y = vel_const * ( np.sqrt( 1 - e**2 ) * np.cos(eccAnom) )
+    
+    # First two columns of DCM_NH = transpose( dcmZ(w) * dcmX(i) * dcmZ(R) ),
+    # i.e. the perifocal P and Q unit vectors expressed in the ECI frame.
+    cw, sw = np.cos(w), np.sin(w)
+    ci, si = np.cos(i), np.sin(i)
+    cR, sR = np.cos(R), np.sin(R)
+    P = np.stack([ cR*cw - sR*ci*sw, sR*cw + cR*ci*sw, si*sw ], axis=-1)
+    Q = np.stack([ -cR*sw - sR*ci*cw, -sR*sw + cR*ci*cw, si*cw ], axis=-1)
+    
+    pos = ( pos_X[...,None] * P ) + ( pos_Y[...,None] * Q )
+    vel = ( vel_X[...,None] * P ) + ( vel_Y[...,None] * Q )
+    
+    # Finally, let us not forget to compute the true anomaly.
+    nu = np.arctan2( pos_Y, pos_X )
+    
+    return pos, vel, nu
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the streaming (online) reducers, which compute      ##
+##    summary statistics of the relative trajectory in a single pass with    ##
+##    O(1) memory, without storing the full relative ephemeris. Reducers     ##
+##    ingest windows of samples through update(), and partial results from   ##
+##    chunked or parallel runs can be combined through merge().              ##
+##                                                                           ##
+##    All reducers reduce over the last axis of their inputs, so a batch of  ##
+##    P deputies evaluated as PxN arrays yields P independent statistics.    ##
+##                                                                           ##
+##    KEY REFERENCES:                                                        ##
+##                                                                           ##
+##   [1] Welford, B. P. (1962). Note on a method for calculating corrected   ##
+##       sums of squares and products. Technometrics, 4(3), 419-420.         ##
+##       doi:10.1080/00401706.1962.10490022                                  ##
+##                                                                           ##
+##   [2] Chan, T. F., Golub, G. H., LeVeque, R. J. (1979). Updating          ##
+##       formulae and a pairwise algorithm for computing sample variances.   ##
+##       Technical Report STAN-CS-79-773, Stanford University.               ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 11:00 AM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 11:00 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from source import chunked
+from source import formation
+
+###############################################################################
+###############################################################################
+
+class MinMax():
+
+    '''Running minimum and maximum of a stream of samples.
+
+    Attributes
+    ----------
+    min : numpy.ndarray or None
+        Running minimum (None until the first update)
+    max : numpy.ndarray or None
+        Running maximum (None until the first update)
+    '''
+
+    def __init__(self):
+        self.min = None
+        self.max = None
+
+    def update(self, x):
+        '''Ingests a window of samples x (reduced over the last axis).'''
+        x = np.asarray(x)
+        if x.shape[-1] == 0:
+            return None
+        self._combine( np.min( x, axis = -1 ), np.max( x, axis = -1 ) )
+        return None
+
+    def merge(self, other):
+        '''Merges the partial result of another MinMax into this one.'''
+        if other.min is not None:
+            self._combine( other.min, other.max )
+        return self
+
+    def _combine(self, lo, hi):
+        if self.min is None:
+            self.min, self.max = lo, hi
+        else:
+            self.min = np.minimum( self.min, lo )
+            self.max = np.maximum( self.max, hi )
+
+###############################################################################
+###############################################################################
+
+class Welford():
+
+    '''Running count, mean and variance of a stream of samples, using the
+    Welford update generalised to whole windows by Chan et al., so that both
+    update() and merge() are numerically stable.
+
+    Attributes
+    ----------
+    count : int
+        Number of samples ingested
+    mean : numpy.ndarray or float
+        Running mean
+    m2 : numpy.ndarray or float
+        Running sum of squared deviations from the mean
+    '''
+
+    def __init__(self):
+        self.count = 0
+        self.mean  = 0.0
+        self.m2    = 0.0
+
+    def update(self, x):
+        '''Ingests a window of samples x (reduced over the last axis).'''
+        x = np.asarray(x)
+        if x.shape[-1] == 0:
+            return None
+        mean = np.mean( x, axis = -1 )
+        m2 = np.sum( ( x - np.expand_dims( mean, -1 ) )**2, axis = -1 )
+        self._combine( x.shape[-1], mean, m2 )
+        return None
+
+    def merge(self, other):
+        '''Merges the partial result of another Welford into this one.'''
+        if other.count > 0:
+            self._combine( other.count, other.mean, other.m2 )
+        return self
+
+    def _combine(self, nb, mb, m2b):
+        na = self.count
+        n  = na + nb
+        delta = mb - self.mean
+        self.mean  = self.mean + ( delta * nb / n )
+        self.m2    = self.m2 + m2b + ( delta**2 * na * nb / n )
+        self.count = n
+
+    @property
+    def variance(self):
+        '''Population variance of all ingested samples.'''
+        return self.m2 / self.count if self.count > 0 else np.nan
+
+    @property
+    def std(self):
+        '''Population standard deviation of all ingested samples.'''
+        return np.sqrt( self.variance )
+
+###############################################################################
+###############################################################################
+
+class Separation():
+
+    '''Separation statistics of the relative trajectory: the minimum, maximum
+    and mean range, the minimum radial/cross-track separation, and the RIC
+    envelope extents. It ingests the relative states of formation.states()
+    or formation.propagate() window by window.
+
+    Methods
+    -------
+    update( self, rpx, rpy, rpz, rvx, rvy, rvz )
+        Ingests a window of relative states.
+    merge( self, other )
+        Merges the partial result of another Separation into this one.
+    result( self )
+        Returns a dictionary of the current separation statistics.
+    '''
+
+    def __init__(self):
+        self.range = MinMax()     # Range to the chief (km)
+        self.rstat = Welford()    # Mean and variance of the range (km)
+        self.rc    = MinMax()     # Radial/cross-track separation (km)
+        self.R     = MinMax()     # Radial envelope (km)
+        self.I     = MinMax()     # In-track envelope (km)
+        self.C     = MinMax()     # Cross-track envelope (km)
+
+    def update(self, rpx, rpy, rpz, rvx = None, rvy = None, rvz = None):
+        '''Ingests a window of relative states (velocities are unused).'''
+        rng = np.sqrt( rpx**2 + rpy**2 + rpz**2 )
+        self.range.update( rng )
+        self.rstat.update( rng )
+        self.rc.update( np.sqrt( rpx**2 + rpz**2 ) )
+        self.R.update( rpx )
+        self.I.update( rpy )
+        self.C.update( rpz )
+        return None
+
+    def merge(self, other):
+        '''Merges the partial result of another Separation into this one.'''
+        self.range.merge( other.range )
+        self.rstat.merge( other.rstat )
+        self.rc.merge( other.rc )
+        self.R.merge( other.R )
+        self.I.merge( other.I )
+        self.C.merge( other.C )
+        return self
+
+    def result(self):
+        '''Returns the separation statistics as a dictionary (km).'''
+        return { 'range_min'    : self.range.min,
+                 'range_max'    : self.range.max,
+                 'range_mean'   : self.rstat.mean,
+                 'range_std'    : self.rstat.std,
+                 'rc_min'       : self.rc.min,
+                 'radial_min'   : self.R.min,
+                 'radial_max'   : self.R.max,
+                 'intrack_min'  : self.I.min,
+                 'intrack_max'  : self.I.max,
+                 'crosstrk_min' : self.C.min,
+                 'crosstrk_max' : self.C.max }
+
+###############################################################################
+###############################################################################
+
+def reduce(td, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD,
+           reducers = None, chunk = 100000):
+    '''Propagates the relative orbit window by window, feeding every window
+    into the reducers without storing the trajectory.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    aC, eC, iC, wC, RC, MC : float or numpy.ndarray
+        Chief Orbit Keplerian elements (km and deg)
+    aD, eD, iD, wD, RD, MD : float or numpy.ndarray
+        Deputy Orbit Keplerian elements (km and deg)
+    reducers : list, optional
+        Reducers with an update(rpx, rpy, rpz, rvx, rvy, rvz) method. The
+        default is a single Separation() reducer.
+    chunk : int, optional
+        Number of samples per window. The default is 100000.
+
+    Returns
+    -------
+    reducers : list
+        The same reducers, after ingesting the entire scenario.
+
+    '''
+
+    if reducers is None:
+        reducers = [ Separation() ]
+
+    for t in chunked.windows( td, ts, chunk ):
+        relative = formation.states( t, ts, aC, eC, iC, wC, RC, MC,
+                                            aD, eD, iD, wD, RD, MD )
+        for reducer in reducers:
+            reducer.update( *relative )
+
+    return reducers
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the headless renderer, which draws the same 3-D     ##
+##    relative orbit plots as RunGUI.run() to image files (PNG, SVG, or any  ##
+##    format known to matplotlib, chosen by the file extension), using the   ##
+##    Agg canvas directly so that no display or GUI backend is needed.       ##
+##                                                                           ##
+##    Scenario figures and animation frames are rendered on a process pool. ##
+##    Each worker propagates its scenario once, builds a single figure, and  ##
+##    re-uses it for all of its frames by moving only the deputy marker.     ##
+##                                                                           ##
+##    Example:                                                               ##
+##                                                                           ##
+##    >> chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )                   ##
+##    >> geometry = ( 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )                      ##
+##    >> render.plot( 'orbit.svg', 86400, 1, chief, geometry )               ##
+##    >> render.frames( 'frames', 86400, 1, chief, geometry, count = 1000 )  ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 22:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 22:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from source import decimate
+from source import deputy
+from source import formation
+
+###############################################################################
+###############################################################################
+
+def ephemeris(td, ts, chief, geometry):
+    '''Designs the deputy and returns the 6xN relative ephemeris (rows rpx,
+    rpy, rpz, rvx, rvy, rvz) of a scenario, sampled as in RunGUI.run().
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    chief : tuple
+        Chief elements (a, e, i, w, R, M) in km and deg
+    geometry : tuple
+        Formation geometry (fR, fI, fO, fC, fPhi, fTht) in km and deg
+    '''
+    D = deputy.deputy( td, ts, *chief, *geometry )
+    t = np.arange( 0, td, ts, dtype = float )
+    return np.array( formation.states( t, ts, *chief, *D ) )
+
+###############################################################################
+###############################################################################
+
+def figure(eph, size = (6,5), dpi = 100, buckets = 2000):
+    '''Builds the 3-D relative orbit figure of an ephemeris, with the same
+    axes, labels, equal scaling and chief triad as RunGUI.run().
+
+    Returns
+    -------
+    fig : matplotlib.figure.Figure
+        Figure attached to an Agg canvas, ready for savefig()
+    mark : mpl_toolkits.mplot3d.art3d.Line3D
+        Deputy marker, initially at the first sample. Move it with
+        mark.set_data_3d() to render animation frames.
+    '''
+
+    fig = Figure( figsize = size, dpi = dpi )
+    FigureCanvasAgg( fig )
+    ax = fig.add_subplot( projection = '3d' )
+    ax.set_xlabel('Hill Frame Cross-Track Axis (km)')
+    ax.set_ylabel('Hill Frame In-Track Axis (km)')
+    ax.set_zlabel('Hill Frame Radial Axis (km)')
+
+    # Plot the (decimated) relative orbit, and the initial deputy position.
+    rpx, rpy, rpz = eph[0], eph[1], eph[2]
+    keep = decimate.minmax( rpz, rpy, rpx, buckets )
+    line, = ax.plot( rpz[keep], rpy[keep], rpx[keep],
+                     label='Relative Orbit in Hill-Frame' )
+    mark, = ax.plot( rpz[:1], rpy[:1], rpx[:1], 'o',
+                     color=line.get_color() )
+
+    # Scale all axes equally, and plot the chief as a tri-axial quiver.
+    span = max( np.max( np.abs( eph[:3] ) ), 1.0E-9 ) * 1.05
+    ax.set_xlim( -1 * span, span )
+    ax.set_ylim( -1 * span, span )
+    ax.set_zlim( -1 * span, span )
+    for u in np.eye(3):
+        ax.quiver( 0,0,0,*u, length = span * 0.2,
+                   color = 'r', arrow_length_ratio=0.3 )
+
+    return fig, mark
+
+###############################################################################
+###############################################################################
+
+def plot(path, td, ts, chief, geometry, size = (6,5), dpi = 100):
+    '''Renders the relative orbit plot of one scenario to the file `path`,
+    whose extension sets the format (e.g. '.png' or '.svg').'''
+    fig, _ = figure( ephemeris( td, ts, chief, geometry ), size, dpi )
+    fig.savefig( path )
+    return path
+
+def _frames(paths, td, ts, chief, geometry, ks, size, dpi):
+    '''Worker of frames(): renders the frames at samples ks to paths.'''
+    eph = ephemeris( td, ts, chief, geometry )
+    fig, mark = figure( eph, size, dpi )
+    for path, k in zip( paths, ks ):
+        mark.set_data_3d( eph[2,k:k+1], eph[1,k:k+1], eph[0,k:k+1] )
+        fig.savefig( path )
+    return paths
+
+###############################################################################
+###############################################################################
+
+def frames(directory, td, ts, chief, geometry, count = 100, fmt = 'png',
+           size = (6,5), dpi = 100, workers = None):
+    '''Renders an animation of the deputy moving along its relative orbit,
+    as `count` frames evenly spaced in time, named frame_000000.png, etc.
+
+    Parameters
+    ----------
+    directory : str
+        Output directory, created if it does not exist
+    td, ts, chief, geometry
+        Scenario, as in ephemeris()
+    count : int, optional
+        Number of frames. The default is 100.
+    fmt : str, optional
+        File format extension. The default is 'png'.
+    size, dpi : optional
+        Figure size (inches) and resolution of every frame.
+    workers : int, optional
+        Number of worker processes. None uses all CPUs, and 1 renders all
+        frames serially in the current process.
+
+    Returns
+    -------
+    paths : list
+        Paths of the rendered frames, in order.
+    '''
+
+    os.makedirs( directory, exist_ok = True )
+    N = len( np.arange( 0, td, ts ) )
+    ks = np.linspace( 0, N - 1, count ).astype(int)
+    paths = [ os.path.join( directory, 'frame_{:06d}.{}'.format( n, fmt ) )
+              for n in range( count ) ]
+
+    # Contiguous blocks of frames, a few per worker for load balancing.
+    blocks = max( 1, min( count, 4 * ( workers or os.cpu_count() or 1 ) ) )
+    edges = np.linspace( 0, count, blocks + 1 ).astype(int)
+    args = [ ( paths[a:b], td, ts, chief, geometry, ks[a:b], size, dpi )
+             for a, b in zip( edges[:-1], edges[1:] ) if b > a ]
+
+    if workers == 1:
+        for a in args:
+            _frames( *a )
+    else:
+        with ProcessPoolExecutor( max_workers = workers ) as pool:
+            list( pool.map( _frames, *zip( *args ) ) )
+
+    return paths
+
+def batch(directory, scenarios, fmt = 'png', size = (6,5), dpi = 100,
+          workers = None):
+    '''Renders the relative orbit plots of many scenarios in parallel.
+
+    Parameters
+    ----------
+    directory : str
+        Output directory, created if it does not exist
+    scenarios : list
+        List of dictionaries with keys 'td', 'ts', 'chief' and 'geometry'
+        (as in ephemeris()), and optionally 'name' for the file name. The
+        default name is scenario_000000, etc.
+    fmt : str, optional
+        File format extension. The default is 'png'.
+    size, dpi : optional
+        Figure size (inches) and resolution.
+    workers : int, optional
+        Number of worker processes. None uses all CPUs, and 1 renders all
+        scenarios serially in the current process.
+
+    Returns
+    -------
+    paths : list
+        Paths of the rendered figures, in the order of the scenarios.
+    '''
+
+    os.makedirs( directory, exist_ok = True )
+    args = []
+    for n, s in enumerate( scenarios ):
+        name = s.get( 'name', 'scenario_{:06d}'.format( n ) )
+        path = os.path.join( directory, name + '.' + fmt )
+        args.append( ( path, s['td'], s['ts'], s['chief'], s['geometry'],
+                       size, dpi ) )
+
+    if workers == 1:
+        return [ plot( *a ) for a in args ]
+    with ProcessPoolExecutor( max_workers = workers ) as pool:
+        return list( pool.map( plot, *zip( *args ),
+                               chunksize = max( 1, len(args) // 64 ) ) )
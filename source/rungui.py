@@ -21,19 +21,31 @@
 ###############################################################################
 ###############################################################################
 
-# Import global libraries
+# Import global libraries. Matplotlib is imported in the background while
+# the window is created, and PIL only if Tk cannot read the logo itself.
+import threading
 import numpy as np
 import tkinter as tk
 import tkinter.font
-from PIL import Image, ImageTk
+import tkinter.messagebox
 from os.path import dirname, abspath, join
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
 
 # Import the local libraries
-from source import deputy
-from source import formation
+from source import chunked
+from source import decimate
+from source import config
+from source import instrument
+from source import pipeline
+from source import watch
+
+
+def _import_plotting():
+    '''Imports the plotting libraries, so that they are cached in
+    sys.modules by the time RunGUI.plot_build() needs them.'''
+    import matplotlib.figure
+    import matplotlib.backends.backend_tkagg
+    import mpl_toolkits.mplot3d
+    return None
 
 
 class RunGUI():
@@ -52,11 +64,49 @@ class RunGUI():
         This method does two things. First, this method checks that all inputs
         in the GUI are correct. Second, it copies the GUI parameters into the
         config.txt file, overwriting it.
+    cfg_vars( self )
+        Returns the TKinter variables of the inputs, in config.keys order.
+    cfg_check( self, inputs )
+        Checks the inputs with the config.py rules, and marks bad entries.
     clr( self )
         Clears all existing relative orbit plots in the QLUSTER GUI.
+    plot_build( self, wait = False )
+        Builds the figures once the plotting libraries have been imported.
     run( self )
         Run the QLUSTER program using the leorun.py script and plots the
         relative trajectory.
+    ins_toggle( self )
+        Enables or disables the timing instrumentation from the check box.
+    timings( self )
+        Shows the instrumentation spans and counters of the previous runs.
+    live_schedule( self )
+        Schedules a throttled live re-propagation after a slider change.
+    live_update( self )
+        Re-propagates and updates the live trajectory line in place.
+    plot_run( self, rpx, rpy, rpz )
+        Adds a relative orbit overlay, recycling the oldest beyond the cap.
+    plot_limits( self )
+        Scales the axes equally to fit all overlays and updates the triad.
+    lod_check( self, event )
+        Schedules a decimation refinement when the axes limits change.
+    lod_refine( self )
+        Re-decimates the plotted overlays for the current view box.
+    prj_update( self )
+        Updates the 2-D RIC projections from the last run's ephemeris.
+    prj_capture( self, event )
+        Caches the projection backgrounds after each full draw.
+    prj_cursor( self, k )
+        Blits the projection time cursors to sample k.
+    anim_toggle( self )
+        Starts or pauses the time-cursor playback of the deputy.
+    watch_toggle( self )
+        Starts or stops watching config.txt for changes.
+    watch_poll( self )
+        Re-loads and re-runs QLUSTER when config.txt has changed.
+    anim_capture( self, event )
+        Caches the 3-D view background after each full draw.
+    anim_step( self )
+        Blits the deputy markers for one frame and schedules the next.
     '''
     
     def __init__(self, master):
@@ -71,6 +121,7 @@ class RunGUI():
         '''
         
         # Create the main frame and window.
+        self.master = master
         master.title('QLUSTER v0.1')
         master.geometry('1600x1200')
         
@@ -151,9 +202,13 @@ class RunGUI():
         qluster_logo = dirname(dirname(abspath(__file__)))
         qluster_logo = join(qluster_logo, 'gui', 'qluster_logo.png')
         
-        # Configure the background image and load the logo.
-        image = Image.open( qluster_logo )
-        photo = ImageTk.PhotoImage(image)
+        # Configure the background image and load the logo, natively with
+        # Tk (8.6 reads PNG files), falling back to PIL for older Tk builds.
+        try:
+            photo = tk.PhotoImage(file=qluster_logo)
+        except tk.TclError:
+            from PIL import Image, ImageTk
+            photo = ImageTk.PhotoImage(Image.open( qluster_logo ))
         self.logo = tk.Label(image=photo)
         self.logo.image = photo
         self.logo.grid(row=0, column=0, padx=20, pady=20, columnspan=4)
@@ -191,6 +246,18 @@ class RunGUI():
         self.runBtn.grid(row=0, column=8, padx=20, pady=5)
         self.runBtn.configure(bg="light blue")
         
+        # Add a check box to enable the timing instrumentation.
+        self.var_ins = tk.BooleanVar(value=instrument.enabled)
+        self.insChk = tk.Checkbutton(master, text='Instrument',
+                                     variable=self.var_ins,
+                                     command=self.ins_toggle)
+        self.insChk.grid(row=0, column=9, padx=5, pady=5)
+        
+        # Add a button to show the timings of the previous runs.
+        self.insBtn = tk.Button(master, text='Timings', command=self.timings)
+        self.insBtn.grid(row=0, column=10, padx=20, pady=5)
+        self.insBtn.configure(bg="light blue")
+        
         #####################################################################
         #####################################################################
         ###                                                               ###
@@ -452,9 +519,164 @@ class RunGUI():
         self.toolbarFrame.grid(row=1, column=4, padx=20, pady=10,
                                columnspan=5, rowspan=20)
         
+        # The figures are built by plot_build() once the window is shown,
+        # while the plotting libraries are imported in the background.
+        self.orbAxis = None
+        self.plot_thread = threading.Thread(target=_import_plotting,
+                                            daemon=True)
+        self.plot_thread.start()
+        master.after(20, self.plot_build)
+
+        #####################################################################
+        #####################################################################
+        ###                                                               ###
+        ###    Live mode: re-propagate whenever a formation slider moves    ###
+        ###                                                               ###
+        #####################################################################
+        #####################################################################
+
+        # Add a check box to re-propagate live while dragging the sliders.
+        self.var_live = tk.BooleanVar(value=False)
+        self.liveChk = tk.Checkbutton(master, text='Live Slider Updates',
+                                      variable=self.var_live,
+                                      command=self.live_schedule)
+        self.liveChk.grid(row=19, column=0, padx=40, pady=2, sticky='w')
+
+        # Add a check box to watch config.txt, and re-run when it changes.
+        self.var_watch = tk.BooleanVar(value=False)
+        self.watchChk = tk.Checkbutton(master, text='Watch config.txt',
+                                       variable=self.var_watch,
+                                       command=self.watch_toggle)
+        self.watchChk.grid(row=19, column=1, padx=5, pady=2,
+                           columnspan=2, sticky='w')
+        self.watcher = None
+        self.watch_job = None
+        self.watch_interval = 200 # Polling interval (ms)
+        
+        # The live trajectory is a single line artist, updated in place, and
+        # re-propagations are throttled to at most one per delay below (ms).
+        self.live_line  = None
+        self.live_job   = None
+        self.live_delay = 25
+
+        # Cap on the number of overlaid runs kept visible in the plot; older
+        # runs are recycled (see plot_run) rather than piling up artists.
+        self.var_hist = tk.IntVar(value=5)
+        self.label_hist = tk.Label(master, text='Overlay History Cap')
+        self.label_hist.grid(row=20, column=0, padx=40, pady=2, sticky='w')
+        self.entry_hist = tk.Spinbox(master, from_=1, to=50, width=8,
+                                     textvariable=self.var_hist)
+        self.entry_hist.grid(row=20, column=1, padx=5, pady=2, sticky='w')
+        self.plot_hist  = [] # List of (line, marker) of the visible runs
+        self.plot_triad = [] # Quivers of the chief triad
+        self.plot_span  = 0.0 # Axes span at which the triad was drawn
+        self.plot_full  = {} # Full-resolution data of each overlay line
+        
+        # Level-of-detail decimation of the plotted lines (see decimate.py),
+        # refined for the axes limits after every zoom.
+        self.lod_buckets = 2000
+        self.lod_lims = None
+        self.lod_job = None
+        
+        #####################################################################
+        #####################################################################
+        ###                                                               ###
+        ###     2-D projections of the relative orbit (see plot_build),   ###
+        ###     which share the ephemeris buffer of the last run          ###
+        ###                                                               ###
+        #####################################################################
+        #####################################################################
+        
+        # Incremental pipelines of the runs and of the live slider updates.
+        self.pipeline = pipeline.Pipeline()
+        self.live_pipeline = pipeline.Pipeline()
+        
+        # Relative ephemeris buffer (6xN rows rpx, rpy, rpz, rvx, rvy, rvz),
+        # the cached blitting backgrounds, and the current cursor sample.
+        self.eph = np.zeros((6,0))
+        self.prjBackground = None
+        self.prjIndex = None
+        
+        #####################################################################
+        #####################################################################
+        ###                                                               ###
+        ###    Time-cursor playback of the deputy along its relative      ###
+        ###    orbit, blitted in the 3-D view and the 2-D projections     ###
+        ###                                                               ###
+        #####################################################################
+        #####################################################################
+        
+        # Play/pause button, and the playback speed in samples per frame.
+        self.animBtn = tk.Button(master, text='Play', width=8,
+                                 command=self.anim_toggle)
+        self.animBtn.grid(row=21, column=0, padx=40, pady=2, sticky='w')
+        self.var_speed = tk.IntVar(value=10)
+        self.scale_speed = tk.Scale(master, from_=1, to=500, length=150,
+                                    orient=tk.HORIZONTAL,
+                                    label='Samples per Frame',
+                                    variable=self.var_speed)
+        self.scale_speed.grid(row=21, column=1, padx=5, pady=2,
+                              columnspan=2, sticky='w')
+        
+        # Cached 3-D background for blitting, and the playback state.
+        self.anim_background = None
+        self.anim_job = None
+        self.anim_k = 0
+        self.anim_frame = 30 # Frame interval (ms)
+        
+        # Schedule a live update whenever a formation parameter changes.
+        for var in [self.var_fR, self.var_fI, self.var_fO, self.var_fC,
+                    self.var_fPhi, self.var_fTht]:
+            var.trace("w", lambda name, index, mode: self.live_schedule())
+
+        #####################################################################
+        #####################################################################
+        ###                                                               ###
+        ###    Finally, define string containers for error and warning    ###
+        ###    messages to inform the user if input conditions violate    ###
+        ###               formatting or physical principles.              ###
+        ###                                                               ###
+        #####################################################################
+        #####################################################################
+        
+        self.error_msgprint = '' # Error message to print
+        self.cfg_scenario = config.default # Scenario of config.txt in use
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###    Deferred construction of the figures, after the window shows.  ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def plot_build(self, wait = False):
+        
+        '''
+        Builds the 3-D relative orbit figure, its toolbar and the 2-D
+        projections. This is scheduled right after the window is created,
+        and re-schedules itself until the background import of the plotting
+        libraries is done, so the GUI stays responsive at startup. With
+        wait=True it blocks until the import is done instead, and it does
+        nothing if the figures already exist.
+        '''
+        
+        if self.orbAxis is not None:
+            return None
+        if self.plot_thread.is_alive():
+            if not wait:
+                self.master.after(20, self.plot_build)
+                return None
+            self.plot_thread.join()
+        
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+        
         # Create the 3D axes matplotlib figure object, using the pack() method
         # of tkinter within the toolbarFrame object.
-        self.orbFig = Figure(figsize=(6,5), dpi = master.winfo_fpixels('2.0c'),
+        dpi = self.master.winfo_fpixels('2.0c')
+        self.orbFig = Figure(figsize=(6,5), dpi = dpi,
                              linewidth=8, edgecolor="#DDDDDD")
         # self.orbFig.set_tight_layout(True)
         self.orbPlot = FigureCanvasTkAgg(self.orbFig, self.toolbarFrame)
@@ -475,17 +697,44 @@ class RunGUI():
         self.toolbar = NavigationToolbar2Tk(self.orbPlot, self.toolbarFrame)
         self.toolbar.update()
         
-        #####################################################################
-        #####################################################################
-        ###                                                               ###
-        ###    Finally, define string containers for error and warning    ###
-        ###    messages to inform the user if input conditions violate    ###
-        ###               formatting or physical principles.              ###
-        ###                                                               ###
-        #####################################################################
-        #####################################################################
+        # Refine the level-of-detail decimation after every zoom.
+        self.orbPlot.mpl_connect('draw_event', self.lod_check)
+        
+        # Figure with the radial/in-track, radial/cross-track and in-track/
+        # cross-track projections, packed under the navigation toolbar.
+        self.prjFig = Figure(figsize=(6,2), dpi = dpi)
+        self.prjPlot = FigureCanvasTkAgg(self.prjFig, self.toolbarFrame)
+        self.prjPlot.get_tk_widget().pack(expand=True)
+        self.prjAxes = self.prjFig.subplots(1, 3)
+        
+        # Each panel is (axes, horizontal row, vertical row) of self.eph.
+        self.prjCols = [ ( self.prjAxes[0], 1, 0 ),   # In-Track vs Radial
+                         ( self.prjAxes[1], 2, 0 ),   # Cross-Track vs Radial
+                         ( self.prjAxes[2], 2, 1 ) ]  # Cross-Track vs In-Track
+        prjNames = ['Radial (km)', 'In-Track (km)', 'Cross-Track (km)']
+        self.prjLines = []
+        self.prjCursors = []
+        for ax, h, v in self.prjCols:
+            ax.set_xlabel( prjNames[h], fontsize=7 )
+            ax.set_ylabel( prjNames[v], fontsize=7 )
+            ax.tick_params( labelsize=6 )
+            self.prjLines.append( ax.plot( [], [], lw=1 )[0] )
+            
+            # The time cursors are animated, so they are excluded from full
+            # canvas draws and are only ever blitted (see prj_cursor).
+            self.prjCursors.append( ax.plot( [], [], 'o', color='r',
+                                             animated=True )[0] )
+        self.prjFig.tight_layout()
         
-        self.error_msgprint = '' # Error message to print
+        self.prjPlot.mpl_connect('draw_event', self.prj_capture)
+        
+        # The 3-D deputy marker is animated, so it is only ever blitted onto
+        # the background cached after each full draw (see anim_capture).
+        self.anim_mark, = self.orbAxis.plot( [], [], [], 'o', color='r',
+                                             animated=True )
+        self.orbPlot.mpl_connect('draw_event', self.anim_capture)
+        
+        return None
     
     #########################################################################
     #########################################################################
@@ -505,12 +754,6 @@ class RunGUI():
         
         cwd = dirname(dirname(abspath(__file__))) # Current working directory
         iwd = join(cwd, 'config', 'config.txt') # Inputs files
-        inputfile = open(iwd,'r') # Open the config.txt file
-        inps = {} # Create a dictionary to store all the input 
-        integers = ['duration', 'timestep']
-        floats = ['orb_a',  'orb_e',  'orb_i',  'orb_w',  'orb_R',  'orb_M',
-                  'form_R', 'form_I', 'form_O', 'form_C',
-                  'form_phi', 'form_tht']
         
         #####################################################################
         #####################################################################
@@ -520,43 +763,25 @@ class RunGUI():
         #####################################################################
         #####################################################################
         
-        # Now we parse through the config.txt file.
-        for line in inputfile:
-            
-            # Check for input entry with an 'I', then split and format.
-            if line[0] == 'I':
-                line_inp = line[3:].split()
-                
-                # Now, let's try to parse parameters meant to be integers.
-                if line_inp[0] in integers:
-                    
-                    try:
-                        inps[ line_inp[0] ] = int(line_inp[1])
-                    except ValueError:
-                        errmsg = 'Error, expected an integer when reading '
-                        errmsg = errmsg + line_inp[0] + ' in config.txt! \n'
-                        print(errmsg)
-                        self.error_msgprint += errmsg
-                        inps[ line_inp[0] ] = 0
-                
-                # then we parse parameters meant to be floats.
-                elif line_inp[0] in floats:
-                    
-                    try:
-                        inps[ line_inp[0] ] = float(line_inp[1])
-                    except ValueError:
-                        errmsg = 'Error, expected a float when reading '
-                        errmsg = errmsg + line_inp[0] + ' in config.txt! \n'
-                        print(errmsg)
-                        self.error_msgprint += errmsg
-                        inps[ line_inp[0] ] = 0.0
-                        
-                # For all other parameters, just log them down as they are.
-                else:
-                    inps[ line_inp[0] ] = line_inp[1]
+        # Parse config.txt (cached by config.py), taking its first scenario,
+        # which is also the one saved by cfg_W(), or no inputs at all (all
+        # reported below) if it has no scenario.
+        scenarios = config.load(iwd)
+        self.cfg_scenario = next( iter( scenarios ), config.default )
+        inps = dict( scenarios.get( self.cfg_scenario, {} ) )
         
-        # Close the file when done
-        inputfile.close()
+        # Report the inputs that are missing or not numbers, reset to zero.
+        for key in config.keys:
+            if key not in inps or np.isnan( inps[key] ):
+                if key in config.integers:
+                    errmsg = 'Error, expected an integer when reading '
+                    inps[key] = 0
+                else:
+                    errmsg = 'Error, expected a float when reading '
+                    inps[key] = 0.0
+                errmsg = errmsg + key + ' in config.txt! \n'
+                print(errmsg)
+                self.error_msgprint += errmsg
         
         #####################################################################
         #####################################################################
@@ -566,226 +791,11 @@ class RunGUI():
         #####################################################################
         #####################################################################
         
-        # 0. Check for timing parameters in scenario
-        
-        self.var_td.set(inps['duration'])
-        if inps['duration'] <= 0:
-            errmsg = 'Scenario duration cannot be zero or negative! \n'
-            self.errtx_td.configure(text='!')
-        elif inps['duration'] > 31536000:
-            errmsg = 'Scenario duration cannot be longer than a year! \n'
-            self.errtx_td.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_td.configure(text='')
-        self.error_msgprint += errmsg
-        
-        self.var_ts.set(inps['timestep'])
-        if inps['timestep'] <= 0:
-            errmsg = 'Scenario step size cannot be zero or negative! \n'
-            self.errtx_ts.configure(text='!')
-        elif inps['timestep'] > inps['duration']:
-            errmsg = 'Scenario step cannot be larger than the duration! \n'
-            self.errtx_ts.configure(text='!')
-        elif inps['timestep'] > 31536000:
-            errmsg = 'Scenario step size cannot be longer than a year! \n'
-            self.errtx_ts.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_ts.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 1. Check for chief satellite semi-major axis
-        
-        self.var_aC.set(inps['orb_a'])
-        if inps['orb_a'] < 6378.14:
-            errmsg = 'Semi-major axis below Earth surface! \n'
-            self.errtx_aC.configure(text='!')
-        elif inps['orb_a'] > 385000.0:
-            errmsg = 'Semi-major axis beyond Earth orbit! \n'
-            self.errtx_aC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_aC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 2. Check for chief satellite eccentricity
-        
-        self.var_eC.set(inps['orb_e'])
-        if inps['orb_e'] < 0:
-            errmsg = 'Eccentricity cannot be < 0! \n'
-            self.errtx_eC.configure(text='!')
-        elif inps['orb_e'] >= 1.0:
-            errmsg = 'Eccentricity cannot be >= 1! \n'
-            self.errtx_eC.configure(text='!')
-        elif ( ( 1 - inps['orb_e'] ) * inps['orb_a'] ) < 6378.14:
-            errmsg = 'Perigee altitude below Earth surface! \n'
-            self.errtx_eC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_eC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 3. Check for chief satellite inclination angle
-        
-        self.var_iC.set(inps['orb_i'])
-        if inps['orb_i'] < -180.0 or inps['orb_i'] > 180.0:
-            errmsg = 'Inclination angle must be between +/- 180! \n'
-            self.errtx_iC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_iC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 4. Check for chief satellite argument of perigee.
-        
-        self.var_wC.set(inps['orb_w'])
-        if inps['orb_w'] < -180.0 or inps['orb_w'] > 180.0:
-            errmsg = 'Argument of Perigee must be between +/- 180! \n'
-            self.errtx_wC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_wC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 5. Check for chief satellite right ascensions of ascending node.
-        
-        self.var_RC.set(inps['orb_R'])
-        if inps['orb_R'] < -180.0 or inps['orb_R'] > 180.0:
-            errmsg = 'Right ascension must be between +/- 180! \n'
-            self.errtx_RC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_RC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 6. Check for chief satellite mean anomaly.
-        
-        self.var_MC.set(inps['orb_M'])
-        if inps['orb_M'] < -180.0 or inps['orb_M'] > 180.0:
-            errmsg = 'Mean anomaly must be between +/- 180! \n'
-            self.errtx_MC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_MC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 7. Check for deputy radial separation (km).
-        
-        self.var_fR.set(inps['form_R'])
-        if inps['form_R'] < 0:
-            errmsg = 'Radial separation cannot be negative! \n'
-            self.errtx_fR.configure(text='!')
-        elif inps['form_R'] > 1000.0:
-            errmsg = 'Radial separation cannot exceed 1000 km! \n'
-            self.errtx_fR.configure(text='!')
-        else:
-            if inps['form_R'] * 2 == inps['form_I']:
-                errmsg = ''
-                self.errtx_fR.configure(text='')
-            else:
-                errmsg = 'Radial separation must be half of in-track! \n'
-                self.errtx_fR.configure(text='Warning!')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 8. Check for deputy in-track separation (km).
-        
-        self.var_fI.set(inps['form_I'])
-        if inps['form_I'] < 0:
-            errmsg = 'In-track separation cannot be negative! \n'
-            self.errtx_fI.configure(text='!')
-        elif inps['form_I'] > 2000.0:
-            errmsg = 'In-track separation cannot exceed 2000 km! \n'
-            self.errtx_fI.configure(text='!')
-        else:
-            if inps['form_R'] * 2 == inps['form_I']:
-                errmsg = ''
-                self.errtx_fI.configure(text='')
-            else:
-                errmsg = 'In-track separation must be twice of radial! \n'
-                self.errtx_fI.configure(text='Warning!')
-        self.error_msgprint += errmsg
-        
-        self.var_fO.set(inps['form_O'])
-        if inps['form_O'] < -1000.0:
-            errmsg = 'In-track offset cannot be < -1000 km! \n'
-            self.errtx_fO.configure(text='!')
-        elif inps['form_O'] > 1000.0:
-            errmsg = 'In-track offset cannot be > 1000 km! \n'
-            self.errtx_fO.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_fO.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 9. Check for deputy cross-track separation (km).
-        
-        self.var_fC.set(inps['form_C'])
-        if inps['form_C'] < 0:
-            errmsg = 'Cross-track separation cannot be negative! \n'
-            self.errtx_fC.configure(text='!')
-        elif inps['form_C'] > 2000.0:
-            errmsg = 'Cross-track separation cannot exceed 2000 km! \n'
-            self.errtx_fC.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_fC.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 10. Check for Argument of Relative Pericenter (deg)
-        
-        self.var_fPhi.set(inps['form_phi'])
-        if inps['form_phi'] < -180.0 or inps['form_phi'] > 180.0:
-            errmsg = 'Relative Pericenter must be between +/- 180! \n'
-            self.errtx_fPhi.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_fPhi.configure(text='')
-        self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 11. Check for Argument of Latitude Crossing (deg)
-        
-        self.var_fTht.set(inps['form_tht'])
-        if inps['form_tht'] < -180.0 or inps['form_tht'] > 180.0:
-            errmsg = 'Latitude Crossing must be between +/- 180! \n'
-            self.errtx_fTht.configure(text='!')
-        else:
-            errmsg = ''
-            self.errtx_fTht.configure(text='')
-        self.error_msgprint += errmsg
+        # Copy the inputs into the GUI, and check them with the rules shared
+        # with config.validate() (see config.py).
+        for key, var in zip( config.keys, self.cfg_vars() ):
+            var.set( inps[key] )
+        self.cfg_check( inps )
         
         #####################################################################
         #####################################################################
@@ -821,308 +831,28 @@ class RunGUI():
         # Get the directory paths.
         cwd = dirname(dirname(abspath(__file__))) # Current working directory
         iwd = join(cwd, 'config', 'config.txt') # Inputs files
-        input_r = open(iwd,'r') # Open the config.txt file
-        record = [] # Array to record the strings
-        
-        # Variables to be recorded based on tkinter entries.
-        var_arr = [self.var_td, self.var_ts,
-                   self.var_aC, self.var_eC, self.var_iC,
-                   self.var_wC, self.var_RC, self.var_MC,
-                   self.var_fR, self.var_fI, self.var_fO, self.var_fC,
-                   self.var_fPhi, self.var_fTht]
-        
-        # Key values (to be referred).
-        key_arr = ['duration','timestep',
-                   'orb_a', 'orb_e', 'orb_i', 'orb_w', 'orb_R', 'orb_M', 
-                   'form_R', 'form_I', 'form_O', 'form_C',
-                   'form_phi', 'form_tht']
-        
-        #####################################################################
-        #####################################################################
-        
-        # 0. Check for timing parameters in scenario
-        
-        try:
-            _td = self.var_td.get() # Exception raised if entry is erroneous
-            if _td <= 0:
-                errmsg = 'Scenario duration cannot be zero or negative! \n'
-                self.errtx_td.configure(text='!')
-            elif _td > 31536000:
-                errmsg = 'Scenario duration cannot be longer than a year! \n'
-                self.errtx_td.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_td.configure(text='')
-        except:
-            _td = 86400
-            self.var_td.set(86400) # Reset to default 86400s (1 day)
-            errmsg = 'Expected an integer for scenario duration (s)! \n'
-        finally:
-            self.error_msgprint += errmsg
-            
-        try:
-            _ts = self.var_ts.get() # Exception raised if entry is erroneous
-            if _ts <= 0:
-                errmsg = 'Scenario step size cannot be zero or negative! \n'
-                self.errtx_ts.configure(text='!')
-            elif _ts > _td:
-                errmsg = 'Scenario step cannot be larger than the duration! \n'
-                self.errtx_ts.configure(text='!')
-            elif _ts > 31536000:
-                errmsg = 'Scenario step size cannot be longer than a year! \n'
-                self.errtx_ts.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_ts.configure(text='')
-        except:
-            _ts = 1
-            self.var_ts.set(1) # Reset to default 86400s (1 day)
-            errmsg = 'Expected an integer for scenario step size (s)! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 1. Check for chief satellite semi-major axis
-        try:
-            _aC = self.var_aC.get() # Exception raised if entry is erroneous
-            if _aC < 6378.14:
-                errmsg = 'Semi-major axis below Earth surface! \n'
-                self.errtx_aC.configure(text='!')
-            elif _aC > 385000.0:
-                errmsg = 'Semi-major axis beyond Earth orbit! \n'
-                self.errtx_aC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_aC.configure(text='')
-        except:
-            _aC = 0.0
-            self.var_aC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for Semi-Major Axis (km)! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 2. Check for chief satellite eccentricity
-        try:
-            _eC = self.var_eC.get() # Exception raised if entry is erroneous
-            if _eC < 0:
-                errmsg = 'Eccentricity cannot be < 0! \n'
-                self.errtx_eC.configure(text='!')
-            elif _eC >= 1.0:
-                errmsg = 'Eccentricity cannot be >= 1! \n'
-                self.errtx_eC.configure(text='!')
-            elif ( ( 1 - _eC ) * _aC ) < 6378.14:
-                errmsg = 'Perigee altitude below Earth surface! \n'
-                self.errtx_eC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_eC.configure(text='')
-        except:
-            self.var_eC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the eccentricity! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 3. Check for chief satellite inclination angle
-        try:
-            _iC = self.var_iC.get() # Exception raised if entry is erroneous
-            if _iC < -180.0 or _iC > 180.0:
-                errmsg = 'Inclination angle must be between +/- 180! \n'
-                self.errtx_iC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_iC.configure(text='')
-        except:
-            self.var_iC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the inclination! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 4. Check for chief satellite argument of perigee.
-        try:
-            _wC = self.var_wC.get() # Exception raised if entry is erroneous
-            if _wC < -180.0 or _wC > 180.0:
-                errmsg = 'Argument of Perigee must be between +/- 180! \n'
-                self.errtx_wC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_wC.configure(text='')
-        except:
-            self.var_wC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the argument of perigee! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 5. Check for chief satellite right ascensions of ascending node.
-        try:
-            _RC = self.var_RC.get() # Exception raised if entry is erroneous
-            if _RC < -180.0 or _RC > 180.0:
-                errmsg = 'Right ascension must be between +/- 180! \n'
-                self.errtx_RC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_RC.configure(text='')
-        except:
-            self.var_RC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the right ascension! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 6. Check for chief satellite mean anomaly.
-        try:
-            _MC = self.var_MC.get() # Exception raised if entry is erroneous
-            if _MC < -180.0 or _MC > 180.0:
-                errmsg = 'Mean anomaly must be between +/- 180! \n'
-                self.errtx_MC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_MC.configure(text='')
-        except:
-            self.var_MC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the mean anomaly! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 7. Check for deputy radial / in-track separation (km).
-        try:
-            _fR = self.var_fR.get() # Exception raised if entry is erroneous
-            _fI = self.var_fI.get() # Exception raised if entry is erroneous
-            if _fR < 0.0:
-                errmsg = 'Radial separation cannot be negative! \n'
-                self.errtx_fR.configure(text='!')
-            elif _fR > 1000.0:
-                errmsg = 'Radial separation cannot exceed 1000 km! \n'
-                self.errtx_fR.configure(text='!')
-            else:
-                if _fR * 2 == _fI:
-                    errmsg = ''
-                    self.errtx_fR.configure(text='')
-                else:
-                    errmsg = 'Radial separation must be half of in-track! \n'
-                    errmsg += 'Radial separation reset to half of in-track! \n'
-                    self.errtx_fR.configure(text='Warning!')
-                    self.var_fR.set( 0.5 * _fI )
-                    self.errtx_fR.configure(text='')
-        except:
-            self.var_fR.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the radial separation! \n'
-            errmsg += 'Expected a float for the in-track separation! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 8. Check for deputy in-track separation only (km).
-        try:
-            _fI = self.var_fI.get() # Exception raised if entry is erroneous
-            if _fI < 0.0:
-                errmsg = 'In-track separation cannot be negative! \n'
-                self.errtx_fI.configure(text='!')
-            elif _fI > 2000.0:
-                errmsg = 'In-track separation cannot exceed 2000 km! \n'
-                self.errtx_fI.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_fI.configure(text='')
-        except:
-            self.var_fI.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the in-track separation! \n'
-        finally:
-            self.error_msgprint += errmsg
-            
-        try:
-            _fO = self.var_fO.get() # Exception raised if entry is erroneous
-            if _fO < -1000.0:
-                errmsg = 'In-track offset cannot be < -1000 km! \n'
-                self.errtx_fO.configure(text='!')
-            elif _fO > 1000.0:
-                errmsg = 'In-track offset cannot be > 1000 km! \n'
-                self.errtx_fO.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_fO.configure(text='')
-        except:
-            self.var_fO.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the in-track offset! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 9. Check for deputy cross-track separation (km).
-        try:
-            _fC = self.var_fC.get() # Exception raised if entry is erroneous
-            if _fC < 0.0:
-                errmsg = 'Cross-track separation cannot be negative! \n'
-                self.errtx_fC.configure(text='!')
-            elif _fC > 2000.0:
-                errmsg = 'Cross-track separation cannot exceed 2000 km! \n'
-                self.errtx_fC.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_fC.configure(text='')
-        except:
-            self.var_fC.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for cross-track separation! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
-        
-        # 10. Check for Argument of Relative Pericenter (deg)
-        try:
-            _fPhi = self.var_fPhi.get() # Exception raised if entry is erroneous
-            if _fPhi < -180.0 or _fPhi > 180.0:
-                errmsg = 'Relative pericenter must be between +/- 180! \n'
-                self.errtx_fPhi.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_fPhi.configure(text='')
-        except:
-            self.var_fPhi.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the relative pericenter! \n'
-        finally:
-            self.error_msgprint += errmsg
-        
-        #####################################################################
-        #####################################################################
         
-        # 11. Check for Argument of Latitude Crossing (deg)
-        try:
-            _fTht = self.var_fTht.get() # Exception raised if entry is erroneous
-            if _fTht < -180.0 or _fTht > 180.0:
-                errmsg = 'Latitude crossing must be between +/- 180! \n'
-                self.errtx_fTht.configure(text='!')
-            else:
-                errmsg = ''
-                self.errtx_fTht.configure(text='')
-        except:
-            self.var_fTht.set(0.0) # Reset to default 0.0
-            errmsg = 'Expected a float for the latitude crossing! \n'
-        finally:
-            self.error_msgprint += errmsg
+        # Read the entries, resetting those that are not numbers to their
+        # defaults (1 day of 1 s steps, and zero for all others).
+        defaults = { 'duration' : 86400, 'timestep' : 1 }
+        inputs = {}
+        for key, var in zip( config.keys, self.cfg_vars() ):
+            try:
+                inputs[key] = var.get() # Exception raised if entry erroneous
+            except (tk.TclError, ValueError):
+                var.set( defaults.get( key, 0.0 ) )
+                inputs[key] = np.nan # Reported as invalid by cfg_check()
+        
+        # Check the entries with the rules shared with config.validate().
+        broken = [ keys for keys, message in self.cfg_check( inputs ) ]
+        
+        # Reset the radial separation to half of the in-track separation.
+        if ['form_R', 'form_I'] in broken:
+            if not np.isnan( inputs['form_I'] ):
+                self.var_fR.set( 0.5 * inputs['form_I'] )
+                self.errtx_fR.configure(text='')
+                self.error_msgprint += 'Radial separation reset to half ' \
+                                       'of in-track! \n'
         
         #####################################################################
         #####################################################################
@@ -1137,36 +867,57 @@ class RunGUI():
         # Else, if all the inputs are good, begin over-writing config.txt.
         else:
             
-            # Now we parse through the config.txt file.
-            for line in input_r:
-                
-                if line[0] == 'I':
-                    words = line.split() # Split string into list of words.
-                    key   = words[1] # Get the key from config.txt
-                    value = words[2] # Get the value from config.txt
-                    
-                    # Get the updated value based on the index from key list.
-                    value_new = str(var_arr[ key_arr.index(key) ].get())
-                    line_new  = line.replace(value, value_new)
-                
-                else:
-                    line_new = line
-                
-                # Now, record the entries.
-                record.append(line_new)
-            
-            # Close the file when done
-            input_r.close()
-            
-            # Now, we open and overwrite the config.txt file.
-            input_w = open(iwd,'w') # Open the config.txt file
-            
-            for text in record:
-                input_w.write(text)
-            
-            input_w.close()
+            # Update the values of the loaded scenario in config.txt, keeping
+            # its comments, and writing atomically (see config.py).
+            config.update( iwd, inputs, scenario = self.cfg_scenario )
             return None
     
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###   Checks of the inputs, with the rules shared with config.py.     ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def cfg_vars(self):
+        
+        '''
+        Returns the TKinter variables of the inputs, in the order of the
+        input keys in config.keys.
+        '''
+        
+        return [self.var_td, self.var_ts,
+                self.var_aC, self.var_eC, self.var_iC,
+                self.var_wC, self.var_RC, self.var_MC,
+                self.var_fR, self.var_fI, self.var_fO, self.var_fC,
+                self.var_fPhi, self.var_fTht]
+    
+    def cfg_check(self, inputs):
+        
+        '''
+        Checks a dictionary of inputs with the rules of config.check(), marks
+        the entries of the inputs that break a rule, and adds the messages of
+        the broken rules to the error message. Returns the broken rules.
+        '''
+        
+        labels = [self.errtx_td, self.errtx_ts,
+                  self.errtx_aC, self.errtx_eC, self.errtx_iC,
+                  self.errtx_wC, self.errtx_RC, self.errtx_MC,
+                  self.errtx_fR, self.errtx_fI, self.errtx_fO, self.errtx_fC,
+                  self.errtx_fPhi, self.errtx_fTht]
+        labels = dict( zip( config.keys, labels ) )
+        
+        for label in labels.values():
+            label.configure(text='')
+        broken = config.check( inputs )
+        for keys, message in broken:
+            for key in keys:
+                labels[key].configure(text='!')
+            self.error_msgprint += message + ' \n'
+        
+        return broken
+    
     #########################################################################
     #########################################################################
     ###                                                                   ###
@@ -1183,8 +934,14 @@ class RunGUI():
         
         try:
             
-            # Save the current inputs first.
+            # Make sure the figures exist, in case of a very early run.
+            self.plot_build( wait = True )
+            
+            # Save the current inputs first, without the watch mode picking
+            # up our own write as a change of config.txt.
             self.cfg_W()
+            if self.watcher is not None:
+                self.watcher.check()
             
             # Fetch the scenario time parameters.
             td = self.var_td.get()
@@ -1208,27 +965,25 @@ class RunGUI():
             fPhi = self.var_fPhi.get()
             fTht = self.var_fTht.get()
             
-            # Solve for the deputy satellite orbit elements.
-            aD, eD, iD, wD, RD, MD = deputy.deputy(td, ts,
-                                                   aC, eC, iC,
-                                                   wC, RC, MC,
-                                                   fR, fI, fO, fC,
-                                                   fPhi, fTht)
-            
-            # Perform the relative orbit propagation.
-            rpx, rpy, rpz, rvx, rvy, rvz = formation.propagate(td, ts,
-                                                               aC, eC, iC,
-                                                               wC, RC, MC,
-                                                               aD, eD, iD,
-                                                               wD, RD, MD)
+            # Solve for the deputy satellite orbit elements, and propagate
+            # the relative orbit, re-using every stage of the previous run
+            # whose inputs did not change (see pipeline.py).
+            inputs = [ td, ts, aC, eC, iC, wC, RC, MC,
+                       fR, fI, fO, fC, fPhi, fTht ]
+            with instrument.span('gui.propagate'):
+                done = self.pipeline.update( dict( zip( config.keys,
+                                                        inputs ) ) )
+            aD, eD, iD, wD, RD, MD = self.pipeline.deputy
             
-            # Save the relative trajectories as an attribute of the GUI.
-            self.rpx = rpx # Array for Radial Separations (km)
-            self.rpy = rpy # Array for In-Track Separations (km)
-            self.rpz = rpz # Array for Cross-Track Separations (km)
-            self.rvx = rvx # Array for Radial Rates (km/s)
-            self.rvy = rvy # Array for In-Track Rates (km/s)
-            self.rvz = rvz # Array for Cross-Track Rates (km/s)
+            # Save the relative trajectories as an attribute of the GUI, as
+            # views into a single ephemeris buffer shared with the plots.
+            self.eph = self.pipeline.eph
+            self.rpx = self.eph[0] # Array for Radial Separations (km)
+            self.rpy = self.eph[1] # Array for In-Track Separations (km)
+            self.rpz = self.eph[2] # Array for Cross-Track Separations (km)
+            self.rvx = self.eph[3] # Array for Radial Rates (km/s)
+            self.rvy = self.eph[4] # Array for In-Track Rates (km/s)
+            self.rvz = self.eph[5] # Array for Cross-Track Rates (km/s)
             
             # Save the relative ephemeris as an attribute of the GUI
             self.aD, self.aC = aD, aC # Deputy & Chief Semi-Major Axis (km)
@@ -1238,51 +993,15 @@ class RunGUI():
             self.RD, self.RC = RD, RC # Deputy & Chief Right Ascension (deg)
             self.MD, self.MC = MD, MC # Deputy & Chief Mean Anomaly (deg)
             
-            # Plot the results in the GUI.           
-            self.orbAxis.plot( rpz, # Cross-Track
-                               rpy, # In-Track
-                               rpx, # Radial Axis
-                               label='Relative Orbit in Hill-Frame')
-            
-            # Plot the initial trajectory of the deputy.
-            self.orbAxis.scatter( rpz[0], rpy[0], rpx[0] )
-            
-            # Update the plots
-            self.orbPlot.draw()
-            
-            # Get the current axes limits on relative orbit plots.
-            axOrbR_axes_limits = [abs(self.orbAxis.get_xlim()[0]),
-                                  abs(self.orbAxis.get_xlim()[1]),
-                                  abs(self.orbAxis.get_ylim()[0]),
-                                  abs(self.orbAxis.get_ylim()[1]),
-                                  abs(self.orbAxis.get_zlim()[0]),
-                                  abs(self.orbAxis.get_zlim()[1])]
-            
-            # Using axOrbR_axes_limits above, we can find the minimum and
-            # maximum axes limits and the span of values.
-            axOrbR_axes_max  = max(axOrbR_axes_limits)
-            axOrbR_axes_span = axOrbR_axes_max * 2
-
-            # Scale all axes equally for relative orbit plots
-            self.orbAxis.set_xlim( -1 * axOrbR_axes_max, axOrbR_axes_max )
-            self.orbAxis.set_ylim( -1 * axOrbR_axes_max, axOrbR_axes_max )
-            self.orbAxis.set_zlim( -1 * axOrbR_axes_max, axOrbR_axes_max )
-            
-            # It is important that the XYZ axes in the VVLH (relative 
-            # orbit) frame is scaled the same, else it is difficult to 
-            # interpret the relative separations on different scales.
-            
-            # Plot the chief satellite as a tri-axial quiver in VVLH frame.
-            axOrbR0 = axOrbR_axes_span * 0.1
-            self.orbAxis.quiver( 0,0,0,1,0,0, length = axOrbR0,
-                                color = 'r', arrow_length_ratio=0.3 )
-            self.orbAxis.quiver( 0,0,0,0,1,0, length = axOrbR0,
-                                color = 'r', arrow_length_ratio=0.3 )
-            self.orbAxis.quiver( 0,0,0,0,0,1, length = axOrbR0,
-                                color = 'r', arrow_length_ratio=0.3 )
-            
-            # Update the plots
-            self.orbPlot.draw()
+            # Plot the results in the GUI, re-using the oldest overlay once
+            # the history cap is reached, and with a single draw per run.
+            # Nothing is re-plotted if the ephemeris did not change.
+            if 'plot' in done:
+                with instrument.span('gui.draw'):
+                    self.plot_run( self.rpx, self.rpy, self.rpz )
+                    self.plot_limits()
+                    self.orbPlot.draw()
+                    self.prj_update()
             
             # Round to 3 decimal places.
             aC, aD = round(aC,5), round(aD,5)
@@ -1322,26 +1041,10 @@ class RunGUI():
             # First, get the scenario time steps and duration.
             ts = self.var_ts.get()
             
-            # Create a CSV file to write into.
-            fileout = open('ephemeris.csv', 'w')
-            fileout.write('Time, ')                     # Header for Column 1
-            fileout.write('Radial_(km), ')              # Header for Column 2
-            fileout.write('InTrack_(km), ')             # Header for Column 3
-            fileout.write('CrossTrack_(km), ')          # Header for Column 4
-            fileout.write('Radial_Rate_(km/s), ')       # Header for Column 5
-            fileout.write('InTrack_Rate_(km/s), ')      # Header for Column 6
-            fileout.write('CrossTrack_Rate_(km/s) \n')  # Header for Column 7
-            
-            # Now start writing.
-            for k in range( 0, len(self.rpx) ):
-                fileout.write( str( k * ts ) + ', ' )
-                fileout.write( '{:.6f}'.format(self.rpx[k]) + ', ' )
-                fileout.write( '{:.6f}'.format(self.rpy[k]) + ', ' )
-                fileout.write( '{:.6f}'.format(self.rpz[k]) + ', ' )
-                fileout.write( '{:.6f}'.format(self.rvx[k]) + ', ' )
-                fileout.write( '{:.6f}'.format(self.rvy[k]) + ', ' )
-                fileout.write( '{:.6f}'.format(self.rvz[k]) + '\n' )
-            fileout.close()
+            # Write the relative ephemeris CSV file.
+            with instrument.span('gui.log'):
+                chunked.write_csv( 'ephemeris.csv', ts, self.rpx, self.rpy,
+                                   self.rpz, self.rvx, self.rvy, self.rvz )
             
             # Create a CSV file to write into.
             fileout = open('elements.csv', 'w')
@@ -1393,10 +1096,479 @@ class RunGUI():
         Clears all existing relative orbit plots in the QLUSTER GUI.
         '''
         
+        self.plot_build( wait = True )
         self.orbAxis.clear()
         self.orbAxis.set_xlabel('Hill Frame Cross-Track Axis (km)')
         self.orbAxis.set_ylabel('Hill Frame In-Track Axis (km)')
         self.orbAxis.set_zlabel('Hill Frame Radial Axis (km)')
+        
+        # Re-create the 3-D marker before drawing, so that the background
+        # captured by anim_capture() is that of the cleared axes.
+        self.anim_mark, = self.orbAxis.plot( [], [], [], 'o', color='r',
+                                             animated=True )
         self.orbPlot.draw()
         
+        # All artists were removed with the axes, so forget about them.
+        self.live_line = None
+        self.plot_hist = []
+        self.plot_triad = []
+        self.plot_span = 0.0
+        self.plot_full = {}
+        
+        # The next run must be plotted, even if its inputs are unchanged.
+        self.pipeline.invalidate('plot')
+        self.live_pipeline.invalidate('plot')
+        
+        # Empty the 2-D projections as well.
+        self.eph = np.zeros((6,0))
+        self.prj_update()
+        
+        return None
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###    Explicit management of the relative orbit plot artists, so     ###
+    ###    that repeated runs do not keep adding artists to the axes.     ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def plot_run(self, rpx, rpy, rpz):
+        
+        '''
+        Adds a relative orbit (line and initial position marker) to the plot.
+        Once the number of overlays reaches the history cap, the artists of
+        the oldest overlay are moved to the new data with set_data_3d instead
+        of creating new ones, and any overlays above the cap are removed.
+        '''
+        
+        # Fetch the history cap, falling back to the default if invalid.
+        try:
+            cap = max( 1, int( self.var_hist.get() ) )
+        except (tk.TclError, ValueError):
+            cap = 5
+        
+        # Only a level-of-detail decimation of the trajectory is drawn. The
+        # full-resolution data is kept (for refinement when zooming in), and
+        # the exported ephemeris in self.rpx, etc. is never decimated.
+        keep = decimate.minmax( rpz, rpy, rpx, self.lod_buckets )
+        
+        # Remove the oldest overlays if the cap was lowered.
+        while len( self.plot_hist ) >= cap:
+            if len( self.plot_hist ) == cap:
+                line, mark = self.plot_hist.pop(0)
+                line.set_data_3d( rpz[keep], rpy[keep], rpx[keep] )
+                mark.set_data_3d( rpz[:1], rpy[:1], rpx[:1] )
+                self.plot_full[line] = ( rpz, rpy, rpx )
+                self.plot_hist.append( ( line, mark ) )
+                return None
+            line, mark = self.plot_hist.pop(0)
+            del self.plot_full[line]
+            line.remove()
+            mark.remove()
+        
+        # Otherwise, create the line and the marker of a new overlay.
+        line, = self.orbAxis.plot( rpz[keep], # Cross-Track
+                                   rpy[keep], # In-Track
+                                   rpx[keep], # Radial Axis
+                                   label='Relative Orbit in Hill-Frame' )
+        mark, = self.orbAxis.plot( rpz[:1], rpy[:1], rpx[:1], 'o',
+                                   color=line.get_color() )
+        self.plot_full[line] = ( rpz, rpy, rpx )
+        self.plot_hist.append( ( line, mark ) )
+        
+        return None
+    
+    def lod_check(self, event):
+        
+        '''
+        Called after every canvas draw. If the axes limits changed since the
+        last decimation (e.g. after zooming), a refinement is scheduled.
+        '''
+        
+        lims = ( self.orbAxis.get_xlim(), self.orbAxis.get_ylim(),
+                 self.orbAxis.get_zlim() )
+        if lims != self.lod_lims and self.lod_job is None:
+            self.lod_job = self.master.after( 100, self.lod_refine )
+        
+        return None
+    
+    def lod_refine(self, draw = True):
+        
+        '''
+        Re-decimates every overlay for the current axes limits, spending the
+        point budget on the samples inside the view box, and then draws the
+        canvas unless draw is False.
+        '''
+        
+        if draw:
+            self.lod_job = None
+        xlim = self.orbAxis.get_xlim()
+        ylim = self.orbAxis.get_ylim()
+        zlim = self.orbAxis.get_zlim()
+        self.lod_lims = ( xlim, ylim, zlim )
+        
+        with instrument.span('gui.lod'):
+            for line, ( x, y, z ) in self.plot_full.items():
+                keep = decimate.view( x, y, z, xlim, ylim, zlim,
+                                      self.lod_buckets )
+                line.set_data_3d( x[keep], y[keep], z[keep] )
+        if draw:
+            self.orbPlot.draw_idle()
+        
+        return None
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###    Blitted 2-D RIC projection panels of the relative ephemeris.   ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def prj_update(self):
+        
+        '''
+        Updates the 2-D projection lines from the ephemeris buffer of the
+        last run, and redraws the projection canvas once. This is the only
+        full redraw of the panels; cursor updates are blitted.
+        '''
+        
+        keep = decimate.minmax( self.eph[2], self.eph[1], self.eph[0],
+                                self.lod_buckets )
+        for ( ax, h, v ), line in zip( self.prjCols, self.prjLines ):
+            line.set_data( self.eph[h][keep], self.eph[v][keep] )
+            if len( keep ) > 0:
+                ax.relim()
+                ax.autoscale_view()
+        
+        # Hide the cursors, which may point beyond a shorter ephemeris.
+        self.prjIndex = None
+        for cursor in self.prjCursors:
+            cursor.set_data( [], [] )
+        self.prjPlot.draw()
+        
+        return None
+    
+    def prj_capture(self, event):
+        
+        '''
+        Called after every full draw of the projection canvas (including on
+        resizing), caching the panel backgrounds without the cursors.
+        '''
+        
+        self.prjBackground = [ self.prjPlot.copy_from_bbox( ax.bbox )
+                               for ax in self.prjAxes ]
+        for ax, cursor in zip( self.prjAxes, self.prjCursors ):
+            ax.draw_artist( cursor )
+        
+        return None
+    
+    def prj_cursor(self, k):
+        
+        '''
+        Moves the time cursors of the 2-D projections to sample k of the
+        ephemeris, restoring the cached backgrounds and blitting only the
+        three panels (the lines and axes are not redrawn).
+        '''
+        
+        if self.prjBackground is None or self.eph.shape[1] == 0:
+            return None
+        self.prjIndex = k
+        for i, ( ax, h, v ) in enumerate( self.prjCols ):
+            self.prjPlot.restore_region( self.prjBackground[i] )
+            self.prjCursors[i].set_data( self.eph[h,k:k+1],
+                                         self.eph[v,k:k+1] )
+            ax.draw_artist( self.prjCursors[i] )
+            self.prjPlot.blit( ax.bbox )
+        
+        return None
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###    Time-cursor playback, scheduled with master.after() and        ###
+    ###    drawn by blitting the deputy markers onto cached backgrounds.  ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def anim_toggle(self):
+        
+        '''
+        Starts or pauses the playback of the deputy along the relative orbit
+        of the last run.
+        '''
+        
+        if self.anim_job is not None:
+            self.master.after_cancel( self.anim_job )
+            self.anim_job = None
+            self.animBtn.config( text='Play' )
+        elif self.eph.shape[1] > 0:
+            self.animBtn.config( text='Pause' )
+            self.anim_step()
+        
+        return None
+    
+    def anim_capture(self, event):
+        
+        '''
+        Called after every full draw of the 3-D canvas (e.g. when rotating),
+        caching the background of the axes without the deputy marker.
+        '''
+        
+        self.anim_background = self.orbPlot.copy_from_bbox( self.orbAxis.bbox )
+        if self.anim_mark.axes is self.orbAxis:
+            self.orbAxis.draw_artist( self.anim_mark )
+        
+        return None
+    
+    def anim_step(self):
+        
+        '''
+        Moves the deputy markers to the current sample by blitting, then
+        advances by the playback speed and schedules the next frame.
+        '''
+        
+        N = self.eph.shape[1]
+        if N == 0:
+            self.anim_job = None
+            self.animBtn.config( text='Play' )
+            return None
+        k = self.anim_k % N
+        
+        with instrument.span('gui.frame'):
+            
+            # Blit the marker in the 3-D view.
+            self.anim_mark.set_data_3d( self.eph[2,k:k+1],  # Cross-Track
+                                        self.eph[1,k:k+1],  # In-Track
+                                        self.eph[0,k:k+1] ) # Radial Axis
+            if self.anim_background is not None:
+                self.orbPlot.restore_region( self.anim_background )
+                self.orbAxis.draw_artist( self.anim_mark )
+                self.orbPlot.blit( self.orbAxis.bbox )
+            
+            # Blit the cursors in the 2-D projections.
+            self.prj_cursor( k )
+        
+        # Advance, and schedule the next frame.
+        try:
+            speed = max( 1, int( self.var_speed.get() ) )
+        except (tk.TclError, ValueError):
+            speed = 1
+        self.anim_k = ( k + speed ) % N
+        self.anim_job = self.master.after( self.anim_frame, self.anim_step )
+        
+        return None
+    
+    def plot_limits(self):
+        
+        '''
+        Scales all axes equally to fit every visible relative orbit, and
+        updates the chief triad (which is only re-created when the scale of
+        the axes changes). This does not draw the canvas.
+        '''
+        
+        # Find the largest separation over all visible trajectories.
+        lines = [ line for line, mark in self.plot_hist ]
+        if self.live_line is not None:
+            lines.append( self.live_line )
+        axOrbR_axes_max = 0.0
+        for line in lines:
+            for data in line.get_data_3d():
+                if len( data ) > 0:
+                    axOrbR_axes_max = max( axOrbR_axes_max,
+                                           np.max( np.abs( data ) ) )
+        if axOrbR_axes_max <= 0.0:
+            return None
+        axOrbR_axes_max = axOrbR_axes_max * 1.05 # Small margin
+        axOrbR_axes_span = axOrbR_axes_max * 2
+        
+        # It is important that the XYZ axes in the VVLH (relative orbit)
+        # frame is scaled the same, else it is difficult to interpret the
+        # relative separations on different scales.
+        self.orbAxis.set_xlim( -1 * axOrbR_axes_max, axOrbR_axes_max )
+        self.orbAxis.set_ylim( -1 * axOrbR_axes_max, axOrbR_axes_max )
+        self.orbAxis.set_zlim( -1 * axOrbR_axes_max, axOrbR_axes_max )
+        
+        # Re-decimate the overlays for the new limits now, so that the draw
+        # of this run does not schedule another decimation (see lod_check).
+        lims = ( self.orbAxis.get_xlim(), self.orbAxis.get_ylim(),
+                 self.orbAxis.get_zlim() )
+        if lims != self.lod_lims:
+            self.lod_refine( draw = False )
+        
+        # Plot the chief satellite as a tri-axial quiver in VVLH frame.
+        if axOrbR_axes_span == self.plot_span and len( self.plot_triad ) > 0:
+            return None
+        for artist in self.plot_triad:
+            artist.remove()
+        axOrbR0 = axOrbR_axes_span * 0.1
+        self.plot_triad = [
+            self.orbAxis.quiver( 0,0,0,1,0,0, length = axOrbR0,
+                                 color = 'r', arrow_length_ratio=0.3 ),
+            self.orbAxis.quiver( 0,0,0,0,1,0, length = axOrbR0,
+                                 color = 'r', arrow_length_ratio=0.3 ),
+            self.orbAxis.quiver( 0,0,0,0,0,1, length = axOrbR0,
+                                 color = 'r', arrow_length_ratio=0.3 ) ]
+        self.plot_span = axOrbR_axes_span
+        
+        return None
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###    Debounced live re-propagation when formation sliders change.   ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def live_schedule(self):
+        
+        '''
+        Schedules a live update after a short delay, unless one is already
+        pending, so that a continuous drag re-propagates once per delay with
+        the latest slider values, rather than only after the drag stops.
+        '''
+        
+        if not self.var_live.get():
+            if self.live_job is not None:
+                self.master.after_cancel(self.live_job)
+                self.live_job = None
+        elif self.live_job is None:
+            self.live_job = self.master.after(self.live_delay,
+                                              self.live_update)
+        
+        return None
+    
+    def live_update(self):
+        
+        '''
+        Re-propagates the relative orbit with the vectorised propagator, and
+        updates the live trajectory line in place without adding artists.
+        '''
+        
+        self.live_job = None
+        
+        try:
+            td, ts = self.var_td.get(), self.var_ts.get()
+            chief = ( self.var_aC.get(), self.var_eC.get(),
+                      self.var_iC.get(), self.var_wC.get(),
+                      self.var_RC.get(), self.var_MC.get() )
+            fR, fO, fC = self.var_fR.get(), self.var_fO.get(), self.var_fC.get()
+            fPhi, fTht = self.var_fPhi.get(), self.var_fTht.get()
+        except (tk.TclError, ValueError):
+            return None # Ignore half-typed entries until they are valid
+        
+        if td <= 0 or ts <= 0 or chief[0] <= 0:
+            return None
+        
+        self.plot_build( wait = True )
+        with instrument.span('gui.live'):
+            
+            # Vectorised deputy design and propagation, where moving a single
+            # slider only recomputes the stages that depend on it.
+            inputs = [ td, ts, *chief, fR, 2 * fR, fO, fC, fPhi, fTht ]
+            done = self.live_pipeline.update( dict( zip( config.keys,
+                                                         inputs ) ) )
+            if 'plot' not in done and self.live_line is not None:
+                return None
+            rpx, rpy, rpz = self.live_pipeline.eph[:3]
+            
+            # Update the existing line, or create it on the first update.
+            if self.live_line is None:
+                self.live_line, = self.orbAxis.plot( rpz, rpy, rpx, '--',
+                                                     color='#555555',
+                                                     label='Live Update' )
+            else:
+                self.live_line.set_data_3d( rpz, rpy, rpx )
+            
+            # Grow the equal-scaled axes limits if the orbit no longer fits.
+            span = max( np.max(np.abs(rpx)), np.max(np.abs(rpy)),
+                        np.max(np.abs(rpz)) )
+            if span > self.orbAxis.get_xlim()[1]:
+                self.plot_limits()
+            
+            self.orbPlot.draw_idle()
+        
+        return None
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###     Toggles the instrumentation, and shows the recorded timings.  ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def ins_toggle(self):
+        
+        '''
+        Enables or disables the timing instrumentation from the check box.
+        '''
+        
+        if self.var_ins.get():
+            instrument.enable()
+        else:
+            instrument.disable()
+        
+        return None
+    
+    def timings(self):
+        
+        '''
+        Shows the instrumentation spans and counters of the previous runs.
+        '''
+        
+        if not instrument.enabled and len(instrument.report()['spans']) == 0:
+            tk.messagebox.showinfo("QLUSTER Timings",
+                                   "Tick 'Instrument' and run QLUSTER first!")
+        else:
+            print(instrument.summary())
+            tk.messagebox.showinfo("QLUSTER Timings", instrument.summary())
+        
+        return None
+    
+    #########################################################################
+    #########################################################################
+    ###                                                                   ###
+    ###    Watch mode, which re-runs QLUSTER when config.txt changes.     ###
+    ###                                                                   ###
+    #########################################################################
+    #########################################################################
+    
+    def watch_toggle(self):
+        
+        '''
+        Starts or stops polling config.txt for changes (see watch.py).
+        '''
+        
+        if self.watch_job is not None:
+            self.master.after_cancel( self.watch_job )
+            self.watch_job = None
+        if self.var_watch.get():
+            cwd = dirname(dirname(abspath(__file__)))
+            self.watcher = watch.Watcher( join(cwd, 'config', 'config.txt') )
+            self.watch_poll()
+        else:
+            self.watcher = None
+        
+        return None
+    
+    def watch_poll(self):
+        
+        '''
+        Polls config.txt, and if any input value changed, loads the config
+        into the GUI and runs QLUSTER. Re-schedules itself.
+        '''
+        
+        changed = self.watcher.check()
+        if len( changed ) > 0:
+            print('config.txt changed: ' + ', '.join( sorted(changed) ))
+            self.cfg_R()
+            self.run()
+        self.watch_job = self.master.after( self.watch_interval,
+                                            self.watch_poll )
+        
         return None
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the local propagation service, an asyncio server    ##
+##    on a Unix socket (or on localhost TCP, for an address 'host:port')     ##
+##    which propagates scenarios on demand, so that other tools need not     ##
+##    import QLUSTER in their own processes.                                 ##
+##                                                                           ##
+##    Requests arriving within a short window are merged into batches with   ##
+##    the same time step, each designed and propagated in one vectorised     ##
+##    call (the elements broadcast as (P,1) arrays against the times) on a   ##
+##    process pool, so that the event loop only does the I/O.               ##
+##                                                                           ##
+##    Every message is a 4-byte big-endian length and a JSON header. The     ##
+##    request header holds an 'id' and the 'inputs' of one scenario (keys    ##
+##    as in config.keys). The reply header holds the same 'id', the deputy   ##
+##    elements and the 'shape' of the ephemeris (or an 'error'), and is      ##
+##    followed by the 6xN ephemeris as raw little-endian float64 bytes.      ##
+##    Many requests may be pipelined on one connection, and the replies      ##
+##    come back in order of completion.                                      ##
+##                                                                           ##
+##    Example:                                                               ##
+##                                                                           ##
+##    >> python qluster.py --serve --address /tmp/qluster.sock               ##
+##    >> client = service.Client( '/tmp/qluster.sock' )                      ##
+##    >> elements, eph = client.propagate( inputs )                          ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 20-Oct-2026 02:30 AM (+8 GMT)                            ##
+##    Last modified 20-Oct-2026 02:30 AM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import os
+import json
+import stat
+import socket
+import tempfile
+import struct
+import asyncio
+import ipaddress
+import contextlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from source import config
+from source import deputy
+from source import formation
+
+# Default address of the service, a Unix socket in the temporary directory.
+address = os.path.join( tempfile.gettempdir(), 'qluster.sock' )
+
+# Length prefix of every message header.
+_prefix = struct.Struct('>I')
+
+###############################################################################
+###############################################################################
+
+def encode(header, eph = None):
+    '''Encodes a message: the length-prefixed JSON header, followed by the
+    raw float64 bytes of the ephemeris (if any).'''
+    text = json.dumps( header ).encode()
+    parts = [ _prefix.pack( len(text) ), text ]
+    if eph is not None:
+        parts.append( np.ascontiguousarray( eph, dtype = '<f8' ).tobytes() )
+    return b''.join( parts )
+
+def _parse(header, payload):
+    '''Decodes a reply header and its payload into (elements, eph). Raises
+    a ValueError with the message of the service if the request failed.'''
+    if 'error' in header:
+        raise ValueError( header['error'] )
+    eph = np.frombuffer( payload, dtype = '<f8' ).reshape( header['shape'] )
+    return tuple( header['deputy'] ), eph
+
+def _size(header):
+    '''Number of payload bytes following a reply header.'''
+    return 8 * int( np.prod( header.get( 'shape', [0] ) ) )
+
+def _tcp(address):
+    '''Returns the (host, port) of a 'host:port' address, or None for a Unix
+    socket path. Raises a ValueError if the host is not a loopback address,
+    since the service has no authentication.'''
+    host, sep, port = address.rpartition(':')
+    if not sep or '/' in address:
+        return None
+    try:
+        loopback = ipaddress.ip_address( host.strip('[]') ).is_loopback
+    except ValueError:
+        loopback = host == 'localhost'
+    if not loopback:
+        raise ValueError('The service only serves on localhost, not on '
+                         + repr(host) + '!')
+    return host.strip('[]'), int(port)
+
+def _unlink_stale(path):
+    '''Removes a stale Unix socket left at path by a service that has since
+    stopped. Raises a FileExistsError if path is any other file, or a socket
+    on which a service is still listening.'''
+    try:
+        mode = os.lstat( path ).st_mode
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK( mode ):
+        raise FileExistsError( path + ' exists and is not a socket!' )
+    with socket.socket( socket.AF_UNIX ) as probe:
+        try:
+            probe.connect( path )
+        except ConnectionRefusedError:
+            os.unlink( path )
+            return None
+    raise FileExistsError( path + ' is in use by a running service!' )
+
+###############################################################################
+###############################################################################
+
+def _batch(ts, N, values):
+    '''Worker of the service: designs the deputies and propagates a batch of
+    P scenarios with the same time step, for N samples, in one vectorised
+    call. values is a Px14 array of inputs (columns as in config.keys), and
+    the results are the Px6 deputy elements and the Px6xN ephemerides.'''
+    t = np.arange( N, dtype = float ) * ts
+    x = [ values[:,n:n+1] for n in range( values.shape[1] ) ]
+    D = np.broadcast_arrays( *deputy.deputy( *x ) )
+    eph = np.array( np.broadcast_arrays(
+                    *formation.states( t, ts, *x[2:8], *D ) ) )
+    return np.concatenate( D, axis = 1 ), eph.transpose(1,0,2)
+
+class Server():
+
+    '''Local propagation service, batching concurrent requests.
+
+    Attributes
+    ----------
+    address : str
+        Unix socket path, or 'host:port' for localhost TCP
+    window : float
+        Time (s) for which the first request of a batch waits for others
+    size : int
+        Maximum number of scenarios in one batch
+    samples : int
+        Maximum number of samples (scenarios x time samples) in one batch
+    workers : int or None
+        Number of worker processes. None uses all CPUs, and 1 propagates
+        on a single background thread of the current process.
+    '''
+
+    def __init__(self, address = address, window = 0.002, size = 256,
+                 samples = 2000000, workers = None):
+        self.address = address
+        self.window = window
+        self.size = size
+        self.samples = samples
+        self.workers = workers
+        self._queue = None
+        self._pool = None
+
+    async def serve(self):
+        '''Serves requests until cancelled. Raises a ValueError for a TCP
+        host that is not a loopback address, and a FileExistsError if the
+        socket path is taken by another file or a running service.'''
+        tcp = _tcp( self.address )
+        if tcp is None:
+            _unlink_stale( self.address )
+        if self.workers == 1:
+            self._pool = ThreadPoolExecutor( max_workers = 1 )
+        else:
+            self._pool = ProcessPoolExecutor( max_workers = self.workers )
+        self._queue = asyncio.Queue()
+        if tcp is not None:
+            server = await asyncio.start_server( self._connect, *tcp )
+        else:
+            server = await asyncio.start_unix_server( self._connect,
+                                                      self.address )
+        batcher = asyncio.ensure_future( self._batcher() )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            self._pool.shutdown( cancel_futures = True )
+            if tcp is None:
+                with contextlib.suppress( FileExistsError ):
+                    _unlink_stale( self.address )
+
+    def run(self):
+        '''Blocking entry point, serving until interrupted.'''
+        try:
+            asyncio.run( self.serve() )
+        except KeyboardInterrupt:
+            pass
+        return None
+
+    async def propagate(self, inputs):
+        '''Queues one scenario for the next batch, and returns its deputy
+        elements and 6xN ephemeris. Raises a ValueError on invalid inputs.'''
+        inps = { key : inputs[key] for key in config.keys if key in inputs }
+        valid, errors = config.validate( { 'request' : inps } )
+        if not valid[0]:
+            raise ValueError( ' '.join( errors['request'] ) )
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put( ( inps, future ) )
+        return await future
+
+    async def _connect(self, reader, writer):
+        '''Handles one connection, answering its requests concurrently.
+        Headers which are not valid JSON get an error reply.'''
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                head = await reader.readexactly( _prefix.size )
+                text = await reader.readexactly( _prefix.unpack(head)[0] )
+                try:
+                    request = json.loads( text )
+                except ValueError as error:
+                    request = error
+                task = asyncio.ensure_future(
+                    self._reply( request, writer, lock ) )
+                tasks.add( task )
+                task.add_done_callback( tasks.discard )
+        except ( asyncio.IncompleteReadError, ConnectionError ):
+            pass
+        finally:
+            if tasks:
+                await asyncio.gather( *tasks, return_exceptions = True )
+            writer.close()
+
+    async def _reply(self, request, writer, lock):
+        '''Propagates one request, and streams its reply back. Every request
+        gets a reply, with an 'error' message if it could not be served.'''
+        header = { 'id' : None }
+        eph = None
+        try:
+            if isinstance( request, Exception ):
+                raise ValueError( 'Invalid request header: ' + str(request) )
+            if not isinstance( request, dict ):
+                raise ValueError( 'Request header must be a JSON object!' )
+            header['id'] = request.get('id')
+            elements, eph = await self.propagate( request['inputs'] )
+            header['deputy'] = [ float(x) for x in elements ]
+            header['shape'] = list( eph.shape )
+        except Exception as error:
+            header = { 'id' : header['id'],
+                       'error' : str( error ) or type( error ).__name__ }
+            eph = None
+        async with lock:
+            writer.write( encode( header, eph ) )
+            await writer.drain()
+
+    async def _batcher(self):
+        '''Collects queued requests for up to `window` seconds, and sends
+        them to the pool in batches with the same time step.'''
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [ await self._queue.get() ]
+            deadline = loop.time() + self.window
+            while len( pending ) < self.size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append( await asyncio.wait_for(
+                                    self._queue.get(), timeout ) )
+                except asyncio.TimeoutError:
+                    break
+            groups = {}
+            for inps, future in pending:
+                groups.setdefault( inps['timestep'], [] ).append(
+                    ( inps, future ) )
+            for ts, group in groups.items():
+                for part in self._split( ts, group ):
+                    asyncio.ensure_future( self._dispatch( ts, part ) )
+
+    def _split(self, ts, group):
+        '''Splits a group of requests into batches of at most `samples`
+        samples, padding every scenario to the longest in its batch.'''
+        group = sorted( group, key = lambda r : r[0]['duration'] )
+        part, longest = [], 0
+        for request in group:
+            N = len( np.arange( 0, request[0]['duration'], ts ) )
+            if part and max( longest, N ) * ( len(part) + 1 ) > self.samples:
+                yield part
+                part, longest = [], 0
+            part.append( request )
+            longest = max( longest, N )
+        if part:
+            yield part
+
+    async def _dispatch(self, ts, part):
+        '''Propagates one batch on the pool, and resolves its futures.'''
+        counts = [ len( np.arange( 0, inps['duration'], ts ) )
+                   for inps, future in part ]
+        values = np.array( [ [ float( inps[k] ) for k in config.keys ]
+                             for inps, future in part ] )
+        try:
+            elements, eph = await asyncio.get_running_loop().run_in_executor(
+                self._pool, _batch, ts, max( counts ), values )
+        except Exception as error:
+            for inps, future in part:
+                if not future.done():
+                    future.set_exception( error )
+            return
+        for n, ( inps, future ) in enumerate( part ):
+            if not future.done():
+                future.set_result( ( elements[n], eph[n,:,:counts[n]] ) )
+
+###############################################################################
+###############################################################################
+
+class Client():
+
+    '''Blocking client of the propagation service, keeping one connection.
+
+    Attributes
+    ----------
+    address : str
+        Unix socket path, or 'host:port' for localhost TCP
+    '''
+
+    def __init__(self, address = address):
+        self.address = address
+        self._sock = None
+        self._count = 0
+
+    def connect(self):
+        '''Opens the connection, if it is not open yet.'''
+        if self._sock is None:
+            tcp = _tcp( self.address )
+            if tcp is not None:
+                self._sock = socket.create_connection( tcp )
+                self._sock.setsockopt( socket.IPPROTO_TCP,
+                                       socket.TCP_NODELAY, 1 )
+            else:
+                self._sock = socket.socket( socket.AF_UNIX )
+                self._sock.connect( self.address )
+        return self._sock
+
+    def close(self):
+        '''Closes the connection.'''
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        return None
+
+    def propagate(self, inputs):
+        '''Propagates one scenario (keys as in config.keys), and returns its
+        deputy elements (in km and deg) and 6xN relative ephemeris.'''
+        return self.many( [ inputs ] )[0]
+
+    def many(self, scenarios):
+        '''Propagates many scenarios, pipelined on the connection so that the
+        service may batch them together, and returns the list of results in
+        the order of the scenarios.'''
+        sock = self.connect()
+        ids = list( range( self._count, self._count + len(scenarios) ) )
+        self._count += len( scenarios )
+        sock.sendall( b''.join( encode( { 'id' : n, 'inputs' : inps } )
+                                for n, inps in zip( ids, scenarios ) ) )
+        results = {}
+        for n in ids:
+            header = json.loads( self._read( _prefix.unpack(
+                                 self._read( _prefix.size ) )[0] ) )
+            results[ header['id'] ] = ( header, self._read( _size(header) ) )
+        return [ _parse( *results[n] ) for n in ids ]
+
+    def _read(self, size):
+        '''Reads exactly `size` bytes from the connection.'''
+        buffer = bytearray( size )
+        view = memoryview( buffer )
+        while len( view ) > 0:
+            n = self._sock.recv_into( view )
+            if n == 0:
+                raise ConnectionError('Propagation service closed the '
+                                      'connection!')
+            view = view[n:]
+        return buffer
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the passive-safety parameter sweep. It evaluates a  ##
+##    dense grid of the argument of relative pericenter (fPhi) and argument  ##
+##    of latitude crossing (fTht), and optionally of the radial and cross-   ##
+##    track amplitudes, through a vectorised deputy design and propagation.  ##
+##    It returns heatmaps of the minimum radial/cross-track separation and   ##
+##    of the minimum range over the scenario, for every grid point.          ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 13:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 13:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from source import deputy
+from source import reducers
+
+###############################################################################
+###############################################################################
+
+def grid(td, ts, aC, eC, iC, wC, RC, MC, fR, fO, fC,
+         fPhi = None, fTht = None, block = 4096, chunk = 2000):
+    '''Passive-safety sweep over a grid of formation plane angles.
+
+    Parameters
+    ----------
+    td : int
+        Propagation Duration (s)
+    ts : int
+        Propagation Timestep (s)
+    aC, eC, iC, wC, RC, MC : float
+        Chief Orbit Keplerian elements (km and deg)
+    fR : float or numpy.ndarray
+        Formation Radial Amplitude(s) (km). The in-track amplitude is always
+        twice the radial amplitude, as required by the HCW equations.
+    fO : float
+        Formation In-Track Offset (km)
+    fC : float or numpy.ndarray
+        Formation Cross-Track Amplitude(s) (km)
+    fPhi : numpy.ndarray, optional
+        Arguments of Relative Pericenter (deg). Default is 360 values over
+        [-180, 180).
+    fTht : numpy.ndarray, optional
+        Arguments of Latitude Crossing (deg). Default is 360 values over
+        [-180, 180).
+    block : int, optional
+        Number of grid points propagated per vectorised call. Default 4096.
+    chunk : int, optional
+        Number of time samples per vectorised call. Default 2000.
+
+    Returns
+    -------
+    result : dict
+        'fPhi' and 'fTht' axes, and heatmaps 'rc_min' (minimum radial/cross-
+        track separation, km) and 'range_min' (minimum range, km). Heatmaps
+        have shape (len(fPhi), len(fTht)), preceded by the fR and fC axes for
+        those amplitudes that are given as arrays.
+
+    '''
+
+    if fPhi is None:
+        fPhi = np.arange( -180.0, 180.0, 1.0 )
+    if fTht is None:
+        fTht = np.arange( -180.0, 180.0, 1.0 )
+
+    # Build the full grid, and remember which axes are to be returned.
+    axes = [ np.atleast_1d(fR), np.atleast_1d(fC),
+             np.atleast_1d(fPhi), np.atleast_1d(fTht) ]
+    shape = [ len(x) for x in axes ]
+    keep  = [ np.ndim(fR) > 0, np.ndim(fC) > 0, True, True ]
+    mesh  = [ x.ravel() for x in np.meshgrid( *axes, indexing = 'ij' ) ]
+    npts  = len( mesh[0] )
+
+    rc_min    = np.empty( npts )
+    range_min = np.empty( npts )
+
+    # Propagate the grid in blocks of points, to bound the memory footprint.
+    for k0 in range( 0, npts, block ):
+        k1 = min( k0 + block, npts )
+        gR, gC, gPhi, gTht = [ x[k0:k1, None] for x in mesh ]
+
+        # Vectorised design of every deputy in the block.
+        aD, eD, iD, wD, RD, MD = deputy.deputy( td, ts, aC, eC, iC, wC,
+                                                RC, MC, gR, 2 * gR, fO, gC,
+                                                gPhi, gTht )
+
+        # Vectorised propagation of the whole block, window by window.
+        sep, = reducers.reduce( td, ts, aC, eC, iC, wC, RC, MC,
+                                aD, eD, iD, wD, RD, MD, chunk = chunk )
+        rc_min[k0:k1]    = sep.rc.min
+        range_min[k0:k1] = sep.range.min
+
+    # Reshape the results into heatmaps, dropping scalar amplitude axes.
+    outshape = [ n for n, k in zip( shape, keep ) if k ]
+    return { 'fPhi'      : np.atleast_1d(fPhi),
+             'fTht'      : np.atleast_1d(fTht),
+             'rc_min'    : rc_min.reshape( outshape ),
+             'range_min' : range_min.reshape( outshape ) }
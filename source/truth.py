@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the nonlinear "truth" relative propagator. The      ##
+##    chief and deputy are propagated exactly on their two-body orbits (as   ##
+##    in posvel.py), and the inertial relative state is rotated into the     ##
+##    chief's Hill (RIC) frame, without the linearisation of formation.py.   ##
+##    It is vectorised across time and across deputies, and shares the same  ##
+##    sampling convention and output axes as formation.states(), so that    ##
+##    the two can be compared sample by sample.                              ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 17:00 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 17:00 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import numpy as np
+from source import posvel
+
+###############################################################################
+###############################################################################
+
+def states(t, ts, aC, eC, iC, wC, RC, MC, aD, eD, iD, wD, RD, MD):
+    '''Exact two-body Hill-frame relative states at the sample times t.
+
+    Parameters
+    ----------
+    t : numpy.ndarray
+        Array of sample times since the start of the scenario (s)
+    ts : int
+        Propagation Timestep (s), with the same time origin convention as
+        formation.states() (sample k of formation.propagate() is at k * ts).
+    aC, eC, iC, wC, RC, MC : float or numpy.ndarray
+        Chief Orbit Keplerian elements (km and deg)
+    aD, eD, iD, wD, RD, MD : float or numpy.ndarray
+        Deputy Orbit Keplerian elements (km and deg)
+
+    Returns
+    -------
+    rpx, rpy, rpz : numpy.ndarray
+        Arrays of sampled radial, in-track and cross-track positions (km)
+    rvx, rvy, rvz : numpy.ndarray
+        Arrays of sampled radial, in-track and cross-track velocities, as
+        seen from the rotating Hill frame (km/s)
+
+    '''
+
+    # Gravitational constant = G * Earth Mass (km**3/s**2)
+    mu = 398600.44
+
+    # Mean anomalies of both satellites at every sample time (rad).
+    t  = np.asarray( t, dtype = float ) + ts
+    MC = np.deg2rad(MC) + ( np.sqrt( mu / aC**3 ) * t )
+    MD = np.deg2rad(MD) + ( np.sqrt( mu / aD**3 ) * t )
+
+    # Exact inertial states of the chief and the deputy.
+    pC, vC, _ = posvel.posvel_vec( aC, eC, np.deg2rad(iC), np.deg2rad(wC),
+                                   np.deg2rad(RC), MC )
+    pD, vD, _ = posvel.posvel_vec( aD, eD, np.deg2rad(iD), np.deg2rad(wD),
+                                   np.deg2rad(RD), MD )
+
+    # Unit vectors of the chief Hill frame: radial, orbit normal, in-track.
+    h  = np.cross( pC, vC )
+    rC = np.linalg.norm( pC, axis = -1 )[..., None]
+    hC = np.linalg.norm( h,  axis = -1 )[..., None]
+    xh = pC / rC
+    zh = h / hC
+    yh = np.cross( zh, xh )
+
+    # Relative position, and relative velocity seen from the rotating frame,
+    # removing the transport term of the frame angular velocity h / r^2.
+    dp = pD - pC
+    dv = ( vD - vC ) - np.cross( zh * ( hC / rC**2 ), dp )
+
+    # Project onto the Hill frame. The cross-track sign follows the output
+    # convention of formation.propagate(), which is anti-parallel to h.
+    dot = lambda u, v : np.sum( u * v, axis = -1 )
+    rpx, rpy, rpz = dot( dp, xh ), dot( dp, yh ), -1 * dot( dp, zh )
+    rvx, rvy, rvz = dot( dv, xh ), dot( dv, yh ), -1 * dot( dv, zh )
+
+    return rpx, rpy, rpz, rvx, rvy, rvz
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+###############################################################################
+##                                                                           ##
+##      ___  _    _   _ ____ _____ ____ ____                                 ##
+##     / _ \| |  | | | |  __|_   _| ___| __ \                                ##
+##    ( |_| ) |__| |_| |__  | | | | __|  -/ /                                ##
+##     \_  /|____|_____|____| |_| |____|_|\_\                                ##
+##       \/                                       v 0.0                      ##
+##                                                                           ##
+##    FILE DESCRIPTION:                                                      ##
+##                                                                           ##
+##    This file contains the watch mode, which re-runs QLUSTER whenever the  ##
+##    config.txt file changes. The file is polled cheaply through os.stat(), ##
+##    it is only re-read when its modification time or size changes, and    ##
+##    only re-parsed when its text actually changed. The parsed inputs are   ##
+##    diffed against the previous ones, so that edits which do not change   ##
+##    any value (e.g. comments, or re-saving) trigger nothing.               ##
+##                                                                           ##
+##    The Cache class keeps the stages of the last run (see pipeline.py),    ##
+##    so that only the stages affected by a change are recomputed.           ##
+##    It is used by the headless watch loop, run(). The GUI watch mode       ##
+##    (RunGUI.watch_poll) uses the Watcher, then RunGUI.run(), which keeps   ##
+##    its own pipeline.                                                      ##
+##                                                                           ##
+##    Written by Samuel Y. W. Low.                                           ##
+##    First created 19-Oct-2026 23:30 PM (+8 GMT)                            ##
+##    Last modified 19-Oct-2026 23:30 PM (+8 GMT)                            ##
+##                                                                           ##
+###############################################################################
+###############################################################################
+
+import os
+import time
+import numpy as np
+from source import config
+from source import pipeline
+
+# Keys of the config.txt inputs, in the order of the deputy.deputy() inputs.
+keys = config.keys
+
+###############################################################################
+###############################################################################
+
+def parse(text):
+    '''Parses the text of a config.txt file (see config.parse) into the
+    typed inputs of its first scenario. Raises a ValueError if the inputs
+    fail config.validate(), e.g. while the file is still being edited.'''
+    scenarios = config.parse( text )
+    if len( scenarios ) == 0:
+        raise ValueError('No inputs in config.txt!')
+    name, inps = next( iter( scenarios.items() ) )
+    valid, errors = config.validate( { name : inps } )
+    if not valid[0]:
+        raise ValueError('Invalid inputs in config.txt: '
+                         + ' '.join( errors[name] ))
+    return inps
+
+###############################################################################
+###############################################################################
+
+class Watcher():
+
+    '''Detects real changes of the inputs in a config.txt file.
+
+    Attributes
+    ----------
+    path : str
+        Path of the watched config.txt file
+    inputs : dict or None
+        Last successfully parsed inputs (None before the first check)
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self.inputs = None
+        self._stat = None
+        self._text = None
+
+    def check(self):
+        '''Polls the file, and returns the set of input keys whose values
+        changed since the previous check (all keys on the first check), or
+        an empty set if nothing changed. Unreadable, half-written or invalid
+        files are ignored until they parse and validate again.'''
+
+        # Cheap check of the modification time and size first.
+        try:
+            stat = os.stat( self.path )
+        except OSError:
+            return set()
+        signature = ( stat.st_mtime_ns, stat.st_size )
+        if signature == self._stat:
+            return set()
+        self._stat = signature
+
+        # Re-parse only if the text itself changed.
+        with open( self.path, 'r' ) as filein:
+            text = filein.read()
+        if text == self._text:
+            return set()
+        try:
+            inputs = parse( text )
+        except ValueError:
+            return set()
+        self._text = text
+
+        # Diff the parsed inputs against the previous ones.
+        if self.inputs is None:
+            changed = set( keys )
+        else:
+            changed = { k for k in keys if inputs[k] != self.inputs[k] }
+        self.inputs = inputs
+        return changed
+
+###############################################################################
+###############################################################################
+
+class Cache():
+
+    '''Cache of the last deputy design and relative ephemeris, through the
+    incremental pipeline (see pipeline.py): only the stages affected by the
+    changed inputs are recomputed, and a longer duration only appends the
+    new samples.
+
+    Attributes
+    ----------
+    pipeline : pipeline.Pipeline
+        Incremental pipeline holding the cached stages
+    hits : dict
+        Number of times each of 'deputy' and 'eph' was re-used
+    '''
+
+    def __init__(self):
+        self.pipeline = pipeline.Pipeline()
+        self.hits = { 'deputy' : 0, 'eph' : 0 }
+
+    def update(self, inputs):
+        '''Returns the deputy elements and relative ephemeris of the inputs,
+        re-using the cached results wherever the inputs allow.'''
+        done = self.pipeline.update( inputs )
+        if 'deputy' not in done:
+            self.hits['deputy'] += 1
+        if 'relative' not in done:
+            self.hits['eph'] += 1
+        return self.pipeline.deputy, self.pipeline.eph
+
+###############################################################################
+###############################################################################
+
+def report(inputs, changed, elements, eph):
+    '''Default callback of run(), printing a one-line summary per change.'''
+    rng = np.linalg.norm( eph[:3], axis = 0 )
+    print('{}  changed: {}  samples: {}  range min/max: {:.4f} / {:.4f} km'
+          .format( time.strftime('%H:%M:%S'), ', '.join( sorted(changed) ),
+                   eph.shape[1], np.min( rng, initial = np.inf ),
+                   np.max( rng, initial = 0.0 ) ))
+    return None
+
+def run(path, interval = 0.2, callback = report, cycles = None):
+    '''Headless watch loop, which polls the config.txt file every `interval`
+    seconds, and calls callback(inputs, changed, deputy, eph) with the new
+    results after every real change of the inputs. Errors of the update or
+    of the callback are printed, and the loop carries on polling. Runs until
+    interrupted, or for a number of polling cycles if `cycles` is given.'''
+
+    watcher = Watcher( path )
+    cache = Cache()
+    n = 0
+    while cycles is None or n < cycles:
+        changed = watcher.check()
+        if len( changed ) > 0:
+            try:
+                elements, eph = cache.update( watcher.inputs )
+                callback( watcher.inputs, changed, elements, eph )
+            except Exception as excpt:
+                print('{}  error: {!r}'.format( time.strftime('%H:%M:%S'),
+                                               excpt ))
+        time.sleep( interval )
+        n += 1
+    return cache
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+
+# Tests import the QLUSTER sources as `from source import ...`, as the main
+# file does, so the main directory of QLUSTER must be on the import path.
+
+import sys
+from os.path import dirname, abspath
+
+sys.path.insert( 0, dirname(dirname(abspath(__file__))) )
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from source import adaptive
+from source import deputy
+from source import formation
+
+chief = ( 6978.14, 0.05, 60.0, 90.0, 90.0, 45.0 )
+dep = deputy.deputy( 86400, 10, *chief, 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )
+
+@pytest.mark.parametrize('tol', [ 0.01, 0.001 ])
+def test_chord_tolerance(tol):
+    t, *states = adaptive.sample( 86400, 10, *chief, *dep, tol = tol )
+    states = np.array( states )
+    assert t[0] == 0.0 and t[-1] == 86390.0
+    assert np.all( np.diff( t ) > 0 )
+    assert np.array_equal( states, formation.states( t, 10, *chief, *dep ) )
+
+    # Linear interpolation between the samples stays within the tolerance.
+    u = np.arange( 0, 86400, 10, dtype = float )
+    exact = np.array( formation.states( u, 10, *chief, *dep )[:3] )
+    interp = np.array( [ np.interp( u, t, x ) for x in states[:3] ] )
+    assert np.max( np.linalg.norm( interp - exact, axis = 0 ) ) <= tol
+    assert len( t ) < len( u ) / 2
+
+def test_never_denser_than_the_time_step():
+    t = adaptive.sample( 86400, 10, *chief, *dep, tol = 1.0E-9 )[0]
+    assert np.min( np.diff( t ) ) >= 10 - 1.0E-9
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import warnings
+import numpy as np
+import pytest
+from source import anomaly
+from source import instrument
+
+def test_maxiter_guard():
+    with pytest.raises( ValueError ):
+        anomaly.M2E( 1.0, 0.1, maxiter = 0 )
+    with warnings.catch_warnings( record = True ) as caught:
+        warnings.simplefilter('always')
+        E = anomaly.M2E( np.linspace( -3, 3, 50 ), 0.9, maxiter = 1 )
+    assert E.shape == (50,)
+    assert any( w.category is RuntimeWarning for w in caught )
+
+M = np.linspace( -3 * np.pi, 3 * np.pi, 2001 )
+
+@pytest.mark.parametrize('e', [ 0.0, 0.01, 0.1, 0.5, 0.9 ])
+def test_M2E_solves_keplers_equation(e):
+    E = anomaly.M2E( M, e )
+    assert np.max( np.abs( E - e * np.sin(E) - M ) ) < 1.0E-9
+    assert np.allclose( anomaly.E2M( E, e ), M, atol = 1.0E-9 )
+
+@pytest.mark.parametrize('e', [ 0.01, 0.1, 0.5 ])
+def test_warm_start(e):
+    # Mean anomalies wrapped to +/- pi, as in formation.propagate().
+    dM = 0.01
+    Mw = np.linspace( -np.pi, np.pi - dM, 2001 )
+    E0 = anomaly.extrapolate( anomaly.M2E( Mw, e ), e, dM )
+    warm = anomaly.M2E( Mw + dM, e, E0 = E0 )
+    cold = anomaly.M2E( Mw + dM, e )
+    assert np.max( np.abs( warm - cold ) ) < 1.0E-9
+    with anomaly.diagnostics() as stats:
+        anomaly.M2E( Mw + dM, e, E0 = E0 )
+    assert stats.solves == len( Mw ) and stats.failures == 0
+    assert stats.mean() <= 2.0
+
+@pytest.mark.parametrize('e', [ 0.0, 0.01, 0.3, 0.8 ])
+def test_table(e):
+    table = anomaly.table( e )
+    assert table is anomaly.table( e )
+    assert table.error < 1.0E-12
+    assert np.max( np.abs( table.M2E( M ) - anomaly.M2E( M, e ) ) ) < 1.0E-9
+
+def test_diagnostics():
+    with anomaly.diagnostics() as stats:
+        anomaly.M2E( M, 0.5 )
+        anomaly.M2E( M[:10], 0.5 )
+    assert stats.solves == len( M ) + 10
+    assert stats.failures == 0 and stats.residual < 1.0E-9
+    assert np.sum( stats.histogram ) == stats.solves
+
+def test_conversions():
+    nu = np.linspace( -3.1, 3.1, 101 )
+    for e in [ 0.0, 0.2, 0.7 ]:
+        assert np.allclose( anomaly.M2V( anomaly.V2M( nu, e ), e ), nu,
+                            atol = 1.0E-9 )
+
+def test_instrumented_iterations():
+    Ms = np.array( [ 0.0, 0.0, 0.0, 2.5 ] ) # Three solves converge at once
+    instrument.reset()
+    instrument.enable()
+    try:
+        with anomaly.diagnostics() as stats:
+            anomaly.M2E( Ms, 0.9 )
+    finally:
+        instrument.disable()
+    counters = instrument.report()['counters']
+    instrument.reset()
+    assert counters['kepler.solves'] == len( Ms )
+    assert counters['kepler.iterations'] == stats.mean() * stats.solves
+    assert counters['kepler.iterations'] < len( Ms ) * ( len(
+        stats.histogram ) - 1 )
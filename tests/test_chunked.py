@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import numpy as np
+import pytest
+from source import chunked
+from source import deputy
+from source import formation
+
+chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+dep = deputy.deputy( 7200, 10, *chief, 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )
+
+def test_matches_states(tmp_path):
+    path = str( tmp_path / 'eph.npy' )
+    n = chunked.propagate( path, 7200, 10, *chief, *dep, chunk = 100 )
+    eph = chunked.load( path )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    assert n == len( t ) and eph.shape == ( n, 7 )
+    assert np.array_equal( eph[:,0], t )
+    assert np.array_equal( eph[:,1:].T, formation.states( t, 10, *chief,
+                                                          *dep ) )
+    assert os.listdir( tmp_path ) == ['eph.npy']
+
+def test_failure_leaves_no_file(tmp_path):
+    class Failing():
+        def update(self, *states):
+            raise RuntimeError('failed')
+    path = tmp_path / 'eph.npy'
+    with pytest.raises( RuntimeError ):
+        chunked.propagate( str( path ), 7200, 10, *chief, *dep,
+                           chunk = 100, reducers = [ Failing() ] )
+    assert os.listdir( tmp_path ) == []
+    path.write_bytes( b'previous' )
+    with pytest.raises( RuntimeError ):
+        chunked.propagate( str( path ), 7200, 10, *chief, *dep,
+                           chunk = 100, reducers = [ Failing() ] )
+    assert path.read_bytes() == b'previous'
+
+def test_write_csv(tmp_path):
+    path = tmp_path / 'ephemeris.csv'
+    eph = np.arange( 12, dtype = float ).reshape( 6, 2 ) / 7
+    chunked.write_csv( str( path ), 10, *eph )
+    lines = path.read_text().splitlines()
+    assert lines[0] == ', '.join( chunked.columns ) + ' '
+    assert lines[2] == '10, ' + ', '.join( '{:.6f}'.format(x)
+                                           for x in eph[:,1] )
+
+def test_keeps_permissions(tmp_path):
+    path = tmp_path / 'eph.npy'
+    umask = os.umask( 0o022 )
+    try:
+        chunked.propagate( str( path ), 700, 10, *chief, *dep )
+        assert os.stat( path ).st_mode & 0o777 == 0o644
+        os.chmod( path, 0o640 )
+        chunked.propagate( str( path ), 700, 10, *chief, *dep )
+        assert os.stat( path ).st_mode & 0o777 == 0o640
+    finally:
+        os.umask( umask )
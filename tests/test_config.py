@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import os
+import numpy as np
+from os.path import dirname, abspath, join
+from source import config
+
+# The config.txt shipped with QLUSTER.
+shipped = join( dirname(dirname(abspath(__file__))), 'config', 'config.txt' )
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'config.txt'
+    path.write_text('~: No inputs at all\n')
+    scenarios = config.load( str( path ) )
+    assert scenarios == {}
+    inps = next( iter( scenarios.values() ), {} )
+    valid, errors = config.validate( { 'default' : inps } )
+    assert not valid[0]
+    assert len( errors['default'] ) == len( config.keys )
+
+text = '''~: Comment line
+I: duration 86400
+I: timestep 10
+I: orb_a 6978.14
+S: second
+~: Another comment
+I: duration abc
+I: orb_e 0.01
+'''
+
+def test_parse():
+    scenarios = config.parse( text )
+    assert list( scenarios ) == [ config.default, 'second' ]
+    assert scenarios['default'] == { 'duration' : 86400, 'timestep' : 10,
+                                     'orb_a' : 6978.14 }
+    assert isinstance( scenarios['default']['duration'], int )
+    assert np.isnan( scenarios['second']['duration'] )
+    assert scenarios['second']['orb_e'] == 0.01
+
+def test_shipped_config_is_valid():
+    scenarios = config.load( shipped )
+    valid, errors = config.validate( scenarios )
+    assert np.all( valid ) and errors == {}
+
+def test_validate_rules():
+    good = dict( config.load( shipped )['default'] )
+    bad = dict( good, orb_e = 1.5, form_I = good['form_R'] )
+    valid, errors = config.validate( { 'good' : good, 'bad' : bad } )
+    assert list( valid ) == [ True, False ]
+    assert 'Eccentricity cannot be >= 1!' in errors['bad']
+    assert 'Radial separation must be half of in-track!' in errors['bad']
+
+def test_write_update_load(tmp_path):
+    path = str( tmp_path / 'config.txt' )
+    scenarios = { 'a' : { 'duration' : 100, 'orb_e' : 0.1 },
+                  'b' : { 'duration' : 200 } }
+    config.write( path, scenarios )
+    assert config.load( path ) == scenarios
+    assert config.load( path ) is config.load( path ) # Parse cache
+    config.update( path, { 'duration' : 300, 'timestep' : 5 },
+                   scenario = 'b' )
+    loaded = config.load( path )
+    assert loaded['a'] == scenarios['a']
+    assert loaded['b'] == { 'duration' : 300, 'timestep' : 5 }
+    with open( path ) as filein:
+        assert filein.readline().startswith('~:') # Comments kept
+    assert [ p.name for p in tmp_path.iterdir() ] == ['config.txt']
+
+def test_update_keeps_permissions(tmp_path):
+    path = tmp_path / 'config.txt'
+    path.write_text( 'I: duration 10\n' )
+    os.chmod( path, 0o644 )
+    config.update( str( path ), { 'duration' : 20 } )
+    assert os.stat( path ).st_mode & 0o777 == 0o644
+
+def test_load_directory(tmp_path):
+    ( tmp_path / 'one.txt' ).write_text( 'I: duration 10\n' )
+    ( tmp_path / 'two.txt' ).write_text( 'S: x\nI: duration 20\n' )
+    ( tmp_path / 'notes.md' ).write_text( 'I: duration 30\n' )
+    scenarios = config.load( str( tmp_path ) )
+    assert scenarios == { 'one' : { 'duration' : 10 },
+                          'two/x' : { 'duration' : 20 } }
+
+def test_load_without_cache(tmp_path):
+    path = str( tmp_path / 'config.txt' )
+    config.write( path, { 'a' : { 'duration' : 100 } } )
+    cached = config.load( path )
+    fresh = config.load( path, cache = False )
+    assert fresh == cached and fresh is not cached
+    assert config.load( path ) is cached
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from source import conjunction
+
+def test_threshold_guard():
+    t = np.arange( 5, dtype = float )
+    zero = np.zeros( (3, 5) )
+    with pytest.raises( ValueError ):
+        conjunction.screen( t, zero, zero, zero, 0.0 )
+    hits = conjunction.screen( t, zero, zero, zero, 1.0E-300 )
+    assert len( hits['i'] ) == 3 * 5 # Every pair, at every sample
+
+def test_matches_brute_force():
+    rng = np.random.default_rng( 1 )
+    t = np.arange( 300, dtype = float )
+    pos = np.cumsum( rng.normal( size = (3, 12, 300) ), axis = -1 )
+    hits = conjunction.screen( t, *pos, 2.0, window = 64 )
+    d = np.linalg.norm( pos[:, :, None, :] - pos[:, None, :, :], axis = 0 )
+    iu, ju = np.triu_indices( 12, 1 )
+    n, k = np.nonzero( d[iu, ju] < 2.0 )
+    expected = sorted( zip( k, iu[n], ju[n] ) )
+    assert list( zip( hits['t'].astype(int), hits['i'], hits['j'] ) ) \
+           == expected
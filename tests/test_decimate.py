@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from source import decimate
+
+t = np.linspace( 0, 40 * np.pi, 200001 )
+x, y, z = np.cos( t ), 2 * np.sin( 3 * t ), np.sin( t ) * np.exp( -t / 50 )
+
+def test_small_trajectories_are_kept():
+    assert np.array_equal( decimate.minmax( x[:100], y[:100], z[:100] ),
+                           np.arange( 100 ) )
+
+def test_minmax_keeps_the_extrema():
+    keep = decimate.minmax( x, y, z, buckets = 500 )
+    assert len( keep ) <= 8 * 500
+    assert np.all( np.diff( keep ) > 0 )
+    assert keep[0] == 0 and keep[-1] == len( t ) - 1
+    for c in ( x, y, z ):
+        assert np.argmin( c ) in keep and np.argmax( c ) in keep
+
+        # Every bucket keeps its own extrema, so the envelope survives.
+        b = -1 * ( -1 * len( t ) // 500 )
+        for k in range( 0, len( t ), 50 * b ):
+            part = c[ k : k + b ]
+            assert k + np.argmin( part ) in keep
+            assert k + np.argmax( part ) in keep
+
+def test_view_refines_the_box():
+    box = ( ( 0.9, 1.0 ), ( -2.0, 2.0 ), ( -1.0, 1.0 ) )
+    keep = decimate.view( x, y, z, *box, buckets = 500 )
+    inside = np.flatnonzero( ( x >= 0.9 ) & ( x <= 1.0 ) )
+    coarse = decimate.minmax( x, y, z, 500 )
+    assert np.sum( np.isin( keep, inside ) ) > \
+           3 * np.sum( np.isin( coarse, inside ) )
+    assert np.all( np.isin( decimate.minmax( x, y, z, 500 // 8 ), keep ) )
+    for c in ( x, y, z ):
+        assert np.argmin( c ) in keep and np.argmax( c ) in keep
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from source import deputy
+from source import events
+from source import formation
+
+def scenario(e, geometry):
+    chief = ( 6978.14, e, 60.0, 90.0, 90.0, 45.0 )
+    return chief, deputy.deputy( 20000, 10, *chief, *geometry )
+
+def test_plane_crossings_of_a_pure_cross_track_formation():
+    # Circular chief and deputy: the deputy crosses the chief orbit plane,
+    # where it is also closest to the chief, every half chief period.
+    chief, dep = scenario( 0.0, ( 0.0, 0.0, 0.0, 4.0, 90.0, 180.0 ) )
+    found = events.detect( 20000, 10, *chief, *dep )
+    half = np.pi * np.sqrt( chief[0]**3 / 398600.44 )
+    t = found['crosstrack']['t']
+    assert len( t ) == 7
+    assert np.max( np.abs( np.diff( t ) - half ) ) < 1.0E-2
+    assert np.max( np.abs( found['crosstrack']['rpz'] ) ) < 1.0E-5
+    assert np.max( np.abs( found['range_min']['t'] - t ) ) < 1.0E-2
+    assert np.max( np.abs( found['range_max']['t'] - t - half / 2 ) ) < 1.0E-2
+    assert len( found['radial']['t'] ) == 0
+
+def test_events_match_dense_sampling():
+    chief, dep = scenario( 0.01, ( 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 ) )
+    found = events.detect( 20000, 10, *chief, *dep )
+    t = np.arange( 0, 20000, 0.5 )
+    rpx, rpy, rpz = formation.states( t, 10, *chief, *dep )[:3]
+    rng = np.sqrt( rpx**2 + rpy**2 + rpz**2 )
+    for name, g in [ ( 'radial', rpx ), ( 'crosstrack', rpz ) ]:
+        k = np.flatnonzero( np.sign( g[1:] ) != np.sign( g[:-1] ) )
+        assert np.array_equal( np.searchsorted( t, found[name]['t'] ) - 1, k )
+    k = np.flatnonzero( ( rng[1:-1] < rng[:-2] ) & ( rng[1:-1] < rng[2:] ) )
+    assert np.max( np.abs( found['range_min']['t'] - t[k+1] ) ) <= 0.5
+    r = np.sqrt( found['range_min']['rpx']**2 + found['range_min']['rpy']**2
+                 + found['range_min']['rpz']**2 )
+    assert np.all( r <= rng[k+1] + 1.0E-9 )
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from source import deputy
+from source import formation
+from source import truth
+
+geometry = ( 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )
+
+def scenario(e):
+    chief = ( 6978.14, e, 60.0, 90.0, 90.0, 45.0 )
+    return chief, deputy.deputy( 7200, 10, *chief, *geometry )
+
+@pytest.mark.parametrize('e', [ 0.0, 0.01, 0.1 ])
+def test_states_match_propagate(e):
+    chief, dep = scenario( e )
+    loop = np.array( formation.propagate( 7200, 10, *chief, *dep ) )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    vec = np.array( formation.states( t, 10, *chief, *dep ) )
+    assert vec.shape == loop.shape
+    assert np.max( np.abs( vec - loop ) ) < 1.0E-9
+
+@pytest.mark.parametrize('e', [ 0.01, 0.1 ])
+def test_warm_propagate(e):
+    chief, dep = scenario( e )
+    cold = np.array( formation.propagate( 7200, 10, *chief, *dep ) )
+    warm = np.array( formation.propagate( 7200, 10, *chief, *dep,
+                                          warm = True ) )
+    assert np.max( np.abs( warm - cold ) ) < 1.0E-9
+
+def test_table_states():
+    chief, dep = scenario( 0.05 )
+    t = np.arange( 0, 86400, 10, dtype = float )
+    newton = np.array( formation.states( t, 10, *chief, *dep ) )
+    lookup = np.array( formation.states( t, 10, *chief, *dep, table = True ) )
+    assert np.max( np.abs( lookup - newton ) ) < 1.0E-9
+
+def test_windows():
+    chief, dep = scenario( 0.01 )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    full = np.array( formation.states( t, 10, *chief, *dep ) )
+    part = np.array( formation.states( t[200:300], 10, *chief, *dep ) )
+    assert np.array_equal( part, full[:, 200:300] )
+
+def test_broadcast_deputies():
+    chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+    phi = np.array( [ -90.0, 0.0, 45.0, 170.0 ] )
+    deps = np.broadcast_arrays( *deputy.deputy( 7200, 10, *chief, 2.0, 4.0,
+                                                3.0, 4.0, phi[:, None],
+                                                180.0 ) )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    many = np.array( formation.states( t, 10, *chief, *deps ) )
+    for n, p in enumerate( phi ):
+        single = deputy.deputy( 7200, 10, *chief, 2.0, 4.0, 3.0, 4.0,
+                                p, 180.0 )
+        assert np.allclose( [ x[n, 0] for x in deps ], single )
+        one = np.array( formation.states( t, 10, *chief, *single ) )
+        assert np.max( np.abs( many[:, n] - one ) ) < 1.0E-12
+
+def test_truth_agrees_at_small_separation():
+    chief, dep = scenario( 0.0 )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    linear = np.array( formation.states( t, 10, *chief, *dep ) )
+    exact = np.array( truth.states( t, 10, *chief, *dep ) )
+    rng = np.max( np.linalg.norm( exact[:3], axis = 0 ) )
+    err = np.max( np.linalg.norm( linear[:3] - exact[:3], axis = 0 ) )
+    assert err / rng < 1.0E-3
+
+def test_history_relative_split():
+    chief, dep = scenario( 0.01 )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    full = np.array( formation.states( t, 10, *chief, *dep ) )
+    EC, uC = formation.history( t, 10, *chief[:2], chief[3], chief[5] )
+    ED, uD = formation.history( t, 10, *dep[:2], dep[3], dep[5] )
+    split = np.array( formation.relative( 10, *chief, *dep, EC, uC, uD ) )
+    assert np.array_equal( split, full )
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import tracemalloc
+from source import instrument
+
+def test_spans_and_counters():
+    instrument.reset()
+    instrument.enable()
+    try:
+        with instrument.span('test'):
+            instrument.count('things', 3)
+    finally:
+        instrument.disable()
+    data = instrument.report()
+    assert data['spans']['test']['calls'] == 1
+    assert data['counters']['things'] == 3
+    with instrument.span('disabled'):
+        instrument.count('things', 1)
+    assert 'disabled' not in instrument.report()['spans']
+    instrument.reset()
+
+def test_memory_capture_ownership():
+    instrument.enable( memory = True )
+    assert tracemalloc.is_tracing()
+    instrument.disable()
+    assert not tracemalloc.is_tracing()
+    tracemalloc.start()
+    try:
+        instrument.enable( memory = True )
+        instrument.disable()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+        instrument.reset()
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from source import deputy
+from source import montecarlo
+
+chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+nominal = tuple( float(x) for x in deputy.deputy( 3600, 10, *chief,
+                 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 ) )
+
+def test_batch_size_guard():
+    with pytest.raises( ValueError ):
+        montecarlo.run( 3600, 10, chief, nominal, 10, { 'a' : 0.01 },
+                        size = 0, workers = 1 )
+
+def test_small_campaign():
+    result = montecarlo.run( 3600, 10, chief, nominal, 10, { 'a' : 0.01 },
+                             size = 64, workers = 1 )
+    assert result['samples'] == 10 and result['dropped'] == 0
+    assert result['range_min']['min'] <= result['range_max']['max']
+
+def test_hyperbolic_samples_dropped():
+    result = montecarlo.run( 3600, 10, chief, nominal, 200, { 'e' : 0.8 },
+                             size = 50, workers = 1 )
+    assert 0 < result['dropped'] < 200
+    assert np.isfinite( result['range_min']['mean'] )
+    everything = montecarlo.run( 3600, 10, chief, nominal, 20,
+                                 { 'e' : 1.0E6 }, size = 8, workers = 1 )
+    assert everything['dropped'] == 20
+    assert np.isnan( everything['violation_probability'] )
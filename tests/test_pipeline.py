@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from source import config
+from source import deputy
+from source import formation
+from source import pipeline
+
+inputs = { 'duration' : 7200, 'timestep' : 10,
+           'orb_a' : 6978.14, 'orb_e' : 0.01, 'orb_i' : 60.0,
+           'orb_w' : 90.0, 'orb_R' : 90.0, 'orb_M' : 45.0,
+           'form_R' : 2.0, 'form_I' : 4.0, 'form_O' : 3.0, 'form_C' : 4.0,
+           'form_phi' : 90.0, 'form_tht' : 180.0 }
+
+def reference(inps):
+    values = [ inps[k] for k in config.keys ]
+    D = deputy.deputy( *values )
+    t = np.arange( 0, inps['duration'], inps['timestep'], dtype = float )
+    return np.array( formation.states( t, inps['timestep'],
+                                       *values[2:8], *D ) )
+
+def test_stages():
+    p = pipeline.Pipeline()
+    assert p.update( inputs ) == set( pipeline.stages )
+    assert np.array_equal( p.eph, reference( inputs ) )
+    assert p.update( inputs ) == set()
+
+    # The cross-track amplitude only changes the deputy inclination and node.
+    changed = dict( inputs, form_C = 6.0 )
+    assert p.update( changed ) == { 'deputy', 'relative', 'plot' }
+    assert np.array_equal( p.eph, reference( changed ) )
+
+    # A forced re-plot does not recompute anything else.
+    p.invalidate('plot')
+    assert p.update( changed ) == { 'plot' }
+
+def test_duration_changes():
+    p = pipeline.Pipeline()
+    p.update( inputs )
+    for duration in [ 20000, 3000, 3005, 7200 ]:
+        inps = dict( inputs, duration = duration )
+        p.update( inps )
+        ref = reference( inps )
+        assert p.eph.shape == ref.shape
+        assert np.max( np.abs( p.eph - ref ) ) < 1.0E-12
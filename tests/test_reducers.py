@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from source import deputy
+from source import formation
+from source import reducers
+
+def test_merge_matches_numpy():
+    x = np.random.default_rng( 0 ).normal( 5.0, 2.0, 1000 )
+    parts = []
+    for a, b in [ (0, 10), (10, 500), (500, 500), (500, 1000) ]:
+        w, m = reducers.Welford(), reducers.MinMax()
+        w.update( x[a:b] )
+        m.update( x[a:b] )
+        parts.append( ( w, m ) )
+    w, m = reducers.Welford(), reducers.MinMax()
+    for pw, pm in parts:
+        w.merge( pw )
+        m.merge( pm )
+    assert w.count == 1000
+    assert np.isclose( w.mean, np.mean( x ) )
+    assert np.isclose( w.std, np.std( x ) )
+    assert ( m.min, m.max ) == ( np.min( x ), np.max( x ) )
+
+def test_reduce_matches_states():
+    chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+    dep = deputy.deputy( 7200, 10, *chief, 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )
+    sep, = reducers.reduce( 7200, 10, *chief, *dep, chunk = 97 )
+    result = sep.result()
+    t = np.arange( 0, 7200, 10, dtype = float )
+    rpx, rpy, rpz = formation.states( t, 10, *chief, *dep )[:3]
+    rng = np.sqrt( rpx**2 + rpy**2 + rpz**2 )
+    assert np.isclose( result['range_min'], np.min( rng ) )
+    assert np.isclose( result['range_mean'], np.mean( rng ) )
+    assert np.isclose( result['rc_min'], np.min( np.hypot( rpx, rpz ) ) )
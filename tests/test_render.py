@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import os
+import numpy as np
+from source import deputy
+from source import formation
+from source import render
+
+chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+geometry = ( 2.0, 4.0, 3.0, 4.0, 90.0, 180.0 )
+
+def test_ephemeris_and_figure():
+    eph = render.ephemeris( 7200, 10, chief, geometry )
+    D = deputy.deputy( 7200, 10, *chief, *geometry )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    assert np.array_equal( eph, formation.states( t, 10, *chief, *D ) )
+    fig, mark = render.figure( eph, buckets = 50 )
+    ax = fig.axes[0]
+    line = ax.get_lines()[0]
+    assert len( line.get_data_3d()[0] ) < eph.shape[1]
+    span = ax.get_xlim()[1]
+    assert ax.get_xlim() == ax.get_ylim() == ax.get_zlim() == ( -span, span )
+    assert span >= np.max( np.abs( eph[:3] ) )
+    assert np.array_equal( np.ravel( mark.get_data_3d() ),
+                           eph[[2,1,0],0] )
+
+def test_frames_parallel_match_serial(tmp_path):
+    kw = dict( count = 6, size = (2,2), dpi = 40 )
+    serial = render.frames( str( tmp_path / 's' ), 7200, 10, chief,
+                            geometry, workers = 1, **kw )
+    parallel = render.frames( str( tmp_path / 'p' ), 7200, 10, chief,
+                              geometry, workers = 2, **kw )
+    assert [ os.path.basename(p) for p in parallel ] == \
+           [ 'frame_{:06d}.png'.format( n ) for n in range( 6 ) ]
+    data = [ open( p, 'rb' ).read() for p in serial ]
+    assert data == [ open( p, 'rb' ).read() for p in parallel ]
+    assert len( set( data ) ) == 6 # The deputy moves in every frame
+
+def test_batch(tmp_path):
+    scenarios = [ { 'td' : 3600, 'ts' : 10, 'chief' : chief,
+                    'geometry' : geometry, 'name' : 'first' },
+                  { 'td' : 7200, 'ts' : 10, 'chief' : chief,
+                    'geometry' : geometry } ]
+    paths = render.batch( str( tmp_path ), scenarios, fmt = 'svg',
+                          size = (2,2), dpi = 40, workers = 2 )
+    assert [ os.path.basename(p) for p in paths ] == \
+           [ 'first.svg', 'scenario_000001.svg' ]
+    assert all( os.path.getsize( p ) > 0 for p in paths )
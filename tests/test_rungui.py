@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# The GUI methods are tested without a display, on an Agg canvas, by calling
+# them unbound on a namespace holding only the attributes they use.
+
+from types import SimpleNamespace
+import numpy as np
+import pytest
+pytest.importorskip('tkinter')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from source import rungui
+
+def gui():
+    fig = Figure()
+    canvas = FigureCanvasAgg( fig )
+    ax = fig.add_subplot( projection = '3d' )
+    g = SimpleNamespace( orbFig = fig, orbAxis = ax, orbPlot = canvas,
+        plot_build = lambda wait = False : None,
+        prj_update = lambda : None,
+        pipeline = SimpleNamespace( invalidate = lambda stage : None ),
+        live_pipeline = SimpleNamespace( invalidate = lambda stage : None ) )
+    g.anim_mark, = ax.plot( [], [], [], 'o', animated = True )
+    canvas.mpl_connect( 'draw_event',
+                        lambda event : rungui.RunGUI.anim_capture( g, event ) )
+    canvas.draw()
+    return g
+
+def test_clr_recaptures_background():
+    g = gui()
+    rungui.RunGUI.clr( g )
+    assert g.anim_mark.axes is g.orbAxis
+    assert g.anim_background is not None
+    assert len( g.plot_hist ) == 0
+
+def test_run_draws_once():
+    g = gui()
+    jobs = []
+    g.master = SimpleNamespace( after = lambda ms, f : jobs.append( f ) )
+    g.lod_lims, g.lod_job, g.lod_buckets = None, None, 2000
+    g.live_line, g.plot_triad, g.plot_span = None, [], 0.0
+    g.lod_refine = lambda draw = True : rungui.RunGUI.lod_refine( g, draw )
+    g.orbPlot.mpl_connect( 'draw_event',
+                           lambda event : rungui.RunGUI.lod_check( g, event ) )
+    t = np.linspace( 0, 20, 100000 )
+    x, y, z = np.cos( t ), 2 * np.sin( t ), 0.5 * np.sin( t )
+    line, = g.orbAxis.plot( x[:10], y[:10], z[:10] )
+    g.plot_hist = [ ( line, None ) ]
+    g.plot_full = { line : ( x, y, z ) }
+    rungui.RunGUI.plot_limits( g )
+    g.orbPlot.draw()
+    assert jobs == []
+    assert len( line.get_data_3d()[0] ) > 10
+
+def test_live_schedule_throttles():
+    jobs, cancelled = [], []
+    g = SimpleNamespace( live_job = None, live_delay = 25,
+                         live_update = lambda : None,
+                         var_live = SimpleNamespace( get = lambda : True ) )
+    g.master = SimpleNamespace(
+        after = lambda ms, f : jobs.append( f ) or len( jobs ),
+        after_cancel = cancelled.append )
+    for n in range( 10 ):
+        rungui.RunGUI.live_schedule( g ) # A drag, faster than the delay
+    assert len( jobs ) == 1 and cancelled == []
+    g.live_job = None # The pending update fired
+    rungui.RunGUI.live_schedule( g )
+    assert len( jobs ) == 2
+    g.var_live.get = lambda : False
+    rungui.RunGUI.live_schedule( g )
+    assert cancelled == [ 2 ] and g.live_job is None
+
+class Var():
+    def __init__(self):
+        self.value = 0
+    def get(self):
+        return self.value
+    def set(self, value):
+        self.value = value
+
+class Label():
+    def __init__(self):
+        self.text = ''
+    def configure(self, text):
+        self.text = text
+
+names = ['td', 'ts', 'aC', 'eC', 'iC', 'wC', 'RC', 'MC',
+         'fR', 'fI', 'fO', 'fC', 'fPhi', 'fTht']
+
+inputs = { 'duration' : 3600, 'timestep' : 60,
+           'orb_a' : 6978.14, 'orb_e' : 0.01, 'orb_i' : 60.0,
+           'orb_w' : 90.0, 'orb_R' : 90.0, 'orb_M' : 45.0,
+           'form_R' : 2.0, 'form_I' : 4.0, 'form_O' : 3.0, 'form_C' : 4.0,
+           'form_phi' : 90.0, 'form_tht' : 180.0 }
+
+def form():
+    g = SimpleNamespace( error_msgprint = '',
+                         cfg_scenario = rungui.config.default )
+    for name in names:
+        setattr( g, 'var_' + name, Var() )
+        setattr( g, 'errtx_' + name, Label() )
+    g.cfg_vars = lambda : rungui.RunGUI.cfg_vars( g )
+    g.cfg_check = lambda inps : rungui.RunGUI.cfg_check( g, inps )
+    return g
+
+def test_cfg_saves_the_loaded_scenario(monkeypatch):
+    scenarios = { 'named' : inputs, 'other' : dict( inputs, orb_e = 0.1 ) }
+    saved = []
+    monkeypatch.setattr( rungui.config, 'load', lambda path : scenarios )
+    monkeypatch.setattr( rungui.config, 'update', lambda path, inps,
+                         scenario = None : saved.append( ( scenario, inps ) ) )
+    monkeypatch.setattr( rungui.tk.messagebox, 'showerror',
+                         lambda *args : pytest.fail( args[1] ) )
+    g = form()
+    rungui.RunGUI.cfg_R( g )
+    assert g.cfg_scenario == 'named' and g.var_eC.get() == 0.01
+    g.var_fC.set( 5.0 )
+    rungui.RunGUI.cfg_W( g )
+    assert saved == [ ( 'named', dict( inputs, form_C = 5.0 ) ) ]
+
+def test_cfg_checks_use_the_config_rules(monkeypatch):
+    shown, saved = [], []
+    monkeypatch.setattr( rungui.config, 'load',
+                         lambda path : { 'default' : dict( inputs,
+                                                           orb_e = 1.5 ) } )
+    monkeypatch.setattr( rungui.config, 'update', lambda *args, **kw :
+                         saved.append( args ) )
+    monkeypatch.setattr( rungui.tk.messagebox, 'showerror',
+                         lambda title, text : shown.append( text ) )
+    g = form()
+    rungui.RunGUI.cfg_R( g )
+    assert 'Eccentricity cannot be >= 1!' in shown[0]
+    assert g.errtx_eC.text == '!' and g.errtx_aC.text == ''
+    g.var_eC.set( 0.01 )
+    g.var_fR.set( 3.0 )
+    rungui.RunGUI.cfg_W( g )
+    assert 'Radial separation must be half of in-track!' in shown[1]
+    assert g.var_fR.get() == 2.0 and saved == []
+    rungui.RunGUI.cfg_W( g )
+    assert len( shown ) == 2 and len( saved ) == 1
+    assert g.errtx_eC.text == ''
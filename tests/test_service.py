@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import socket
+import time
+import threading
+import numpy as np
+import pytest
+from source import config
+from source import deputy
+from source import formation
+from source import service
+
+inputs = { 'duration' : 3600, 'timestep' : 10,
+           'orb_a' : 6978.14, 'orb_e' : 0.01, 'orb_i' : 60.0,
+           'orb_w' : 90.0, 'orb_R' : 90.0, 'orb_M' : 45.0,
+           'form_R' : 2.0, 'form_I' : 4.0, 'form_O' : 3.0, 'form_C' : 4.0,
+           'form_phi' : 90.0, 'form_tht' : 180.0 }
+
+@pytest.fixture(scope = 'module')
+def address(tmp_path_factory):
+    path = str( tmp_path_factory.mktemp('service') / 'qluster.sock' )
+    server = service.Server( path, workers = 1 )
+    threading.Thread( target = server.run, daemon = True ).start()
+    for n in range( 500 ):
+        try:
+            service.Client( path ).connect().close()
+            break
+        except OSError:
+            time.sleep( 0.01 )
+    return path
+
+@pytest.fixture
+def client(address):
+    client = service.Client( address )
+    client.connect().settimeout( 10 )
+    yield client
+    client.close()
+
+def raw(client, text):
+    '''Sends a raw request header, and returns the decoded reply header.'''
+    client._sock.sendall( service._prefix.pack( len(text) ) + text )
+    size, = service._prefix.unpack( client._read( service._prefix.size ) )
+    header = json.loads( client._read( size ) )
+    client._read( service._size( header ) )
+    return header
+
+def test_matches_states(client):
+    scenarios = [ dict( inputs, form_phi = phi, duration = 3600 - 100 * n )
+                  for n, phi in enumerate( range( -180, 180, 30 ) ) ]
+    for s, ( elements, eph ) in zip( scenarios, client.many( scenarios ) ):
+        values = [ s[k] for k in config.keys ]
+        D = deputy.deputy( *values )
+        t = np.arange( 0, s['duration'], s['timestep'], dtype = float )
+        ref = np.array( formation.states( t, s['timestep'],
+                                          *values[2:8], *D ) )
+        assert eph.shape == ref.shape
+        assert np.max( np.abs( eph - ref ) ) <= 1.0E-12
+        assert np.allclose( elements, D )
+
+def test_invalid_inputs(client):
+    with pytest.raises( ValueError, match = 'Eccentricity' ):
+        client.propagate( dict( inputs, orb_e = 2.0 ) )
+    with pytest.raises( ValueError, match = 'Missing' ):
+        client.propagate( { 'duration' : 100 } )
+
+@pytest.mark.parametrize('text', [ b'[1]', b'not json', b'{"id": 7}',
+                                   b'{"id": 8, "inputs": 3}' ])
+def test_malformed_request(client, text):
+    header = raw( client, text )
+    assert 'error' in header
+    assert client.propagate( inputs )[1].shape == (6, 360)
+
+def test_failing_batch(client, monkeypatch):
+    def fail(*args):
+        raise MemoryError()
+    monkeypatch.setattr( service, '_batch', fail )
+    with pytest.raises( ValueError, match = 'MemoryError' ):
+        client.propagate( inputs )
+    monkeypatch.undo()
+    assert client.propagate( inputs )[1].shape == (6, 360)
+
+def test_refuses_other_files(tmp_path):
+    path = tmp_path / 'qluster.sock'
+    path.write_text('not a socket')
+    with pytest.raises( FileExistsError ):
+        service.Server( str( path ), workers = 1 ).run()
+    assert path.read_text() == 'not a socket'
+
+def test_refuses_live_sockets(address):
+    with pytest.raises( FileExistsError ):
+        service.Server( address, workers = 1 ).run()
+    service.Client( address ).connect().close() # Still served
+
+def test_replaces_stale_sockets(tmp_path):
+    path = str( tmp_path / 'qluster.sock' )
+    stale = socket.socket( socket.AF_UNIX )
+    stale.bind( path )
+    stale.close() # Left behind, with nothing listening
+    service._unlink_stale( path )
+    assert not os.path.exists( path )
+
+@pytest.mark.parametrize('address', [ '0.0.0.0:8765', ':8765',
+                                      '192.168.1.10:8765',
+                                      'example.com:8765' ])
+def test_refuses_non_loopback_hosts(address):
+    with pytest.raises( ValueError ):
+        service.Server( address, workers = 1 ).run()
+    with pytest.raises( ValueError ):
+        service.Client( address ).connect()
+
+def test_loopback_hosts():
+    assert service._tcp('localhost:8765') == ( 'localhost', 8765 )
+    assert service._tcp('127.0.0.1:8765') == ( '127.0.0.1', 8765 )
+    assert service._tcp('[::1]:8765') == ( '::1', 8765 )
+    assert service._tcp('/tmp/qluster.sock') is None
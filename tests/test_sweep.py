@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from source import deputy
+from source import formation
+from source import sweep
+
+def test_grid_matches_single_scenarios():
+    chief = ( 6978.14, 0.01, 60.0, 90.0, 90.0, 45.0 )
+    fPhi = np.array( [ -90.0, 0.0, 90.0 ] )
+    fTht = np.array( [ 0.0, 90.0 ] )
+    result = sweep.grid( 7200, 10, *chief, 2.0, 3.0, 4.0, fPhi, fTht,
+                         block = 4, chunk = 100 )
+    assert result['rc_min'].shape == ( 3, 2 )
+    t = np.arange( 0, 7200, 10, dtype = float )
+    for n, phi in enumerate( fPhi ):
+        for m, tht in enumerate( fTht ):
+            dep = deputy.deputy( 7200, 10, *chief, 2.0, 4.0, 3.0, 4.0,
+                                 phi, tht )
+            rpx, rpy, rpz = formation.states( t, 10, *chief, *dep )[:3]
+            assert np.isclose( result['rc_min'][n, m],
+                               np.min( np.hypot( rpx, rpz ) ) )
+            assert np.isclose( result['range_min'][n, m],
+                               np.min( np.sqrt( rpx**2 + rpy**2 + rpz**2 ) ) )
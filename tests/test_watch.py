@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+from source import config
+from source import watch
+
+inputs = { 'duration' : 3600, 'timestep' : 60,
+           'orb_a' : 6978.14, 'orb_e' : 0.01, 'orb_i' : 60.0,
+           'orb_w' : 90.0, 'orb_R' : 90.0, 'orb_M' : 45.0,
+           'form_R' : 2.0, 'form_I' : 4.0, 'form_O' : 3.0, 'form_C' : 4.0,
+           'form_phi' : 90.0, 'form_tht' : 180.0 }
+
+def text(inps):
+    return ''.join( '~: comment\nI: ' + k + ' ' + str( inps[k] ) + '\n'
+                    for k in config.keys )
+
+def test_changes(tmp_path):
+    path = tmp_path / 'config.txt'
+    path.write_text( text( inputs ) )
+    watcher = watch.Watcher( str( path ) )
+    assert watcher.check() == set( config.keys )
+    assert watcher.check() == set()
+    path.write_text( text( inputs ).replace( 'comment', 'edited' ) )
+    assert watcher.check() == set() # Only comments changed
+    path.write_text( text( dict( inputs, form_C = 5.0 ) ) )
+    assert watcher.check() == { 'form_C' }
+
+def test_invalid_edits_are_ignored(tmp_path):
+    path = tmp_path / 'config.txt'
+    path.write_text( text( inputs ) )
+    watcher = watch.Watcher( str( path ) )
+    watcher.check()
+    for bad in [ { 'timestep' : 0 }, { 'orb_e' : 1.5 },
+                 { 'duration' : 'abc' } ]:
+        path.write_text( text( dict( inputs, **bad ) ) )
+        assert watcher.check() == set()
+        assert watcher.inputs == inputs
+    path.write_text( text( dict( inputs, timestep = 30 ) ) )
+    assert watcher.check() == { 'timestep' }
+
+def test_run_survives_callback_errors(tmp_path):
+    path = tmp_path / 'config.txt'
+    path.write_text( text( inputs ) )
+    calls = []
+    def callback(inps, changed, elements, eph):
+        calls.append( eph.shape )
+        path.write_text( text( dict( inputs, duration = 7200 ) ) )
+        raise RuntimeError('callback failed')
+    watch.run( str( path ), interval = 0, callback = callback, cycles = 3 )
+    assert calls == [ ( 6, 60 ), ( 6, 120 ) ]